@@ -0,0 +1,96 @@
+import itertools
+import os
+import random
+import sys
+import time
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_tree import AVLTree
+from src.bst import BinarySearchTree
+from src.cache import CachedTree, FilterCache
+from src.dataset import generate_products
+from src.filters import filter_products
+
+
+def zipf_keys(keys, count, s=1.1, seed=0):
+    """
+    `count` chaves sorteadas com popularidade Zipf: a i-ésima mais
+    popular sai com peso 1 / i^s (ordem de popularidade embaralhada).
+    """
+    rng = random.Random(seed)
+    ranked = list(keys)
+    rng.shuffle(ranked)
+    weights = itertools.accumulate(1 / (i ** s) for i in range(1, len(ranked) + 1))
+    return rng.choices(ranked, cum_weights=list(weights), k=count)
+
+
+def run(tree, probes):
+    start = time.perf_counter()
+    for key in probes:
+        tree.search(key)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lookups = 200_000
+
+    products = generate_products(n)
+    pairs = [(p["id"], p) for p in products]
+    probes = zipf_keys([p["id"] for p in products], lookups)
+
+    bst = BinarySearchTree()
+    for key, product in pairs:
+        bst.insert(key, product)
+    avl = AVLTree.from_iterable(pairs)
+
+    print(f"📦 {n} produtos, {lookups} buscas Zipf (s=1.1)\n")
+    print(f"{'árvore':6} {'cache':>8} {'µs/busca':>9} {'acertos':>8} {'descartes':>10} {'speedup':>8}")
+
+    for name, tree in (("BST", bst), ("AVL", avl)):
+        baseline = run(tree, probes)
+        print(f"{name:6} {'-':>8} {baseline / lookups * 1e6:9.2f} {'-':>8} {'-':>10} {'1.00x':>8}")
+
+        for capacity in (1_000, 10_000, 50_000):
+            cached = CachedTree(tree, capacity=capacity)
+            elapsed = run(cached, probes)
+            stats = cached.stats()
+            print(
+                f"{name:6} {capacity:8d} {elapsed / lookups * 1e6:9.2f} "
+                f"{stats['hit_rate']:7.1%} {stats['evictions']:10d} {baseline / elapsed:7.2f}x"
+            )
+
+    # painel: as mesmas consultas repetidas, com uma escrita a cada 50
+    queries = [
+        {"category": "Eletrônicos", "max_price": 500},
+        {"category": "Livros", "min_rating": 4.5},
+        {"max_price": 100, "min_rating": 4.0},
+        {"category": "Roupas"},
+    ]
+    rounds = 200
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        filter_products(avl.root, **queries[i % len(queries)])
+    plain = time.perf_counter() - start
+
+    cache = FilterCache(avl)
+    start = time.perf_counter()
+    for i in range(rounds):
+        if i % 50 == 49:
+            avl.insert(pairs[i][0], pairs[i][1])
+        cache.filter(**queries[i % len(queries)])
+    cached = time.perf_counter() - start
+
+    stats = cache.stats()
+    print(f"\n📊 filter_products x{rounds} (4 consultas, 1 escrita a cada 50)")
+    print(f"  sem cache: {plain / rounds * 1e3:8.2f}ms/consulta")
+    print(f"  FilterCache: {cached / rounds * 1e3:6.2f}ms/consulta "
+          f"({stats['hit_rate']:.0%} acertos, {stats['invalidations']} invalidações) "
+          f"{plain / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
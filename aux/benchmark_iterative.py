@@ -0,0 +1,178 @@
+import os
+import sys
+import random
+import time
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_node import AVLNode
+from src.avl_tree import AVLTree
+from src.bst import BinarySearchTree
+from src.node import Node
+
+
+class RecursiveBST(BinarySearchTree):
+    """
+    Implementação recursiva antiga da BST, mantida só como referência
+    para medir o ganho das versões iterativas.
+    """
+
+    def insert(self, key, data):
+        self.root = self._insert_recursive(self.root, key, data)
+
+    def _insert_recursive(self, node, key, data):
+        if node is None:
+            return Node(key, data)
+        if key < node.key:
+            node.left = self._insert_recursive(node.left, key, data)
+        elif key > node.key:
+            node.right = self._insert_recursive(node.right, key, data)
+        return node
+
+    def search(self, key):
+        return self._search_recursive(self.root, key)
+
+    def _search_recursive(self, node, key):
+        if node is None or node.key == key:
+            return node
+        if key < node.key:
+            return self._search_recursive(node.left, key)
+        return self._search_recursive(node.right, key)
+
+    def delete(self, key):
+        self.root = self._delete_recursive(self.root, key)
+
+    def _delete_recursive(self, node, key):
+        if node is None:
+            return node
+        if key < node.key:
+            node.left = self._delete_recursive(node.left, key)
+        elif key > node.key:
+            node.right = self._delete_recursive(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            sucessor = self._min_value_node(node.right)
+            node.key = sucessor.key
+            node.data = sucessor.data
+            node.right = self._delete_recursive(node.right, sucessor.key)
+        return node
+
+
+class RecursiveAVLTree(AVLTree):
+    """
+    Implementação recursiva antiga da AVL (uma chamada por nível),
+    mantida só como referência para o benchmark.
+    """
+
+    def insert(self, key, data):
+        self.root = self._insert_recursive(self.root, key, data)
+
+    def _insert_recursive(self, node, key, data):
+        if node is None:
+            return AVLNode(key, data)
+        if key < node.key:
+            node.left = self._insert_recursive(node.left, key, data)
+        elif key > node.key:
+            node.right = self._insert_recursive(node.right, key, data)
+        else:
+            node.data = data
+            return node
+        node.update_height()
+        return self._rebalance(node)
+
+    def search(self, key):
+        return self._search_recursive(self.root, key)
+
+    def _search_recursive(self, node, key):
+        if node is None or node.key == key:
+            return node
+        if key < node.key:
+            return self._search_recursive(node.left, key)
+        return self._search_recursive(node.right, key)
+
+    def delete(self, key):
+        self.root = self._delete_recursive(self.root, key)
+
+    def _delete_recursive(self, node, key):
+        if node is None:
+            return node
+        if key < node.key:
+            node.left = self._delete_recursive(node.left, key)
+        elif key > node.key:
+            node.right = self._delete_recursive(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            successor = self._min_value_node(node.right)
+            node.key = successor.key
+            node.data = successor.data
+            node.right = self._delete_recursive(node.right, successor.key)
+        node.update_height()
+        return self._rebalance(node)
+
+
+def run(tree_class, keys, search_keys, delete_keys):
+    tree = tree_class()
+
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key, key)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in search_keys:
+        tree.search(key)
+    search_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in delete_keys:
+        tree.delete(key)
+    delete_time = time.perf_counter() - start
+
+    return insert_time, search_time, delete_time
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+
+    random_keys = rng.sample(range(n * 10), n)
+    ordered_keys = list(range(n))
+
+    scenarios = [
+        ("BST  aleatória", RecursiveBST, BinarySearchTree, random_keys),
+        ("AVL  aleatória", RecursiveAVLTree, AVLTree, random_keys),
+        ("AVL  ordenada ", RecursiveAVLTree, AVLTree, ordered_keys),
+    ]
+
+    print(f"📦 n = {n} chaves | busca e remoção de {n // 10} chaves\n")
+    print(f"{'cenário':16} {'op':8} {'recursiva':>11} {'iterativa':>11} {'ganho':>7}")
+
+    for label, old_class, new_class, keys in scenarios:
+        search_keys = rng.sample(keys, n // 10)
+        delete_keys = rng.sample(keys, n // 10)
+
+        old = run(old_class, keys, search_keys, delete_keys)
+        new = run(new_class, keys, search_keys, delete_keys)
+
+        for op, old_time, new_time in zip(("insert", "search", "delete"), old, new):
+            print(f"{label:16} {op:8} {old_time:10.3f}s {new_time:10.3f}s {old_time / new_time:6.2f}x")
+
+    # A BST com chaves ordenadas vira lista encadeada: a versão recursiva
+    # estoura o limite de recursão, a iterativa só fica lenta (O(n) por operação)
+    m = min(n, 5000)
+    bst = BinarySearchTree()
+    start = time.perf_counter()
+    for key in range(m):
+        bst.insert(key, key)
+    print(f"\nBST ordenada (n={m}): iterativa em {time.perf_counter() - start:.3f}s, sem RecursionError")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import random
+import time
+import tracemalloc
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_tree import AVLTree
+from src.compact_avl import CompactAVLTree
+
+
+def build(tree_class, keys, payload):
+    tree = tree_class()
+    for key in keys:
+        tree.insert(key, payload)
+    return tree
+
+
+def measure(tree_class, keys, search_keys):
+    """
+    Mede memória (tracemalloc) e tempo de inserção/busca de uma árvore.
+    Todos os nós apontam para o mesmo objeto de dados, então a memória
+    medida é só a da estrutura. Os tempos são medidos numa segunda
+    construção, sem o tracemalloc ligado.
+    """
+    payload = {"name": "produto"}
+
+    tracemalloc.start()
+    tree = build(tree_class, keys, payload)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+
+    start = time.perf_counter()
+    tree = build(tree_class, keys, payload)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in search_keys:
+        tree.search(key)
+    search_time = time.perf_counter() - start
+
+    return memory, insert_time, search_time
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+
+    keys = rng.sample(range(n * 10), n)
+    search_keys = rng.sample(keys, min(n, 100_000))
+
+    print(f"📦 n = {n} chaves | {len(search_keys)} buscas\n")
+    print(f"{'engine':16} {'memória':>10} {'bytes/nó':>9} {'insert':>9} {'search':>9}")
+
+    results = {}
+    for name, tree_class in (("AVLTree", AVLTree), ("CompactAVLTree", CompactAVLTree)):
+        memory, insert_time, search_time = measure(tree_class, keys, search_keys)
+        results[name] = memory
+        print(f"{name:16} {memory / 2**20:8.1f}MB {memory / n:9.1f} {insert_time:8.2f}s {search_time:8.2f}s")
+
+    print(f"\n📉 CompactAVLTree usa {results['AVLTree'] / results['CompactAVLTree']:.1f}x menos memória")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+import time
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_tree import AVLTree
+from src.dataset import generate_products
+from src.metrics import MeteredTree, Metrics
+
+
+def time_searches(tree, probes):
+    search = tree.search
+    start = time.perf_counter()
+    for key in probes:
+        search(key)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    products = generate_products(n)
+    tree = AVLTree.from_iterable((p["id"], p) for p in products)
+
+    rng = random.Random(0)
+    probes = [rng.choice(products)["id"] for _ in range(200_000)]
+
+    print(f"📦 {n} produtos, {len(probes)} buscas\n")
+    print(f"{'modo':20} {'tempo (s)':>10} {'custo extra':>12}")
+
+    base = min(time_searches(tree, probes) for _ in range(3))
+    print(f"{'sem métricas':20} {base:10.3f} {'-':>12}")
+
+    for sample_every in (1, 16, 128):
+        metered = MeteredTree(tree, Metrics(sample_every))
+        elapsed = min(time_searches(metered, probes) for _ in range(3))
+        print(f"{f'sample_every={sample_every}':20} {elapsed:10.3f} {elapsed / base - 1:+11.0%}")
+
+    print("\n📈 Percentis (sample_every=1):")
+    stats = MeteredTree(tree, Metrics(1))
+    time_searches(stats, probes)
+    snapshot = stats.metrics.to_dict()["search"]
+    for name in ("p50", "p95", "p99", "p99.9", "max"):
+        print(f"  {name:6} {snapshot[name] * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import os
+import sys
+import time
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_tree import AVLTree
+from src.dataset import generate_products
+from src.filters import filter_products
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cores = os.cpu_count() or 1
+
+    tree = AVLTree.from_iterable((p["id"], p) for p in generate_products(n))
+    query = {"category": "Eletrônicos", "max_price": 500, "min_rating": 4.0}
+
+    print(f"📦 {n} produtos, {cores} núcleo(s)\n")
+    print(f"{'workers':>8} {'tempo':>8} {'resultados':>11} {'speedup':>8}")
+
+    start = time.perf_counter()
+    serial = filter_products(tree.root, **query)
+    baseline = time.perf_counter() - start
+    print(f"{'serial':>8} {baseline:7.2f}s {len(serial):11d} {'1.00x':>8}")
+
+    for workers in sorted({2, 4, cores} - {1}):
+        start = time.perf_counter()
+        found = filter_products(tree.root, workers=workers, **query)
+        elapsed = time.perf_counter() - start
+
+        assert found == serial
+        print(f"{workers:8d} {elapsed:7.2f}s {len(found):11d} {baseline / elapsed:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import os
+import random
+import sys
+import threading
+import time
+from itertools import islice
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_tree import AVLTree
+from src.persistent_avl import PersistentAVLTree
+
+
+class LockedAVLTree:
+    """
+    Base de comparação: AVLTree mutável com uma trava para tudo (leitores
+    também travam, senão veriam rotações pela metade).
+    """
+
+    def __init__(self):
+        self.tree = AVLTree()
+        self.lock = threading.Lock()
+
+    def insert(self, key, data):
+        with self.lock:
+            self.tree.insert(key, data)
+
+    def delete(self, key):
+        with self.lock:
+            self.tree.delete(key)
+
+    def search(self, key):
+        with self.lock:
+            return self.tree.search(key)
+
+    def scan(self, lo, count):
+        with self.lock:
+            return list(islice(self.tree.items(lo=lo), count))
+
+
+class PersistentStore(PersistentAVLTree):
+
+    def scan(self, lo, count):
+        # sem trava: a versão da árvore fica fixa durante a varredura
+        return list(islice(self.items(lo=lo), count))
+
+
+def run(store, n, readers, scanners, duration):
+    stop = threading.Event()
+    counts = {"reads": 0, "scans": 0, "writes": 0}
+    lock = threading.Lock()
+
+    def add(name, value):
+        with lock:
+            counts[name] += value
+
+    def reader(seed):
+        rng = random.Random(seed)
+        done = 0
+        while not stop.is_set():
+            store.search(rng.randrange(n))
+            done += 1
+        add("reads", done)
+
+    def scanner(seed):
+        rng = random.Random(seed)
+        done = 0
+        while not stop.is_set():
+            store.scan(rng.randrange(n), 1000)
+            done += 1
+        add("scans", done)
+
+    def writer():
+        rng = random.Random(0)
+        done = 0
+        while not stop.is_set():
+            key = rng.randrange(n)
+            store.delete(key)
+            store.insert(key, {"id": key, "price": rng.random()})
+            done += 2
+        add("writes", done)
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=scanner, args=(100 + i,)) for i in range(scanners)]
+
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {name: value / duration for name, value in counts.items()}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    duration = 2.0
+
+    print(f"📦 {n} chaves, 1 escritor, {duration:.0f}s por cenário\n")
+    print(f"{'cenário':24} {'árvore':12} {'leituras/s':>11} {'scans/s':>8} {'escritas/s':>11}")
+
+    for readers, scanners in ((4, 0), (4, 1)):
+        label = f"{readers} leitores + {scanners} scan"
+        for name, store_class in (("AVL + trava", LockedAVLTree), ("persistente", PersistentStore)):
+            store = store_class()
+            for key in range(n):
+                store.insert(key, {"id": key, "price": 1.0})
+
+            rates = run(store, n, readers, scanners, duration)
+            print(
+                f"{label:24} {name:12} {rates['reads']:11.0f} "
+                f"{rates['scans']:8.0f} {rates['writes']:11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_tree import AVLTree
+from src.dataset import generate_products
+from src.filters import filter_products
+from src.sharding import ShardedProductStore
+
+
+QUERIES = [
+    {"category": "Eletrônicos", "max_price": 50},
+    {"category": "Livros", "min_rating": 4.9},
+    {"max_price": 10, "min_rating": 4.5},
+]
+
+
+def timed(run, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cores = os.cpu_count() or 1
+
+    products = generate_products(n)
+    pairs = [(p["id"], p) for p in products]
+
+    print(f"📦 {n} produtos, {cores} núcleo(s), {len(QUERIES)} filtros por rodada\n")
+    print(f"{'configuração':22} {'carga':>7} {'filtros':>9} {'consultas/s':>12} {'speedup':>8}")
+
+    tree = AVLTree.from_iterable(pairs)
+    serial = timed(lambda: [filter_products(tree.root, **query) for query in QUERIES])
+    print(f"{'1 processo (serial)':22} {'-':>7} {serial:8.2f}s {len(QUERIES) / serial:12.2f} {'1.00x':>8}")
+    del tree
+
+    for shards in sorted({1, 2, 4, cores}):
+        start = time.perf_counter()
+        with ShardedProductStore.from_products(pairs, shards=shards) as store:
+            load = time.perf_counter() - start
+            elapsed = timed(lambda: [store.filter_products(**query) for query in QUERIES])
+
+        label = f"{shards} shard(s)"
+        print(
+            f"{label:22} {load:6.1f}s {elapsed:8.2f}s "
+            f"{len(QUERIES) / elapsed:12.2f} {serial / elapsed:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
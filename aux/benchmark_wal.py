@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório raiz ao path para encontrar o pacote src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.avl_tree import AVLTree
+from src.dataset import generate_products
+from src.wal import DurableStore
+
+
+def run(store, products):
+    start = time.perf_counter()
+    for product in products:
+        store.insert(product["id"], product)
+    for product in products[::10]:
+        store.delete(product["id"])
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    products = generate_products(n)
+    ops = n + len(products[::10])
+
+    print(f"📦 {n} inserts + {len(products[::10])} deletes\n")
+    print(f"{'modo':28} {'tempo':>8} {'ops/s':>10} {'vs memória':>11}")
+
+    baseline = run(AVLTree(), products)
+    print(f"{'só memória':28} {baseline:7.2f}s {ops / baseline:10.0f} {'1.00x':>11}")
+
+    for sync_every in (1, 64, 1024):
+        with tempfile.TemporaryDirectory() as directory:
+            with DurableStore(directory, sync_every=sync_every, compact_every=0) as store:
+                elapsed = run(store, products)
+                store.flush()
+
+        label = f"WAL, fsync a cada {sync_every}"
+        print(f"{label:28} {elapsed:7.2f}s {ops / elapsed:10.0f} {elapsed / baseline:10.2f}x")
+
+    # recuperação: snapshot + replay de um log de 10% do catálogo
+    with tempfile.TemporaryDirectory() as directory:
+        with DurableStore(directory, compact_every=0) as store:
+            run(store, products)
+            store.checkpoint()
+            for product in products[: n // 10]:
+                store.insert(product["id"], product)
+
+        start = time.perf_counter()
+        DurableStore(directory).close()
+        print(f"\n♻️  Recuperação (snapshot + {n // 10} registros): {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+async def client(host, port, max_id, duration, depth, write_ratio, seed, latencies):
+    """
+    Uma conexão com até `depth` pedidos em voo; anota a latência de cada um.
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    slots = asyncio.Semaphore(depth)
+    sent = {}
+    deadline = time.perf_counter() + duration
+
+    async def receive():
+        while sent:
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent.pop(response["id"]))
+            slots.release()
+
+    receiver = None
+    request_id = 0
+    while time.perf_counter() < deadline:
+        await slots.acquire()
+        key = rng.randint(1, max_id)
+        if rng.random() < write_ratio:
+            request = {"op": "insert", "key": key, "data": {"id": key, "price": rng.uniform(5, 3000)}}
+        else:
+            request = {"op": "search", "key": key}
+
+        request_id += 1
+        request["id"] = request_id
+        sent[request_id] = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+
+        if receiver is None or receiver.done():
+            receiver = asyncio.create_task(receive())
+
+    if receiver is not None:
+        await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+def percentile(values, p):
+    # sem amostras (ex.: todos os pedidos falharam) vale 0.0, como no LatencyHistogram
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run_load(host, port, max_id, connections, depth, duration, write_ratio):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, max_id, duration, depth, write_ratio, seed, latencies)
+        for seed in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99)
+
+
+def start_server(n, window):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.server", str(n), "0", window],
+        cwd=ROOT, stdout=subprocess.PIPE, text=True,
+    )
+    _, host, port = process.stdout.readline().split()
+    return process, host, int(port)
+
+
+def main():
+    # python aux/load_generator.py [produtos] [conexões] [pedidos em voo por conexão]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    connections = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    depth = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    duration = 5.0
+    write_ratio = 0.05
+
+    print(f"📦 {n} produtos, {connections} conexões x {depth} pedidos em voo, "
+          f"{write_ratio:.0%} escritas, {duration:.0f}s\n")
+    print(f"{'agrupamento':18} {'QPS':>9} {'p50':>9} {'p99':>9}")
+
+    for label, window in (("desligado", "off"), ("janela 0ms", "0"), ("janela 0.5ms", "0.5")):
+        process, host, port = start_server(n, window)
+        try:
+            qps, p50, p99 = asyncio.run(
+                # IDs do dataset ficam em [1, 10n], como em generate_products
+                run_load(host, port, n * 10, connections, depth, duration, write_ratio)
+            )
+        finally:
+            process.terminate()
+            process.wait()
+
+        print(f"{label:18} {qps:9.0f} {p50 * 1e3:7.2f}ms {p99 * 1e3:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+# Suíte de benchmarks reprodutível das árvores de produtos.
+#
+#     python -m benchmarks --sizes 1000,100000 --output results.json
+#     python -m benchmarks --baseline results.json
+#
+# Dados gerados a partir de uma semente, aquecimento + repetições, saída
+# em JSON e comparação com uma referência para apontar regressões.
+
+from benchmarks.engines import ENGINES, register_engine
+from benchmarks.runner import OPERATIONS, compare_to_baseline, run_suite
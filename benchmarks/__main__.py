@@ -0,0 +1,103 @@
+import argparse
+import json
+import sys
+
+from benchmarks.datasets import DISTRIBUTIONS
+from benchmarks.engines import ENGINES
+from benchmarks.runner import OPERATIONS, compare_to_baseline, run_suite
+
+
+def _list(text):
+    return [item for item in text.split(",") if item]
+
+
+def _sizes(text):
+    # aceita 1000, 10k, 1m
+    sizes = []
+    for item in _list(text):
+        item = item.lower()
+        factor = {"k": 1_000, "m": 1_000_000}.get(item[-1], 1)
+        sizes.append(int(float(item.rstrip("km")) * factor))
+    return sizes
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks das árvores de produtos")
+    parser.add_argument("--sizes", type=_sizes, default=[1_000, 10_000, 100_000],
+                        help="tamanhos do dataset, ex.: 1k,100k,10m")
+    parser.add_argument("--distributions", type=_list, default=list(DISTRIBUTIONS),
+                        help=f"subconjunto de {','.join(DISTRIBUTIONS)}")
+    parser.add_argument("--engines", type=_list, default=list(ENGINES),
+                        help=f"subconjunto de {','.join(ENGINES)}")
+    parser.add_argument("--operations", type=_list, default=list(OPERATIONS),
+                        help=f"subconjunto de {','.join(OPERATIONS)}")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--probes", type=int, default=1000, help="chaves por rodada de busca")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="grava o relatório JSON neste arquivo")
+    parser.add_argument("--baseline", help="relatório JSON de referência para comparar")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="aumento relativo da mediana considerado regressão (0.15 = 15%%)")
+
+    args = parser.parse_args(argv)
+
+    for name, chosen, valid in (
+        ("distribuição", args.distributions, DISTRIBUTIONS),
+        ("engine", args.engines, ENGINES),
+        ("operação", args.operations, OPERATIONS),
+    ):
+        unknown = [item for item in chosen if item not in valid]
+        if unknown:
+            parser.error(f"{name} desconhecida: {', '.join(unknown)}")
+
+    return args
+
+
+def print_result(result):
+    print(
+        f"{result['engine']:12} {result['distribution']:11} {result['size']:>9} "
+        f"{result['operation']:8} {result['median'] * 1e3:11.3f}ms ±{result['stdev'] * 1e3:.3f}"
+    )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print(f"{'engine':12} {'distrib.':11} {'tamanho':>9} {'operação':8} {'mediana':>13}")
+    report = run_suite(
+        args.sizes, args.distributions, args.engines, args.operations,
+        repeats=args.repeats, warmup=args.warmup, seed=args.seed,
+        probes=args.probes, progress=print_result,
+    )
+
+    for skipped in report["skipped"]:
+        print(f"pulado: {skipped['engine']} {skipped['distribution']} {skipped['size']} ({skipped['reason']})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nrelatório gravado em {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if not regressions:
+            print(f"\nsem regressões acima de {args.threshold:.0%} em relação a {args.baseline}")
+            return 0
+
+        print(f"\n{len(regressions)} regressão(ões) acima de {args.threshold:.0%}:")
+        for r in regressions:
+            print(
+                f"  {r['engine']} {r['distribution']} {r['size']} {r['operation']}: "
+                f"{r['baseline'] * 1e3:.3f}ms -> {r['current'] * 1e3:.3f}ms ({r['change']:+.0%})"
+            )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import random
+from itertools import accumulate
+
+
+DISTRIBUTIONS = ("random", "ascending", "descending", "zipf", "clustered")
+
+CATEGORIES = ("Eletrônicos", "Roupas", "Livros", "Casa", "Esporte", "Alimentos")
+
+# tamanho de cada sequência de IDs consecutivos em "clustered"
+CLUSTER_SIZE = 100
+
+
+def make_keys(distribution, n, seed=0):
+    """
+    Chaves únicas na ordem de inserção da distribuição:
+
+    - random / zipf: IDs aleatórios em [1, 10n], em ordem aleatória
+    - ascending / descending: os mesmos IDs, ordenados
+    - clustered: blocos de CLUSTER_SIZE IDs consecutivos em posições
+      aleatórias, cada bloco em ordem crescente e os blocos embaralhados
+      (cargas de SKUs sequenciais)
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"distribuição desconhecida: {distribution!r}")
+
+    rng = random.Random(seed)
+
+    if distribution == "clustered":
+        blocks = -(-n // CLUSTER_SIZE)
+        starts = rng.sample(range(blocks * 10), blocks)
+        rng.shuffle(starts)
+        keys = [
+            start * CLUSTER_SIZE + offset
+            for start in starts for offset in range(CLUSTER_SIZE)
+        ]
+        return keys[:n]
+
+    keys = rng.sample(range(1, 10 * n + 1), n)
+    if distribution == "ascending":
+        keys.sort()
+    elif distribution == "descending":
+        keys.sort(reverse=True)
+    return keys
+
+
+def make_products(keys, seed=0):
+    """
+    Pares (chave, produto) determinísticos para as chaves dadas.
+    """
+    rng = random.Random(seed)
+    return [
+        (key, {
+            "id": key,
+            "category": rng.choice(CATEGORIES),
+            "price": round(rng.uniform(5, 3000), 2),
+            "stock": rng.randint(0, 500),
+            "rating": round(rng.uniform(1.0, 5.0), 1),
+        })
+        for key in keys
+    ]
+
+
+def make_probes(distribution, keys, count, seed=0, s=1.1):
+    """
+    Chaves consultadas nas buscas/remoções: uniformes sobre as chaves, ou
+    com popularidade Zipf (peso 1 / i^s) quando a distribuição é "zipf".
+    """
+    rng = random.Random(seed + 1)
+
+    if distribution != "zipf":
+        return rng.choices(keys, k=count)
+
+    ranked = list(keys)
+    rng.shuffle(ranked)
+    weights = list(accumulate(1 / (i ** s) for i in range(1, len(ranked) + 1)))
+    return rng.choices(ranked, cum_weights=weights, k=count)
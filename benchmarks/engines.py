@@ -0,0 +1,36 @@
+from src.avl_tree import AVLTree
+from src.bplus_tree import BPlusTree
+from src.bst import BinarySearchTree
+from src.compact_avl import CompactAVLTree
+
+
+class Engine:
+    """
+    Uma árvore disponível no benchmark.
+
+    - factory: cria a árvore vazia (precisa de insert/search/delete/items)
+    - self_balancing: False para árvores que degeneram com chaves
+      ordenadas (essas combinações são puladas acima de DEGENERATE_LIMIT)
+    """
+
+    def __init__(self, name, factory, self_balancing=True):
+        self.name = name
+        self.factory = factory
+        self.self_balancing = self_balancing
+
+
+ENGINES = {}
+
+
+def register_engine(name, factory, self_balancing=True):
+    """
+    Registra uma árvore nova para o benchmark (ex.: uma engine futura).
+    """
+    ENGINES[name] = Engine(name, factory, self_balancing)
+    return ENGINES[name]
+
+
+register_engine("bst", BinarySearchTree, self_balancing=False)
+register_engine("avl", AVLTree)
+register_engine("compact_avl", CompactAVLTree)
+register_engine("bplus", BPlusTree)
@@ -0,0 +1,218 @@
+import gc
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.datasets import make_keys, make_probes, make_products
+from benchmarks.engines import ENGINES
+from src.bfs import bfs_iter
+from src.dfs import dfs_iter
+from src.filters import filter_products, product_matches
+
+
+OPERATIONS = ("insert", "search", "delete", "inorder", "dfs", "bfs", "filter")
+
+# distribuições que viram lista encadeada numa árvore sem balanceamento
+DEGENERATE_DISTRIBUTIONS = ("ascending", "descending")
+
+# acima disso, árvores sem balanceamento com chaves ordenadas são puladas
+# (inserção O(n²): minutos a horas sem dizer nada de novo)
+DEGENERATE_LIMIT = 20_000
+
+FILTER = {"category": "Eletrônicos", "max_price": 500, "min_rating": 4.0}
+
+
+def _is_node_tree(tree):
+    # dfs/bfs/filter_products percorrem nós com key/data/left/right
+    return hasattr(getattr(tree, "root", None), "data")
+
+
+def _build(engine, pairs):
+    tree = engine.factory()
+    for key, product in pairs:
+        tree.insert(key, product)
+    return tree
+
+
+def _consume(iterator):
+    for _ in iterator:
+        pass
+
+
+class Case:
+    """
+    Dados de uma combinação (engine, distribuição, tamanho) e o código de
+    cada operação; setup fica fora da medição.
+    """
+
+    def __init__(self, engine, pairs, probes):
+        self.engine = engine
+        self.pairs = pairs
+        self.probes = probes
+        self.tree = _build(engine, pairs)
+
+        # remove 10% das chaves (sem repetir) e as devolve depois
+        self.deleted = list(dict.fromkeys(probes))[:max(1, len(pairs) // 10)]
+        products = dict(pairs)
+        self.restore = [(key, products[key]) for key in self.deleted]
+
+    def supports(self, operation):
+        if operation in ("dfs", "bfs"):
+            return _is_node_tree(self.tree)
+        return True
+
+    def run(self, operation):
+        """
+        Executa a operação uma vez e devolve o tempo em segundos.
+        """
+        tree = self.tree
+        gc.collect()
+
+        if operation == "insert":
+            start = time.perf_counter()
+            _build(self.engine, self.pairs)
+            return time.perf_counter() - start
+
+        if operation == "search":
+            search = tree.search
+            start = time.perf_counter()
+            for key in self.probes:
+                search(key)
+            return time.perf_counter() - start
+
+        if operation == "delete":
+            start = time.perf_counter()
+            for key in self.deleted:
+                tree.delete(key)
+            elapsed = time.perf_counter() - start
+            for key, product in self.restore:
+                tree.insert(key, product)
+            return elapsed
+
+        if operation == "inorder":
+            start = time.perf_counter()
+            _consume(tree.items())
+            return time.perf_counter() - start
+
+        if operation == "dfs":
+            start = time.perf_counter()
+            _consume(dfs_iter(tree.root))
+            return time.perf_counter() - start
+
+        if operation == "bfs":
+            start = time.perf_counter()
+            _consume(bfs_iter(tree.root))
+            return time.perf_counter() - start
+
+        if operation == "filter":
+            start = time.perf_counter()
+            if _is_node_tree(tree):
+                filter_products(tree.root, **FILTER)
+            else:
+                list(p for _, p in tree.items() if product_matches(p, **FILTER))
+            return time.perf_counter() - start
+
+        raise ValueError(f"operação desconhecida: {operation!r}")
+
+
+def _summary(times):
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "runs": times,
+    }
+
+
+def run_suite(sizes, distributions, engines, operations=OPERATIONS,
+              repeats=5, warmup=1, seed=0, probes=1000, progress=None):
+    """
+    Roda todas as combinações e devolve o relatório (dict serializável em
+    JSON). Cada operação roda `warmup` vezes sem medir e `repeats` vezes
+    medindo; o relatório traz mediana, mínimo, média, desvio e as medições.
+    Os dados dependem só de `seed`, então duas execuções medem o mesmo
+    trabalho.
+    """
+    results = []
+    skipped = []
+
+    for size in sizes:
+        for distribution in distributions:
+            keys = make_keys(distribution, size, seed)
+            pairs = make_products(keys, seed)
+            probe_keys = make_probes(distribution, keys, probes, seed)
+
+            for name in engines:
+                engine = ENGINES[name]
+                label = {"engine": name, "distribution": distribution, "size": size}
+
+                if (not engine.self_balancing and distribution in DEGENERATE_DISTRIBUTIONS
+                        and size > DEGENERATE_LIMIT):
+                    skipped.append({**label, "reason": "árvore degenerada (O(n²))"})
+                    continue
+
+                case = Case(engine, pairs, probe_keys)
+                for operation in operations:
+                    if not case.supports(operation):
+                        continue
+
+                    for _ in range(warmup):
+                        case.run(operation)
+                    times = [case.run(operation) for _ in range(repeats)]
+
+                    result = {**label, "operation": operation, **_summary(times)}
+                    results.append(result)
+                    if progress:
+                        progress(result)
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeats": repeats,
+            "warmup": warmup,
+            "probes": probes,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def _result_key(result):
+    return result["engine"], result["distribution"], result["size"], result["operation"]
+
+
+def compare_to_baseline(report, baseline, threshold=0.15):
+    """
+    Compara medianas com um relatório de referência (mesma máquina) e
+    devolve as combinações que ficaram mais de `threshold` mais lentas.
+    Combinações ausentes na referência são ignoradas.
+    """
+    reference = {_result_key(result): result for result in baseline["results"]}
+
+    regressions = []
+    for result in report["results"]:
+        before = reference.get(_result_key(result))
+        if before is None or before["median"] <= 0:
+            continue
+
+        change = result["median"] / before["median"] - 1
+        if change > threshold:
+            regressions.append({
+                "engine": result["engine"],
+                "distribution": result["distribution"],
+                "size": result["size"],
+                "operation": result["operation"],
+                "baseline": before["median"],
+                "current": result["median"],
+                "change": change,
+            })
+
+    return regressions
@@ -1,11 +1,22 @@
 from src.bst import BinarySearchTree
+from src.avl_tree import AVLTree
+from src.bplus_tree import BPlusTree
 from src.dfs import dfs
 from src.bfs import bfs
 from src.dataset import generate_products
-from src.filters import filter_products
+from src.filters import filter_products, product_matches
+import sys
 import time
 
 
+# engine escolhido pela linha de comando: python main.py [bst|avl|bplus]
+ENGINES = {
+    "bst": BinarySearchTree,
+    "avl": AVLTree,
+    "bplus": BPlusTree,
+}
+
+
 def main():
     # =========================
     # Configuração do experimento
@@ -16,11 +27,13 @@ def main():
     products = generate_products(DATASET_SIZE)
 
     # =========================
-    # Construção da BST
+    # Construção da árvore
     # =========================
-    bst = BinarySearchTree()
+    engine = sys.argv[1] if len(sys.argv) > 1 else "bst"
+    bst = ENGINES[engine]()
+    binary = not isinstance(bst, BPlusTree)  # DFS/BFS/filtro andam em nós binários
 
-    print("🌳 Inserindo produtos na BST...")
+    print(f"🌳 Inserindo produtos na árvore ({engine})...")
     start_insert = time.perf_counter()
 
     for product in products:
@@ -29,32 +42,45 @@ def main():
     end_insert = time.perf_counter()
     print(f"⏱️ Tempo de inserção: {end_insert - start_insert:.4f}s\n")
 
-    # =========================
-    # DFS manual
-    # =========================
-    print("🔍 Executando DFS manual (pilha)...")
-    start_dfs = time.perf_counter()
+    if binary:
+        # =========================
+        # DFS manual
+        # =========================
+        print("🔍 Executando DFS manual (pilha)...")
+        start_dfs = time.perf_counter()
 
-    dfs_result = dfs(bst.root)
+        dfs_result = dfs(bst.root)
 
-    end_dfs = time.perf_counter()
-    print(f"⏱️ Tempo DFS: {end_dfs - start_dfs:.4f}s")
-    print(f"📊 Nós visitados (DFS): {len(dfs_result)}\n")
+        end_dfs = time.perf_counter()
+        print(f"⏱️ Tempo DFS: {end_dfs - start_dfs:.4f}s")
+        print(f"📊 Nós visitados (DFS): {len(dfs_result)}\n")
 
-    # =========================
-    # BFS manual
-    # =========================
-    print("🌊 Executando BFS manual (fila)...")
-    start_bfs = time.perf_counter()
+        # =========================
+        # BFS manual
+        # =========================
+        print("🌊 Executando BFS manual (fila)...")
+        start_bfs = time.perf_counter()
+
+        bfs_result = bfs(bst.root)
 
-    bfs_result = bfs(bst.root)
+        end_bfs = time.perf_counter()
+        print(f"⏱️ Tempo BFS: {end_bfs - start_bfs:.4f}s")
+        print(f"📊 Nós visitados (BFS): {len(bfs_result)}\n")
+    else:
+        # =========================
+        # Varredura pelas folhas encadeadas (B+)
+        # =========================
+        print("🔗 Varrendo folhas encadeadas em ordem...")
+        start_scan = time.perf_counter()
 
-    end_bfs = time.perf_counter()
-    print(f"⏱️ Tempo BFS: {end_bfs - start_bfs:.4f}s")
-    print(f"📊 Nós visitados (BFS): {len(bfs_result)}\n")
+        scan_result = [key for key, _ in bst.items()]
+
+        end_scan = time.perf_counter()
+        print(f"⏱️ Tempo da varredura: {end_scan - start_scan:.4f}s")
+        print(f"📊 Chaves visitadas: {len(scan_result)}\n")
 
     # =========================
-    # Busca pontual na BST
+    # Busca pontual na árvore
     # =========================
     search_id = products[len(products) // 2]["id"]
     print(f"🎯 Buscando produto com ID = {search_id}")
@@ -68,11 +94,17 @@ def main():
     
 
     print("\n🔍 Filtrando: Categoria 'Eletrônicos' com preço até R$ 500.00")
-    cheap_electronics = filter_products(
-        bst.root, 
-        category="Eletrônicos", 
-        max_price=500.0
-    )
+    if binary:
+        cheap_electronics = filter_products(
+            bst.root, 
+            category="Eletrônicos", 
+            max_price=500.0
+        )
+    else:
+        cheap_electronics = [
+            p for _, p in bst.items()
+            if product_matches(p, category="Eletrônicos", max_price=500.0)
+        ]
 
     print(f"📊 Encontrados: {len(cheap_electronics)} produtos")
     for p in cheap_electronics[:3]: # Mostra os 3 primeiros resultados
@@ -7,6 +7,7 @@ class AVLNode:
         self.left = None
         self.right = None
         self.height = 1  # Altura inicial é 1 (nó folha)
+        self.size = 1    # Nós na subárvore (só mantido com track_size)
     
     def get_balance(self):
      
@@ -18,4 +19,10 @@ class AVLNode:
      
         left_height = self.left.height if self.left else 0
         right_height = self.right.height if self.right else 0
-        self.height = 1 + max(left_height, right_height)
\ No newline at end of file
+        self.height = 1 + max(left_height, right_height)
+    
+    def update_size(self):
+     
+        left_size = self.left.size if self.left else 0
+        right_size = self.right.size if self.right else 0
+        self.size = 1 + left_size + right_size
@@ -1,10 +1,171 @@
 from src.avl_node import AVLNode
+from src.gc_pause import gc_paused
+from src.inorder import inorder
+from src.instrumentation import OperationStats
+from src.search import search_many
+from src.snapshot import read_snapshot, save_snapshot
 
 
 class AVLTree:
     
-    def __init__(self):
+    # lotes com pelo menos n / FACTOR itens reconstroem a árvore em vez de
+    # aplicar operação por operação. delete não aloca nós, então o laço
+    # ordenado continua competitivo até lotes maiores
+    INSERT_REBUILD_FACTOR = 16
+    DELETE_REBUILD_FACTOR = 4
+
+    def __init__(self, track_size=False, instrument=False):
         self.root = None
+        self.indexes = []  # índices secundários avisados em insert/delete
+        self.version = 0   # incrementado a cada mutação (caches comparam)
+
+        # mantém node.size (estatística de ordem) para rank/select/count_range
+        self.track_size = track_size
+
+        # OperationStats quando instrumentada; None = sem custo de contagem
+        self.counters = OperationStats() if instrument else None
+
+    @classmethod
+    def from_sorted(cls, items, track_size=False):
+        """
+        Constrói uma árvore perfeitamente balanceada em O(n) a partir de
+        pares (chave, dados) já ordenados por chave, sem repetição.
+        """
+        items = items if isinstance(items, list) else list(items)
+
+        for i in range(1, len(items)):
+            if not items[i - 1][0] < items[i][0]:
+                raise ValueError("from_sorted exige chaves estritamente crescentes")
+
+        tree = cls(track_size=track_size)
+
+        # a montagem só cria objetos novos
+        with gc_paused():
+            nodes = [AVLNode(key, data) for key, data in items]
+            tree.root = tree._link_balanced(nodes, 0, len(nodes) - 1)
+
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items, track_size=False):
+        """
+        Ordena os pares (chave, dados) uma única vez e delega a from_sorted.
+        Chaves repetidas ficam com o último valor, como em insert.
+        """
+        ordered = sorted(items, key=lambda item: item[0])
+
+        unique = []
+        for item in ordered:
+            if unique and unique[-1][0] == item[0]:
+                unique[-1] = item
+            else:
+                unique.append(item)
+
+        return cls.from_sorted(unique, track_size=track_size)
+
+    @classmethod
+    def load(cls, path, track_size=False):
+        """
+        Carrega um snapshot gravado por save(). As chaves já vêm ordenadas,
+        então a árvore é montada em O(n) por from_sorted.
+        """
+        return cls.from_sorted(read_snapshot(path), track_size=track_size)
+
+    def save(self, path):
+        """
+        Grava um snapshot binário (chaves ordenadas + produtos em colunas).
+        """
+        save_snapshot(self, path)
+
+    def _link_balanced(self, nodes, lo, hi):
+        # religa nodes[lo..hi] (em ordem) com o do meio como raiz; serve
+        # tanto para nós recém-criados quanto para nós já existentes.
+        # profundidade da recursão é O(log n)
+        if lo > hi:
+            return None
+
+        mid = (lo + hi) // 2
+
+        node = nodes[mid]
+        node.left = self._link_balanced(nodes, lo, mid - 1)
+        node.right = self._link_balanced(nodes, mid + 1, hi)
+
+        # subárvore com m nós dividida ao meio tem altura m.bit_length()
+        node.size = hi - lo + 1
+        node.height = node.size.bit_length()
+
+        return node
+
+    def _inorder_nodes(self):
+        # lista dos nós em ordem de chave (pilha explícita)
+        nodes = []
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+        return nodes
+
+    def _use_rebuild(self, batch_size, factor):
+        # lote grande em relação à árvore: reconstruir O(n + m) sai mais
+        # barato que m descidas de O(log n). Sem track_size, o tamanho é
+        # estimado pela altura
+        if self.root is None:
+            return True
+        n = self.root.size if self.track_size else 1 << (self.root.height - 1)
+        return batch_size * factor >= n
+
+    def attach_index(self, index):
+        """
+        Registra um índice secundário (ex.: CategoryIndex), preenchendo-o
+        com os produtos que já estão na árvore.
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            index.add(node.key, node.data)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+        self.indexes.append(index)
+        return index
+
+    def _index_add(self, key, data):
+        # chamado antes de a árvore mudar: se um índice recusar o produto,
+        # os que já o receberam são desfeitos e o erro sobe
+        done = []
+        try:
+            for index in self.indexes:
+                index.add(key, data)
+                done.append(index)
+        except Exception:
+            for index in done:
+                index.remove(key, data)
+            raise
+
+    def _index_update(self, key, old, new):
+        # troca os dados de uma chave nos índices, tudo ou nada
+        done = []
+        try:
+            for index in self.indexes:
+                done.append(index)
+                index.remove(key, old)
+                index.add(key, new)
+        except Exception:
+            for index in done:
+                index.remove(key, new)
+                index.add(key, old)
+            raise
+
+    def _index_remove(self, key, data):
+        for index in self.indexes:
+            index.remove(key, data)
     
     def rotate_right(self, z):
       
@@ -18,6 +179,13 @@ class AVLTree:
         # Atualizar alturas
         z.update_height()
         y.update_height()
+
+        if self.track_size:
+            z.update_size()
+            y.update_size()
+
+        if self.counters is not None:
+            self.counters.height_updates += 2
         
         return y
     
@@ -33,132 +201,320 @@ class AVLTree:
         # Atualizar alturas
         z.update_height()
         y.update_height()
+
+        if self.track_size:
+            z.update_size()
+            y.update_size()
+
+        if self.counters is not None:
+            self.counters.height_updates += 2
         
         return y
     
 
-    def insert(self, key, data):
-
-        self.root = self._insert_recursive(self.root, key, data)
-    
-    def _insert_recursive(self, node, key, data):
-        # 1. Inserção normal de BST
-        if node is None:
-            return AVLNode(key, data)
-        
-        if key < node.key:
-            node.left = self._insert_recursive(node.left, key, data)
-        elif key > node.key:
-            node.right = self._insert_recursive(node.right, key, data)
-        else:
-            # Chave duplicada - atualiza os dados
-            node.data = data
-            return node
-        
-        # 2. Atualizar altura do nó ancestral
-        node.update_height()
-        
-        # 3. Obter fator de balanceamento
+    def _rebalance(self, node):
+        # node já está com a altura atualizada; devolve a nova raiz da subárvore
         balance = node.get_balance()
-        
-        # 4. Se desbalanceado, executar rotações
-        
-        # Caso Right-Right (RR): direita pesada, inseriu à direita
-        if balance > 1 and key > node.right.key:
-            return self.rotate_left(node)
-        
-        # Caso Left-Left (LL): esquerda pesada, inseriu à esquerda
-        if balance < -1 and key < node.left.key:
-            return self.rotate_right(node)
-        
-        # Caso Right-Left (RL): direita pesada, mas inseriu à esquerda da direita
-        if balance > 1 and key < node.right.key:
-            node.right = self.rotate_right(node.right)
+
+        # Direita pesada
+        if balance > 1:
+            # Caso Right-Left: subárvore direita pende para a esquerda
+            if node.right.get_balance() < 0:
+                if self.counters is not None:
+                    self.counters.rotations_rl += 1
+                node.right = self.rotate_right(node.right)
+            # Caso Right-Right
+            elif self.counters is not None:
+                self.counters.rotations_rr += 1
             return self.rotate_left(node)
-        
-        # Caso Left-Right (LR): esquerda pesada, mas inseriu à direita da esquerda
-        if balance < -1 and key > node.left.key:
-            node.left = self.rotate_left(node.left)
+
+        # Esquerda pesada
+        if balance < -1:
+            # Caso Left-Right: subárvore esquerda pende para a direita
+            if node.left.get_balance() > 0:
+                if self.counters is not None:
+                    self.counters.rotations_lr += 1
+                node.left = self.rotate_left(node.left)
+            # Caso Left-Left
+            elif self.counters is not None:
+                self.counters.rotations_ll += 1
             return self.rotate_right(node)
-        
+
         return node
+
+    def _rebalance_path(self, path):
+        """
+        Sobe pelo caminho (raiz -> pai do nó alterado) atualizando alturas e
+        rotacionando onde preciso. Para assim que uma subárvore mantém a altura
+        que tinha antes da operação, pois os ancestrais não mudam (com
+        track_size vai até a raiz, já que os tamanhos mudam em todo o caminho).
+        """
+        track_size = self.track_size
+
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+
+            node.update_height()
+            if track_size:
+                node.update_size()
+            new_root = self._rebalance(node)
+
+            if new_root is not node:
+                # religa a subárvore rotacionada ao pai
+                if i == 0:
+                    self.root = new_root
+                else:
+                    parent = path[i - 1]
+                    if parent.left is node:
+                        parent.left = new_root
+                    else:
+                        parent.right = new_root
+
+            if new_root.height == old_height and not track_size:
+                break
+
+        if self.counters is not None and path:
+            # i é o último índice visitado, com ou sem break
+            self.counters.height_updates += len(path) - i
+
+
+    def insert(self, key, data):
+        # devolve True se a chave é nova, False se só atualizou os dados
+
+        if self.counters is not None:
+            self.counters.inserts += 1
+
+        if self.root is None:
+            self._index_add(key, data)
+            self.root = AVLNode(key, data)
+            self.version += 1
+            return True
+
+        # 1. Descida normal de BST guardando o caminho (sem recursão)
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                # Chave duplicada - atualiza os dados
+                if self.counters is not None:
+                    self.counters.count_descent(len(path))
+                if self.indexes:
+                    self._index_update(key, node.data, data)
+                node.data = data
+                self.version += 1
+                return False
+
+        if self.counters is not None:
+            self.counters.count_descent(len(path))
+
+        # índices antes da árvore: se um deles falhar, nada foi ligado
+        self._index_add(key, data)
+
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = AVLNode(key, data)
+        else:
+            parent.right = AVLNode(key, data)
+        self.version += 1
+
+        # 2. Atualizar alturas e rebalancear subindo pelo caminho
+        self._rebalance_path(path)
+        return True
     
 
     def search(self, key):
 
-        return self._search_recursive(self.root, key)
-    
-    def _search_recursive(self, node, key):
-        if node is None or node.key == key:
-            return node
-        
-        if key < node.key:
-            return self._search_recursive(node.left, key)
-        
-        return self._search_recursive(node.right, key)
+        if self.counters is not None:
+            self.counters.searches += 1
+            return self.counters.record_descent(self.root, key)
+
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node
+
+        return None
     
     
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves numa descida compartilhada; devolve o nó
+        (ou None) de cada chave, na ordem recebida.
+        """
+        return search_many(self.root, keys)
+
     def delete(self, key):
+        # devolve True se a chave existia e foi removida
+
+        # 1. Localizar o nó guardando o caminho
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            if key < node.key:
+                node = node.left
+            else:
+                node = node.right
+
+        if self.counters is not None:
+            self.counters.deletes += 1
+            self.counters.count_descent(len(path) + (node is not None))
 
-        self.root = self._delete_recursive(self.root, key)
-    
-    def _delete_recursive(self, node, key):
-        # 1. Remoção normal de BST
         if node is None:
-            return node
-        
-        if key < node.key:
-            node.left = self._delete_recursive(node.left, key)
-        elif key > node.key:
-            node.right = self._delete_recursive(node.right, key)
-        else:
-            # Nó encontrado - remover
-            
-            # Caso 1: Nó com um filho ou sem filhos
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            
-            # Caso 2: Nó com dois filhos
+            return False  # chave não existe
+
+        self._index_remove(node.key, node.data)
+        self.version += 1
+
+        # Caso 2: Nó com dois filhos
+        if node.left is not None and node.right is not None:
             # Encontrar o sucessor (menor da subárvore direita)
-            successor = self._min_value_node(node.right)
-            
-            # Copiar dados do sucessor
+            start = len(path)
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+
+            if self.counters is not None:
+                # node.right ... successor: len(path) - start nós
+                self.counters.record_successor(len(path) - start)
+
+            # Copiar dados do sucessor; o sucessor vira o nó a remover
             node.key = successor.key
             node.data = successor.data
-            
-            # Remover o sucessor
-            node.right = self._delete_recursive(node.right, successor.key)
-        
-        # 2. Atualizar altura
-        node.update_height()
-        
-        # 3. Obter fator de balanceamento
-        balance = node.get_balance()
-        
-        # 4. Rebalancear se necessário
-        
-        # Caso Right-Right: direita pesada
-        if balance > 1 and node.right.get_balance() >= 0:
-            return self.rotate_left(node)
-        
-        # Caso Right-Left: direita pesada, mas subárvore esquerda mais alta
-        if balance > 1 and node.right.get_balance() < 0:
-            node.right = self.rotate_right(node.right)
-            return self.rotate_left(node)
-        
-        # Caso Left-Left: esquerda pesada
-        if balance < -1 and node.left.get_balance() <= 0:
-            return self.rotate_right(node)
-        
-        # Caso Left-Right: esquerda pesada, mas subárvore direita mais alta
-        if balance < -1 and node.left.get_balance() > 0:
-            node.left = self.rotate_left(node.left)
-            return self.rotate_right(node)
-        
-        return node
+            node = successor
+
+        # Caso 1: Nó com um filho ou sem filhos
+        child = node.left if node.left is not None else node.right
+
+        if not path:
+            self.root = child
+            return True
+
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+        # 2. Atualizar alturas e rebalancear subindo pelo caminho
+        self._rebalance_path(path)
+        return True
     
+    def insert_many(self, items):
+        """
+        Insere/atualiza um lote de pares (chave, dados) de uma vez; no lote,
+        chave repetida fica com o último valor. Devolve (inseridos,
+        atualizados).
+
+        O lote é ordenado uma vez. Se for pequeno perto da árvore, aplica
+        insert em ordem de chave (descidas vizinhas reaproveitam cache);
+        senão intercala com a sequência em ordem dos nós e religa tudo
+        balanceado em O(n + m), reaproveitando os nós existentes.
+        """
+        batch = {}
+        for key, data in items:
+            batch[key] = data
+        if not batch:
+            return 0, 0
+
+        keys = sorted(batch)
+
+        if not self._use_rebuild(len(keys), self.INSERT_REBUILD_FACTOR):
+            inserted = sum(self.insert(key, batch[key]) for key in keys)
+            return inserted, len(keys) - inserted
+
+        with gc_paused():
+            existing = self._inorder_nodes()
+            merged = []
+            updates = []   # (nó, dados novos), aplicados só no fim
+            created = []
+            i = 0
+
+            # índices primeiro; se um falhar no meio do lote, o que já foi
+            # avisado é desfeito e a árvore não foi tocada
+            try:
+                for key in keys:
+                    data = batch[key]
+                    while i < len(existing) and existing[i].key < key:
+                        merged.append(existing[i])
+                        i += 1
+
+                    if i < len(existing) and existing[i].key == key:
+                        node = existing[i]
+                        if self.indexes:
+                            self._index_update(key, node.data, data)
+                        updates.append((node, data))
+                        merged.append(node)
+                        i += 1
+                    else:
+                        self._index_add(key, data)
+                        node = AVLNode(key, data)
+                        created.append(node)
+                        merged.append(node)
+            except Exception:
+                for node, data in updates:
+                    self._index_update(node.key, data, node.data)
+                for node in created:
+                    self._index_remove(node.key, node.data)
+                raise
+
+            for node, data in updates:
+                node.data = data
+            updated = len(updates)
+            inserted = len(keys) - updated
+
+            merged.extend(existing[i:])
+            self.root = self._link_balanced(merged, 0, len(merged) - 1)
+            self.version += 1
+            if self.counters is not None:
+                self.counters.bulk_rebuilds += 1
+
+        return inserted, updated
+
+    def delete_many(self, keys):
+        """
+        Remove um lote de chaves (ausentes são ignoradas) e devolve quantas
+        saíram. Como em insert_many, lote pequeno vira delete em ordem de
+        chave; lote grande, uma passada pelos nós em ordem descartando os
+        marcados, seguida de religação balanceada.
+        """
+        targets = set(keys)
+        if not targets or self.root is None:
+            return 0
+
+        if not self._use_rebuild(len(targets), self.DELETE_REBUILD_FACTOR):
+            return sum(self.delete(key) for key in sorted(targets))
+
+        with gc_paused():
+            kept = []
+            removed = 0
+            for node in self._inorder_nodes():
+                if node.key in targets:
+                    self._index_remove(node.key, node.data)
+                    removed += 1
+                else:
+                    kept.append(node)
+
+            if removed:
+                self.root = self._link_balanced(kept, 0, len(kept) - 1)
+                self.version += 1
+                if self.counters is not None:
+                    self.counters.bulk_rebuilds += 1
+
+        return removed
+
     def _min_value_node(self, node):
 
         current = node
@@ -167,6 +523,100 @@ class AVLTree:
         return current
 
     
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Gerador de pares (chave, dados) em ordem, opcionalmente limitado
+        a lo <= chave <= hi. Pode ser interrompido a qualquer momento.
+        """
+        return inorder(self.root, lo, hi, reverse)
+
+    def _require_size(self):
+        if not self.track_size:
+            raise ValueError("rank/select/count_range exigem AVLTree(track_size=True)")
+
+    def _count_less(self, key, inclusive=False):
+        # nós com chave < key (ou <= key), somando tamanhos à esquerda
+        self._require_size()
+
+        count = 0
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                count += (node.left.size if node.left else 0) + 1
+                node = node.right
+            else:
+                count += (node.left.size if node.left else 0) + (1 if inclusive else 0)
+                break
+
+        return count
+
+    def rank(self, key):
+        """
+        Quantidade de chaves menores que key (posição de key na ordem). O(log n).
+        """
+        return self._count_less(key)
+
+    def select(self, i):
+        """
+        Nó com a i-ésima menor chave (a partir de 0), ou None se i está
+        fora da árvore. O(log n).
+        """
+        self._require_size()
+
+        node = self.root
+        if node is None or not 0 <= i < node.size:
+            return None
+
+        while node is not None:
+            left_size = node.left.size if node.left else 0
+            if i < left_size:
+                node = node.left
+            elif i > left_size:
+                i -= left_size + 1
+                node = node.right
+            else:
+                return node
+
+        return None
+
+    def count_range(self, lo=None, hi=None):
+        """
+        Quantidade de chaves com lo <= chave <= hi (limites opcionais). O(log n).
+        """
+        self._require_size()
+
+        total = self.root.size if self.root else 0
+        upper = total if hi is None else self._count_less(hi, inclusive=True)
+        lower = 0 if lo is None else self._count_less(lo)
+
+        return max(0, upper - lower)
+
+    def enable_stats(self):
+        """
+        Liga a contagem de operações (OperationStats); contadores zerados.
+        """
+        self.counters = OperationStats()
+
+    def disable_stats(self):
+        self.counters = None
+
+    def stats(self):
+        """
+        Cópia dos contadores: nós visitados, comparações, rotações por
+        caso, buscas de sucessor, atualizações de altura. Exige
+        AVLTree(instrument=True) ou enable_stats().
+        """
+        if self.counters is None:
+            raise ValueError("stats exige AVLTree(instrument=True) ou enable_stats()")
+        return self.counters.snapshot()
+
+    def reset_stats(self):
+        if self.counters is None:
+            raise ValueError("stats exige AVLTree(instrument=True) ou enable_stats()")
+        self.counters.reset()
+
     def get_height(self):
 
         return self.root.height if self.root else 0
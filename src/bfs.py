@@ -0,0 +1,31 @@
+from collections import deque
+from itertools import islice
+
+def bfs_iter(root):
+    """
+    Versão geradora da BFS: devolve as chaves por nível sob demanda.
+    Memória O(largura da árvore) em vez de O(n).
+    """
+
+    if root is None:
+        return
+    
+    queue = deque([root]) # raiz no inicio da fila
+
+    while queue:
+
+        # remove do inicio da fila e entrega a chave
+        current = queue.popleft()
+        yield current.key
+
+        if current.left:
+            queue.append(current.left)
+        
+        if current.right:
+            queue.append(current.right)
+
+
+def bfs(root, limit=None):
+
+    # limit: para depois de visitar essa quantidade de nós
+    return list(islice(bfs_iter(root), limit))
@@ -0,0 +1,307 @@
+from bisect import bisect_left, bisect_right
+
+from src.node import Node
+
+
+class BPlusLeaf:
+
+    def __init__(self):
+        self.keys = []
+        self.values = []
+        self.prev = None  # folhas encadeadas para leituras sequenciais
+        self.next = None
+
+
+class BPlusInternal:
+
+    def __init__(self):
+        # children[i] guarda as chaves em [keys[i - 1], keys[i])
+        self.keys = []
+        self.children = []
+
+
+class BPlusTree:
+    """
+    Árvore B+ com a mesma API de AVLTree (insert/search/delete/items/
+    get_height/is_balanced). Cada nó guarda até `order` chaves, então uma
+    busca desce ~log_order(n) níveis em vez de ~log2(n) nós binários.
+    Os dados ficam só nas folhas, encadeadas nos dois sentidos para
+    varreduras por faixa.
+
+    search devolve um Node avulso com key/data, como os nós das outras
+    árvores.
+    """
+
+    def __init__(self, order=64):
+        if order < 3:
+            raise ValueError("order precisa ser pelo menos 3")
+
+        self.order = order                 # máximo de chaves por nó
+        self.min_keys = order // 2         # mínimo fora da raiz
+        self.root = BPlusLeaf()
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _find_leaf(self, key):
+        node = self.root
+        while not isinstance(node, BPlusLeaf):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+
+    def search(self, key):
+
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return Node(key, leaf.values[i])
+        return None
+
+
+    def insert(self, key, data):
+        # devolve True se a chave é nova, False se só atualizou os dados
+
+        # desce guardando (nó interno, índice do filho) para propagar splits
+        path = []
+        node = self.root
+        while not isinstance(node, BPlusLeaf):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+
+        i = bisect_left(node.keys, key)
+        if i < len(node.keys) and node.keys[i] == key:
+            # Chave duplicada - atualiza os dados
+            node.values[i] = data
+            return False
+
+        node.keys.insert(i, key)
+        node.values.insert(i, data)
+        self.count += 1
+
+        if len(node.keys) <= self.order:
+            return True
+
+        # folha cheia: divide ao meio e sobe a primeira chave da direita
+        separator, right = self._split_leaf(node)
+
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right)
+
+            if len(parent.keys) <= self.order:
+                return True
+
+            separator, right = self._split_internal(parent)
+
+        # a raiz dividiu: a árvore cresce um nível
+        new_root = BPlusInternal()
+        new_root.keys = [separator]
+        new_root.children = [self.root, right]
+        self.root = new_root
+        return True
+
+    def _split_leaf(self, leaf):
+        mid = len(leaf.keys) // 2
+
+        right = BPlusLeaf()
+        right.keys = leaf.keys[mid:]
+        right.values = leaf.values[mid:]
+        del leaf.keys[mid:]
+        del leaf.values[mid:]
+
+        right.next = leaf.next
+        right.prev = leaf
+        if leaf.next is not None:
+            leaf.next.prev = right
+        leaf.next = right
+
+        return right.keys[0], right
+
+    def _split_internal(self, node):
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+
+        right = BPlusInternal()
+        right.keys = node.keys[mid + 1:]
+        right.children = node.children[mid + 1:]
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+
+        return separator, right
+
+
+    def delete(self, key):
+        # devolve True se a chave existia e foi removida
+
+        path = []
+        node = self.root
+        while not isinstance(node, BPlusLeaf):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+
+        i = bisect_left(node.keys, key)
+        if i == len(node.keys) or node.keys[i] != key:
+            return False  # chave não existe
+
+        del node.keys[i]
+        del node.values[i]
+        self.count -= 1
+
+        # corrige nós abaixo do mínimo subindo pelo caminho
+        while path and len(node.keys) < self.min_keys:
+            parent, i = path.pop()
+            if isinstance(node, BPlusLeaf):
+                self._fix_leaf(parent, i)
+            else:
+                self._fix_internal(parent, i)
+            node = parent
+
+        # raiz interna sem chaves: a árvore perde um nível
+        if isinstance(self.root, BPlusInternal) and not self.root.keys:
+            self.root = self.root.children[0]
+
+        return True
+
+    def _fix_leaf(self, parent, i):
+        leaf = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+
+        # empresta do irmão esquerdo
+        if left is not None and len(left.keys) > self.min_keys:
+            leaf.keys.insert(0, left.keys.pop())
+            leaf.values.insert(0, left.values.pop())
+            parent.keys[i - 1] = leaf.keys[0]
+            return
+
+        # empresta do irmão direito
+        if right is not None and len(right.keys) > self.min_keys:
+            leaf.keys.append(right.keys.pop(0))
+            leaf.values.append(right.values.pop(0))
+            parent.keys[i] = right.keys[0]
+            return
+
+        # funde com um irmão (a folha da direita some da lista encadeada)
+        if left is not None:
+            left_index, survivor, removed = i - 1, left, leaf
+        else:
+            left_index, survivor, removed = i, leaf, right
+
+        survivor.keys.extend(removed.keys)
+        survivor.values.extend(removed.values)
+        survivor.next = removed.next
+        if removed.next is not None:
+            removed.next.prev = survivor
+
+        del parent.keys[left_index]
+        del parent.children[left_index + 1]
+
+    def _fix_internal(self, parent, i):
+        node = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+
+        # empresta do irmão esquerdo girando pelo separador do pai
+        if left is not None and len(left.keys) > self.min_keys:
+            node.keys.insert(0, parent.keys[i - 1])
+            node.children.insert(0, left.children.pop())
+            parent.keys[i - 1] = left.keys.pop()
+            return
+
+        # empresta do irmão direito
+        if right is not None and len(right.keys) > self.min_keys:
+            node.keys.append(parent.keys[i])
+            node.children.append(right.children.pop(0))
+            parent.keys[i] = right.keys.pop(0)
+            return
+
+        # funde com um irmão, descendo o separador do pai
+        if left is not None:
+            left_index, survivor, removed = i - 1, left, node
+        else:
+            left_index, survivor, removed = i, node, right
+
+        survivor.keys.append(parent.keys[left_index])
+        survivor.keys.extend(removed.keys)
+        survivor.children.extend(removed.children)
+
+        del parent.keys[left_index]
+        del parent.children[left_index + 1]
+
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Gerador de pares (chave, dados) em ordem, com limites inclusivos
+        opcionais. Desce uma vez até a folha do limite e segue a lista
+        encadeada de folhas: O(log n + k).
+        """
+        if not reverse:
+            leaf = self._find_leaf(lo) if lo is not None else self._edge_leaf(first=True)
+            i = bisect_left(leaf.keys, lo) if lo is not None else 0
+
+            while leaf is not None:
+                keys = leaf.keys
+                while i < len(keys):
+                    if hi is not None and keys[i] > hi:
+                        return
+                    yield keys[i], leaf.values[i]
+                    i += 1
+                leaf = leaf.next
+                i = 0
+        else:
+            leaf = self._find_leaf(hi) if hi is not None else self._edge_leaf(first=False)
+            i = (bisect_right(leaf.keys, hi) if hi is not None else len(leaf.keys)) - 1
+
+            while leaf is not None:
+                keys = leaf.keys
+                while i >= 0:
+                    if lo is not None and keys[i] < lo:
+                        return
+                    yield keys[i], leaf.values[i]
+                    i -= 1
+                leaf = leaf.prev
+                if leaf is not None:
+                    i = len(leaf.keys) - 1
+
+    def _edge_leaf(self, first=True):
+        node = self.root
+        while not isinstance(node, BPlusLeaf):
+            node = node.children[0] if first else node.children[-1]
+        return node
+
+
+    def get_height(self):
+
+        # níveis da raiz até as folhas (0 para árvore vazia)
+        if not self.root.keys:
+            return 0
+
+        height = 1
+        node = self.root
+        while not isinstance(node, BPlusLeaf):
+            node = node.children[0]
+            height += 1
+        return height
+
+    def is_balanced(self):
+
+        # B+ é sempre balanceada: todas as folhas na mesma profundidade
+        # e todo nó (fora a raiz) com pelo menos min_keys chaves
+        leaf_depths = set()
+        stack = [(self.root, 1)]
+        while stack:
+            node, depth = stack.pop()
+            if node is not self.root and len(node.keys) < self.min_keys:
+                return False
+            if isinstance(node, BPlusLeaf):
+                leaf_depths.add(depth)
+            else:
+                for child in node.children:
+                    stack.append((child, depth + 1))
+
+        return len(leaf_depths) <= 1
@@ -1,83 +1,217 @@
+from src.inorder import inorder
+from src.instrumentation import OperationStats
+from src.search import search_many
 from src.node import Node
 
 class BinarySearchTree:
 
-    def __init__(self):
+    def __init__(self, instrument=False):
         self.root = None # Árvore está inicialmente vazia quando criada
+        self.indexes = [] # índices secundários avisados em insert/delete
+        self.version = 0 # incrementado a cada insert/delete que muda a árvore
+
+        # OperationStats quando instrumentada; None = sem custo de contagem
+        self.counters = OperationStats() if instrument else None
+
+    def attach_index(self, index):
+        """
+        Registra um índice secundário (ex.: CategoryIndex), preenchendo-o
+        com os produtos que já estão na árvore.
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            current = stack.pop()
+            index.add(current.key, current.data)
+            if current.right:
+                stack.append(current.right)
+            if current.left:
+                stack.append(current.left)
+
+        self.indexes.append(index)
+        return index
     
     def insert(self, key, data):
-        self.root = self._insert_recursive(self.root, key, data)
-    
-    def _insert_recursive(self, node, key, data):
-
-        if node is None:
-            return Node(key, data)
-        
-        if key < node.key:
-            node.left = self._insert_recursive(node.left, key, data)
-        
-        elif key > node.key:
-            node.right = self._insert_recursive(node.right, key, data)
-        
-        return node  # CORREÇÃO: retorna o nó em vez de None
+        # devolve True se a chave é nova, False se ela já existia (o nó original fica)
+
+        if self.counters is not None:
+            # a descida contada é a própria descida do insert
+            self.counters.inserts += 1
+            parent, found = self.counters.descend(self.root, key)
+            if found is None:
+                self._attach(parent, key, data)
+            return found is None
+
+        # versão iterativa: sem limite de profundidade (inserção ordenada
+        # degenera a árvore em lista e estouraria a pilha de recursão)
+        if self.root is None:
+            self._attach(None, key, data)
+            return True
+
+        current = self.root
+        while True:
+            if key < current.key:
+                if current.left is None:
+                    self._attach(current, key, data)
+                    return True
+                current = current.left
+
+            elif key > current.key:
+                if current.right is None:
+                    self._attach(current, key, data)
+                    return True
+                current = current.right
+
+            else:
+                return False  # chave duplicada: BST mantém o nó original
+
+    def _attach(self, parent, key, data):
+        # índices avisados antes de ligar o nó: se um deles recusar o
+        # produto, a árvore fica como estava
+        self._index_add(key, data)
+
+        node = Node(key, data)
+        if parent is None:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        self.version += 1
     
     def search(self, key):
-        return self._search_recursive(self.root, key)
-    
-    def _search_recursive(self, node, key):
-
-        if node is None or node.key == key: # retorna caso o vertice encontrado seja o escolhido
-            return node
-        
-        if key < node.key: #vasculhar a arvore buscando o valor de acordo com o tamanho da chave
-            return self._search_recursive(node.left, key)
-        
-        return self._search_recursive(node.right, key)
+
+        if self.counters is not None:
+            self.counters.searches += 1
+            return self.counters.record_descent(self.root, key)
+
+        current = self.root
+        while current is not None:
+            #vasculhar a arvore buscando o valor de acordo com o tamanho da chave
+            if key < current.key:
+                current = current.left
+            elif key > current.key:
+                current = current.right
+            else:
+                return current # retorna caso o vertice encontrado seja o escolhido
+
+        return None
     
 
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves numa descida compartilhada; devolve o nó
+        (ou None) de cada chave, na ordem recebida.
+        """
+        return search_many(self.root, keys)
+
     def delete(self, key):
-        self.root = self._delete_recursive(self.root, key)
-    
-    def _delete_recursive(self, node, key):
-
-        if node is None:
-            return node
-        
-        if key < node.key :
-            node.left = self._delete_recursive(node.left, key)
-        
-        elif key > node.key :
-            node.right = self._delete_recursive(node.right, key)
-        
+        # devolve True se a chave existia e foi removida
+
+        if self.counters is not None:
+            self.counters.deletes += 1
+            parent, current = self.counters.descend(self.root, key)
         else:
+            parent = None
+            current = self.root
+
+            # desce até o nó a ser removido guardando o pai
+            while current is not None and current.key != key:
+                parent = current
+                if key < current.key:
+                    current = current.left
+                else:
+                    current = current.right
+
+        if current is None:
+            return False  # chave não existe
 
-            # caso onde o nó possui um filho ou nenhum filho
+        self._index_remove(current.key, current.data)
+        self.version += 1
+
+        if current.left is not None and current.right is not None:
 
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            
             # nó com dois filhos
-            # encontrando o sucessor
-            sucessor = self._min_value_node(node.right) # menor subárvore a direita
+            # encontrando o sucessor (menor da subárvore a direita)
+            sucessor_parent = current
+            sucessor = current.right
+            steps = 1
+            while sucessor.left is not None:
+                sucessor_parent = sucessor
+                sucessor = sucessor.left
+                steps += 1
+
+            if self.counters is not None:
+                self.counters.record_successor(steps)
 
             # copia os dados do sucessor para o vértice
-            node.key = sucessor.key
-            node.data = sucessor.data
+            current.key = sucessor.key
+            current.data = sucessor.data
+
+            # o sucessor passa a ser o nó removido (tem no máximo um filho)
+            parent = sucessor_parent
+            current = sucessor
 
-            # removendo o sucessor da subárvore a direita
-            node.right = self._delete_recursive(node.right, sucessor.key)
+        # caso onde o nó possui um filho ou nenhum filho
+        child = current.left if current.left is not None else current.right
 
-        return node
+        if parent is None:
+            self.root = child
+        elif parent.left is current:
+            parent.left = child
+        else:
+            parent.right = child
+
+        return True
     
+    def enable_stats(self):
+        """
+        Liga a contagem de operações (OperationStats); contadores zerados.
+        """
+        self.counters = OperationStats()
+
+    def disable_stats(self):
+        self.counters = None
+
+    def stats(self):
+        """
+        Cópia dos contadores (nós visitados, comparações, buscas de
+        sucessor). Exige BinarySearchTree(instrument=True) ou enable_stats().
+        """
+        if self.counters is None:
+            raise ValueError("stats exige BinarySearchTree(instrument=True) ou enable_stats()")
+        return self.counters.snapshot()
+
+    def reset_stats(self):
+        if self.counters is None:
+            raise ValueError("stats exige BinarySearchTree(instrument=True) ou enable_stats()")
+        self.counters.reset()
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Gerador de pares (chave, dados) em ordem, opcionalmente limitado
+        a lo <= chave <= hi. Pode ser interrompido a qualquer momento.
+        """
+        return inorder(self.root, lo, hi, reverse)
+
+    def _index_add(self, key, data):
+        # se um índice recusar o produto, desfaz nos que já o receberam
+        done = []
+        try:
+            for index in self.indexes:
+                index.add(key, data)
+                done.append(index)
+        except Exception:
+            for index in done:
+                index.remove(key, data)
+            raise
+
+    def _index_remove(self, key, data):
+        for index in self.indexes:
+            index.remove(key, data)
+
     def _min_value_node(self, node):
 
         current = node
         while current.left is not None :
             current = current.left
         return current
-
-
-
-
@@ -0,0 +1,238 @@
+from collections import OrderedDict
+from itertools import islice
+
+from src.filters import filter_products
+
+
+class LRUCache:
+    """
+    Cache limitado a `capacity` entradas; ao encher, descarta a usada há
+    mais tempo. Conta acertos, faltas e descartes.
+    """
+
+    def __init__(self, capacity=4096):
+        if capacity <= 0:
+            raise ValueError("capacity precisa ser positiva")
+
+        self.capacity = capacity
+        self.entries = OrderedDict()  # da menos para a mais recente
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = value
+
+    def invalidate(self, key):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "capacity": self.capacity,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# marca "chave ausente" no cache (None é um resultado válido de search)
+_ABSENT = object()
+
+
+class CachedTree:
+    """
+    Cache LRU de leitura na frente de tree.search (BinarySearchTree ou
+    AVLTree). Buscas repetidas não descem pela árvore; chaves ausentes
+    também ficam em cache.
+
+    As escritas precisam passar por aqui: insert invalida a chave e delete
+    invalida a chave e, quando o nó tem dois filhos, também a do sucessor,
+    cujo key/data é copiado para outro nó pela remoção. O resto da API
+    (items, get_height, indexes, ...) é repassado para a árvore.
+    """
+
+    def __init__(self, tree, capacity=4096):
+        self.tree = tree
+        self.cache = LRUCache(capacity)
+
+    def __getattr__(self, name):
+        return getattr(self.tree, name)
+
+    def search(self, key):
+        # caminho do acerto sem chamadas extras (é o caso comum)
+        cache = self.cache
+        try:
+            node = cache.entries[key]
+        except KeyError:
+            cache.misses += 1
+            node = self.tree.search(key)
+            cache.put(key, node)
+            return node
+
+        cache.entries.move_to_end(key)
+        cache.hits += 1
+        return node
+
+    def search_many(self, keys):
+        keys = keys if isinstance(keys, list) else list(keys)
+        cache = self.cache
+
+        results = [cache.get(key, _ABSENT) for key in keys]
+        missing = [key for key, node in zip(keys, results) if node is _ABSENT]
+        if not missing:
+            return results
+
+        found = dict(zip(missing, self.tree.search_many(missing)))
+        for key, node in found.items():
+            cache.put(key, node)
+        return [found[key] if node is _ABSENT else node for key, node in zip(keys, results)]
+
+    def insert(self, key, data):
+        self.cache.invalidate(key)
+        return self.tree.insert(key, data)
+
+    def delete(self, key):
+        node = self.tree.search(key)
+        if node is not None and node.left is not None and node.right is not None:
+            # sucessor em ordem: o par logo depois da própria chave
+            successor = next(islice(self.tree.items(lo=key), 1, None), None)
+            if successor is not None:
+                self.cache.invalidate(successor[0])
+        self.cache.invalidate(key)
+        return self.tree.delete(key)
+
+    def insert_many(self, items):
+        items = list(items)
+        for key, _ in items:
+            self.cache.invalidate(key)
+        return self.tree.insert_many(items)
+
+    def delete_many(self, keys):
+        if not hasattr(self.tree, "delete_many"):
+            # BinarySearchTree não tem lote: um delete por chave, cada um
+            # invalidando só o que mexe
+            return sum(self.delete(key) for key in set(keys))
+
+        # remoções em sequência movem sucessores de nó: mais simples esvaziar
+        self.cache.clear()
+        return self.tree.delete_many(keys)
+
+    def stats(self):
+        return self.cache.stats()
+
+
+class FilterCache:
+    """
+    Cache de resultados de filter_products para uma árvore (BST ou AVL).
+
+    A chave é a tupla normalizada dos filtros (0 e None valem "sem
+    filtro", como em product_matches). Cada resultado vale enquanto
+    tree.version não mudar: a primeira consulta depois de um insert/delete
+    descarta o cache inteiro.
+
+    Memória limitada por `max_entries` consultas e `max_items` produtos
+    referenciados no total; ao passar de um dos dois, sai a consulta usada
+    há mais tempo. Resultados maiores que max_items nem entram.
+    """
+
+    def __init__(self, tree, max_entries=256, max_items=100_000):
+        self.tree = tree
+        self.max_entries = max_entries
+        self.max_items = max_items
+
+        self.entries = OrderedDict()  # chave -> tupla de produtos
+        self.items = 0                # produtos somados em todas as entradas
+        self.version = tree.version
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def filter(self, category=None, max_price=None, min_rating=None, min_price=None, limit=None):
+        """
+        Mesmo resultado de filter_products(tree.root, ..., indexes=tree.indexes).
+        Devolve uma lista nova a cada chamada (alterá-la não afeta o cache).
+        """
+        if self.tree.version != self.version:
+            if self.entries:
+                self.invalidations += 1
+            self.clear()
+            self.version = self.tree.version
+
+        key = (category or None, max_price or None, min_rating or None, min_price or None, limit)
+
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return list(result)
+
+        self.misses += 1
+        found = filter_products(
+            self.tree.root, category, max_price, min_rating,
+            indexes=self.tree.indexes, min_price=min_price, limit=limit,
+        )
+        self._store(key, tuple(found))
+        return found
+
+    def _store(self, key, result):
+        if len(result) > self.max_items:
+            return
+
+        self.entries[key] = result
+        self.items += len(result)
+
+        while len(self.entries) > self.max_entries or self.items > self.max_items:
+            _, evicted = self.entries.popitem(last=False)
+            self.items -= len(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.items = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self.entries),
+            "items": self.items,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
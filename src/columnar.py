@@ -0,0 +1,123 @@
+import numpy as np
+
+
+class ColumnarProducts:
+    """
+    Cópia colunar do catálogo: id, preço, avaliação e estoque em arrays
+    NumPy e a categoria como código inteiro pequeno. Os filtros viram
+    máscaras booleanas avaliadas de uma vez sobre todas as linhas.
+
+    A ordem das linhas é a da fonte (from_tree usa a mesma DFS em
+    pré-ordem de filter_products). É um retrato: depois de alterar a
+    árvore, reconstrua o store.
+    """
+
+    def __init__(self, keys, products):
+        self.products = list(products)
+        n = len(self.products)
+
+        self.categories = []       # código -> nome
+        self.category_codes = {}   # nome -> código
+        codes = np.empty(n, dtype=np.int16)
+        for i, product in enumerate(self.products):
+            category = product.get("category")
+            code = self.category_codes.get(category)
+            if code is None:
+                code = self.category_codes[category] = len(self.categories)
+                self.categories.append(category)
+            codes[i] = code
+
+        self.category = codes
+        self.ids = np.fromiter(keys, dtype=np.int64, count=n)
+        self.price = np.fromiter(
+            (p.get("price", np.nan) for p in self.products), dtype=np.float64, count=n
+        )
+        self.rating = np.fromiter(
+            (p.get("rating", np.nan) for p in self.products), dtype=np.float64, count=n
+        )
+        self.stock = np.fromiter(
+            (p.get("stock", 0) for p in self.products), dtype=np.int64, count=n
+        )
+
+    @classmethod
+    def from_columns(cls, ids, category, categories, price, rating, stock, products):
+        """
+        Monta o store direto de arrays, sem passar por dicts. `category`
+        traz códigos em `categories`; `products` é qualquer sequência com
+        as linhas, usada só por filter.
+        """
+        store = cls.__new__(cls)
+        store.products = products
+        store.categories = list(categories)
+        store.category_codes = {name: code for code, name in enumerate(store.categories)}
+        store.category = np.asarray(category, dtype=np.int16)
+        store.ids = np.asarray(ids, dtype=np.int64)
+        store.price = np.asarray(price, dtype=np.float64)
+        store.rating = np.asarray(rating, dtype=np.float64)
+        store.stock = np.asarray(stock, dtype=np.int64)
+        return store
+
+    @classmethod
+    def from_products(cls, products):
+        products = list(products)
+        return cls((p["id"] for p in products), products)
+
+    @classmethod
+    def from_tree(cls, root):
+        keys = []
+        products = []
+
+        stack = [root] if root else []
+        while stack:
+            current = stack.pop()
+            keys.append(current.key)
+            products.append(current.data)
+            if current.right:
+                stack.append(current.right)
+            if current.left:
+                stack.append(current.left)
+
+        return cls(keys, products)
+
+    def __len__(self):
+        return len(self.products)
+
+    def mask(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Máscara booleana com as mesmas regras de product_matches
+        (filtros com valor falso são ignorados).
+        """
+        mask = np.ones(len(self.products), dtype=bool)
+
+        if category:
+            code = self.category_codes.get(category)
+            if code is None:
+                return np.zeros(len(self.products), dtype=bool)
+            mask &= self.category == code
+
+        if max_price:
+            mask &= self.price <= max_price
+
+        if min_price:
+            mask &= self.price >= min_price
+
+        if min_rating:
+            mask &= self.rating >= min_rating
+
+        return mask
+
+    def filter_ids(self, category=None, max_price=None, min_rating=None, min_price=None):
+        return self.ids[self.mask(category, max_price, min_rating, min_price)]
+
+    def filter(self, category=None, max_price=None, min_rating=None, min_price=None):
+        rows = np.flatnonzero(self.mask(category, max_price, min_rating, min_price))
+        products = self.products
+        return [products[i] for i in rows.tolist()]
+
+
+def filter_products_columnar(store, category=None, max_price=None, min_rating=None, min_price=None):
+    """
+    Variante vetorizada de filter_products sobre um ColumnarProducts.
+    Com o store montado por from_tree, o resultado é igual ao da DFS.
+    """
+    return store.filter(category, max_price, min_rating, min_price)
@@ -0,0 +1,297 @@
+import sys
+from array import array
+
+from src.node import Node
+
+
+NIL = 0  # posição 0 é sentinela: altura 0, sem filhos
+
+
+class CompactAVLTree:
+    """
+    AVL com a mesma API de AVLTree (insert/search/delete/get_height/
+    is_balanced), mas sem um objeto Python por nó: chave, filhos e altura
+    ficam em arrays tipados paralelos e os filhos são índices inteiros.
+    Posições liberadas por delete vão para uma free list e são reusadas.
+
+    As chaves precisam ser inteiros de 64 bits (IDs de produto). search
+    devolve um Node avulso com key/data, como os nós das outras árvores.
+    """
+
+    def __init__(self):
+        self.keys = array('q', [0])
+        self.left = array('i', [NIL])
+        self.right = array('i', [NIL])
+        self.height = array('b', [0])
+        self.data = [None]
+        self.free = []   # posições livres para reuso
+        self.root = NIL
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _new_node(self, key, data):
+        if self.free:
+            i = self.free.pop()
+            self.keys[i] = key
+            self.left[i] = NIL
+            self.right[i] = NIL
+            self.height[i] = 1
+            self.data[i] = data
+        else:
+            i = len(self.data)
+            self.keys.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.height.append(1)
+            self.data.append(data)
+
+        self.count += 1
+        return i
+
+    def _free_node(self, i):
+        self.data[i] = None  # solta a referência ao produto
+        self.free.append(i)
+        self.count -= 1
+
+    def _update_height(self, i):
+        height = self.height
+        left_height = height[self.left[i]]
+        right_height = height[self.right[i]]
+        height[i] = 1 + (left_height if left_height > right_height else right_height)
+
+    def _get_balance(self, i):
+        return self.height[self.right[i]] - self.height[self.left[i]]
+
+    def rotate_right(self, z):
+
+        y = self.left[z]
+
+        # Realizar rotação
+        self.left[z] = self.right[y]
+        self.right[y] = z
+
+        # Atualizar alturas
+        self._update_height(z)
+        self._update_height(y)
+
+        return y
+
+    def rotate_left(self, z):
+
+        y = self.right[z]
+
+        # Realizar rotação
+        self.right[z] = self.left[y]
+        self.left[y] = z
+
+        # Atualizar alturas
+        self._update_height(z)
+        self._update_height(y)
+
+        return y
+
+    def _rebalance(self, i):
+        balance = self._get_balance(i)
+
+        # Direita pesada (RR ou RL)
+        if balance > 1:
+            if self._get_balance(self.right[i]) < 0:
+                self.right[i] = self.rotate_right(self.right[i])
+            return self.rotate_left(i)
+
+        # Esquerda pesada (LL ou LR)
+        if balance < -1:
+            if self._get_balance(self.left[i]) > 0:
+                self.left[i] = self.rotate_left(self.left[i])
+            return self.rotate_right(i)
+
+        return i
+
+    def _rebalance_path(self, path):
+        # mesmo algoritmo de AVLTree._rebalance_path, sobre índices
+        left = self.left
+        right = self.right
+        height = self.height
+
+        for pos in range(len(path) - 1, -1, -1):
+            i = path[pos]
+            old_height = height[i]
+
+            self._update_height(i)
+            new_root = self._rebalance(i)
+
+            if new_root != i:
+                if pos == 0:
+                    self.root = new_root
+                else:
+                    parent = path[pos - 1]
+                    if left[parent] == i:
+                        left[parent] = new_root
+                    else:
+                        right[parent] = new_root
+
+            if height[new_root] == old_height:
+                break
+
+
+    def insert(self, key, data):
+        # devolve True se a chave é nova, False se só atualizou os dados
+
+        if self.root == NIL:
+            self.root = self._new_node(key, data)
+            return True
+
+        keys = self.keys
+        left = self.left
+        right = self.right
+
+        path = []
+        i = self.root
+        while i != NIL:
+            path.append(i)
+            if key < keys[i]:
+                i = left[i]
+            elif key > keys[i]:
+                i = right[i]
+            else:
+                # Chave duplicada - atualiza os dados
+                self.data[i] = data
+                return False
+
+        parent = path[-1]
+        if key < keys[parent]:
+            left[parent] = self._new_node(key, data)
+        else:
+            right[parent] = self._new_node(key, data)
+
+        self._rebalance_path(path)
+        return True
+
+
+    def search(self, key):
+
+        keys = self.keys
+        left = self.left
+        right = self.right
+
+        i = self.root
+        while i != NIL:
+            if key < keys[i]:
+                i = left[i]
+            elif key > keys[i]:
+                i = right[i]
+            else:
+                return Node(key, self.data[i])
+
+        return None
+
+
+    def delete(self, key):
+        # devolve True se a chave existia e foi removida
+
+        keys = self.keys
+        left = self.left
+        right = self.right
+
+        path = []
+        i = self.root
+        while i != NIL and keys[i] != key:
+            path.append(i)
+            if key < keys[i]:
+                i = left[i]
+            else:
+                i = right[i]
+
+        if i == NIL:
+            return False  # chave não existe
+
+        # Nó com dois filhos: copia o sucessor e remove a posição dele
+        if left[i] != NIL and right[i] != NIL:
+            path.append(i)
+            successor = right[i]
+            while left[successor] != NIL:
+                path.append(successor)
+                successor = left[successor]
+
+            keys[i] = keys[successor]
+            self.data[i] = self.data[successor]
+            i = successor
+
+        child = left[i] if left[i] != NIL else right[i]
+        self._free_node(i)
+
+        if not path:
+            self.root = child
+            return True
+
+        parent = path[-1]
+        if left[parent] == i:
+            left[parent] = child
+        else:
+            right[parent] = child
+
+        self._rebalance_path(path)
+        return True
+
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Gerador de pares (chave, dados) em ordem, com limites inclusivos
+        opcionais; mesmo percurso podado de src.inorder, sobre índices.
+        """
+        keys = self.keys
+        first = self.right if reverse else self.left
+        second = self.left if reverse else self.right
+
+        stack = []
+        i = self.root
+        while stack or i != NIL:
+            while i != NIL:
+                key = keys[i]
+                if (reverse and hi is not None and key > hi) or \
+                        (not reverse and lo is not None and key < lo):
+                    i = second[i]  # nó e subárvore do lado "first" fora da faixa
+                else:
+                    stack.append(i)
+                    i = first[i]
+
+            if not stack:
+                return
+
+            i = stack.pop()
+            key = keys[i]
+            if (not reverse and hi is not None and key > hi) or \
+                    (reverse and lo is not None and key < lo):
+                return
+
+            yield key, self.data[i]
+            i = second[i]
+
+    def get_height(self):
+
+        return self.height[self.root]
+
+    def is_balanced(self):
+
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            if abs(self._get_balance(i)) > 1:
+                return False
+            if self.left[i] != NIL:
+                stack.append(self.left[i])
+            if self.right[i] != NIL:
+                stack.append(self.right[i])
+
+        return True
+
+    def nbytes(self):
+        """
+        Bytes ocupados pela estrutura (arrays + lista de dados), sem contar
+        os produtos em si.
+        """
+        arrays = (self.keys, self.left, self.right, self.height)
+        total = sum(a.buffer_info()[1] * a.itemsize for a in arrays)
+        return total + sys.getsizeof(self.data) + sys.getsizeof(self.free)
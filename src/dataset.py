@@ -1,59 +1,217 @@
+import math
 import random
 import string
 
 
-def generate_products(n=1000):
+CATEGORIES = ["Eletrônicos", "Roupas", "Livros", "Casa", "Esporte", "Alimentos"]
+NAME_PREFIXES = ["Ultra", "Pro", "Smart", "Eco", "Max", "Prime"]
+NAME_ITEMS = ["Phone", "Notebook", "Camisa", "Livro", "Tênis", "Cadeira", "Relógio", "Fone", "Mochila"]
+NAME_ALPHABET = string.ascii_uppercase + string.digits
+
+PRICE_MIN = 5.0
+PRICE_MAX = 3000.0
+
+ID_DISTRIBUTIONS = ("random", "sequential", "clustered")
+
+
+def generate_products(n=1000, seed=None):
     """
     Gera um dataset grande de produtos simulados.
 
     - n: quantidade de produtos
-    - IDs são aleatórios (evita árvore perfeita)
+    - seed: semente para repetir o mesmo dataset (None usa o módulo random)
+    - IDs são aleatórios e únicos em [1, 10n] (evita árvore perfeita)
     - Dados simulam um cenário real de e-commerce
     """
+    rng = random.Random(seed) if seed is not None else random
 
-    products = []
-    used_ids = set()
+    # amostra sem reposição: IDs únicos sem sortear de novo os repetidos
+    product_ids = rng.sample(range(1, n * 10 + 1), n)
 
-    while len(products) < n:
-        product_id = random.randint(1, n * 10)
+    return [
+        {
+            "id": product_id,
+            "name": generate_product_name(rng),
+            "category": rng.choice(CATEGORIES),
+            "price": round(rng.uniform(PRICE_MIN, PRICE_MAX), 2),
+            "stock": rng.randint(0, 500),
+            "rating": round(rng.uniform(1.0, 5.0), 1)
+        }
+        for product_id in product_ids
+    ]
 
-        # garante IDs únicos
-        if product_id in used_ids:
-            continue
-        used_ids.add(product_id)
 
-        product = {
-            "id": product_id,
-            "name": generate_product_name(),
-            "category": random.choice([
-                "Eletrônicos",
-                "Roupas",
-                "Livros",
-                "Casa",
-                "Esporte",
-                "Alimentos"
-            ]),
-            "price": round(random.uniform(5, 3000), 2),
-            "stock": random.randint(0, 500),
-            "rating": round(random.uniform(1.0, 5.0), 1)
+def generate_product_name(rng=random):
+    """
+    Gera nomes de produtos aleatórios.
+    """
+    prefix = rng.choice(NAME_PREFIXES)
+    item = rng.choice(NAME_ITEMS)
+    suffix = ''.join(rng.choices(NAME_ALPHABET, k=4))
+
+    return f"{prefix} {item} {suffix}"
+
+
+# Geração vetorizada (NumPy) para datasets de milhões de produtos.
+#
+# Os dados saem em colunas (dict de arrays): "id", "category" (código em
+# CATEGORIES), "price", "rating", "stock" e o nome em três colunas
+# ("name_prefix", "name_item", "name_suffix"), montado só quando uma
+# linha vira dict.
+
+def iter_columns(n, chunk_size=1_000_000, seed=None, ids="random", category_skew=1.0,
+                 price_median=100.0, price_sigma=1.0, cluster_size=1000):
+    """
+    Gera os n produtos em blocos de até `chunk_size` linhas (um dict de
+    arrays por bloco).
+
+    - ids: "random" (únicos em [1, 10n], ordem aleatória), "sequential"
+      (1..n em ordem) ou "clustered" (sequências de `cluster_size` IDs
+      consecutivos, com os blocos espalhados em [1, 10n])
+    - category_skew: expoente Zipf da popularidade das categorias, na
+      ordem de CATEGORIES (0 = uniforme)
+    - price_median / price_sigma: preço log-normal, cortado em
+      [PRICE_MIN, PRICE_MAX]
+
+    A mesma seed com o mesmo chunk_size repete o dataset. Só a ordem dos
+    IDs aleatórios/agrupados é sorteada de uma vez (8 bytes por produto);
+    o resto existe um bloco por vez.
+    """
+    import numpy as np
+
+    if ids not in ID_DISTRIBUTIONS:
+        raise ValueError(f"ids precisa ser um de {ID_DISTRIBUTIONS}, não {ids!r}")
+
+    chunks = max(1, math.ceil(n / chunk_size))
+    id_sequence, *chunk_sequences = np.random.SeedSequence(seed).spawn(chunks + 1)
+    id_rng = np.random.default_rng(id_sequence)
+
+    if ids == "random":
+        # cada produto fica com uma faixa de 10 IDs; o sorteio só escolhe a
+        # ordem das faixas e a posição dentro de cada uma
+        slots = id_rng.permutation(n)
+    elif ids == "clustered":
+        cluster_slots = id_rng.permutation(max(1, math.ceil(n / cluster_size)))
+
+    weights = 1.0 / np.arange(1, len(CATEGORIES) + 1) ** category_skew
+    weights /= weights.sum()
+
+    alphabet = np.frombuffer(NAME_ALPHABET.encode(), dtype="S1")
+
+    for chunk, sequence in enumerate(chunk_sequences):
+        start = chunk * chunk_size
+        stop = min(n, start + chunk_size)
+        size = stop - start
+        rng = np.random.default_rng(sequence)
+
+        if ids == "random":
+            product_ids = slots[start:stop] * 10 + rng.integers(1, 11, size)
+        elif ids == "sequential":
+            product_ids = np.arange(start + 1, stop + 1, dtype=np.int64)
+        else:
+            rows = np.arange(start, stop, dtype=np.int64)
+            product_ids = cluster_slots[rows // cluster_size] * (10 * cluster_size) + rows % cluster_size + 1
+
+        price = rng.lognormal(math.log(price_median), price_sigma, size)
+        np.clip(price, PRICE_MIN, PRICE_MAX, out=price)
+
+        yield {
+            "id": product_ids.astype(np.int64, copy=False),
+            "category": rng.choice(len(CATEGORIES), size, p=weights).astype(np.int16),
+            "price": np.round(price, 2),
+            "rating": np.round(rng.uniform(1.0, 5.0, size), 1),
+            "stock": rng.integers(0, 501, size),
+            "name_prefix": rng.integers(0, len(NAME_PREFIXES), size, dtype=np.int8),
+            "name_item": rng.integers(0, len(NAME_ITEMS), size, dtype=np.int8),
+            "name_suffix": alphabet[rng.integers(0, len(alphabet), (size, 4))].view("S4").ravel(),
         }
 
-        products.append(product)
 
-    return products
+def columns_to_products(columns):
+    """
+    Converte um bloco de colunas em lista de dicts (mesmo formato de
+    generate_products).
+    """
+    names = [
+        f"{NAME_PREFIXES[prefix]} {NAME_ITEMS[item]} {suffix.decode()}"
+        for prefix, item, suffix in zip(
+            columns["name_prefix"].tolist(), columns["name_item"].tolist(), columns["name_suffix"].tolist()
+        )
+    ]
 
+    return [
+        {"id": product_id, "name": name, "category": CATEGORIES[category],
+         "price": price, "stock": stock, "rating": rating}
+        for product_id, name, category, price, stock, rating in zip(
+            columns["id"].tolist(), names, columns["category"].tolist(),
+            columns["price"].tolist(), columns["stock"].tolist(), columns["rating"].tolist(),
+        )
+    ]
 
-def generate_product_name():
+
+class ProductRows:
     """
-    Gera nomes de produtos aleatórios.
+    Sequência de produtos sobre colunas: cada linha vira dict só quando é
+    acessada (um dict novo a cada acesso).
     """
-    prefix = random.choice([
-        "Ultra", "Pro", "Smart", "Eco", "Max", "Prime"
-    ])
-    item = random.choice([
-        "Phone", "Notebook", "Camisa", "Livro", "Tênis",
-        "Cadeira", "Relógio", "Fone", "Mochila"
-    ])
-    suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
 
-    return f"{prefix} {item} {suffix}"
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["id"])
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        return columns_to_products({name: column[i:i + 1 or None] for name, column in self.columns.items()})[0]
+
+    def __iter__(self):
+        step = 100_000
+        for start in range(0, len(self), step):
+            yield from columns_to_products(
+                {name: column[start:start + step] for name, column in self.columns.items()}
+            )
+
+
+def columns_to_columnar(columns):
+    """
+    ColumnarProducts montado direto das colunas, sem criar dicts.
+    """
+    from src.columnar import ColumnarProducts
+
+    return ColumnarProducts.from_columns(
+        columns["id"], columns["category"], CATEGORIES,
+        columns["price"], columns["rating"], columns["stock"], ProductRows(columns),
+    )
+
+
+def iter_products(n, chunk_size=1_000_000, seed=None, columnar=False, **options):
+    """
+    Como iter_columns, mas cada bloco sai como lista de dicts ou, com
+    columnar=True, como ColumnarProducts. O dataset inteiro nunca fica
+    na memória de uma vez.
+    """
+    convert = columns_to_columnar if columnar else columns_to_products
+    for columns in iter_columns(n, chunk_size, seed, **options):
+        yield convert(columns)
+
+
+def generate_products_fast(n=1000, seed=None, columnar=False, chunk_size=1_000_000, **options):
+    """
+    Versão vetorizada de generate_products (opções de iter_columns).
+    Com columnar=True devolve um ColumnarProducts, que é o que gera
+    dezenas de milhões de produtos em segundos; a lista de dicts custa
+    o mesmo que montar os dicts um a um.
+    """
+    if not columnar:
+        products = []
+        for chunk in iter_products(n, chunk_size, seed, **options):
+            products.extend(chunk)
+        return products
+
+    import numpy as np
+
+    chunks = list(iter_columns(n, chunk_size, seed, **options))
+    columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+    return columns_to_columnar(columns)
@@ -0,0 +1,30 @@
+from itertools import islice
+
+def dfs_iter(root):
+    """
+    Versão geradora da DFS (pré-ordem com pilha): devolve as chaves sob
+    demanda. Memória O(altura da árvore) em vez de O(n).
+    """
+
+    if root is None:
+        return
+
+    stack = [root]
+
+    while stack:
+        current = stack.pop()      # remove do topo da pilha
+        yield current.key
+
+        # primeiro o filho direito, depois o esquerdo
+        # para que o esquerdo seja processado primeiro
+        if current.right:
+            stack.append(current.right)
+
+        if current.left:
+            stack.append(current.left)
+
+
+def dfs(root, limit=None):
+
+    # limit: para depois de visitar essa quantidade de nós
+    return list(islice(dfs_iter(root), limit))
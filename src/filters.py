@@ -1,11 +1,88 @@
-def filter_products(root, category = None, max_price = None, min_rating = None):
-    
-    # usar DFS para filtrar produtos na árvore
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+
+from src.indexes import CategoryIndex, PriceIndex, RatingIndex
+from src.search import search_many
+
+
+# abaixo disso, subir processos custa mais que a varredura serial
+PARALLEL_MIN_NODES = 50_000
+
+# subárvores por worker: folga para equilibrar subárvores de tamanhos diferentes
+PARALLEL_TASKS_PER_WORKER = 4
+
+# aberturas de nós por subárvore pedida antes de desistir da divisão (uma
+# BST degenerada nunca se divide: a varredura fica serial)
+SPLIT_MAX_EXPANSIONS_PER_PART = 4
+
+
+def product_matches(product, category = None, max_price = None, min_rating = None, min_price = None):
+
+    # verifica se o user definiu uma categoria para filtrar
+    if category and product.get("category") != category:
+        return False
+
+    # verifica preco maximo
+    if max_price and product.get("price") > max_price:
+        return False
+
+    # verifica preco minimo
+    if min_price and product.get("price") < min_price:
+        return False
+
+    # verifica nota minima
+    if min_rating and product.get("rating") < min_rating:
+        return False
+
+    return True
+
+
+def _index_candidates(indexes, category, max_price, min_rating, min_price):
+
+    # com índices secundários (tree.indexes), usa o de menor estimativa de
+    # candidatos (contagem barata, sem montar listas) e só ele é percorrido,
+    # sob demanda; None quando nenhum índice ajuda nesta consulta
+    best = None
+    best_estimate = None
+    for index in indexes or ():
+        estimate = index.estimate(
+            category=category, max_price=max_price, min_rating=min_rating, min_price=min_price
+        )
+        if estimate is not None and (best is None or estimate < best_estimate):
+            best, best_estimate = index, estimate
+
+    if best is None:
+        return None
+    return best.lookup(category=category, max_price=max_price, min_rating=min_rating, min_price=min_price)
+
+
+def filter_products_iter(root, category = None, max_price = None, min_rating = None, indexes = None, min_price = None):
+    """
+    Versão geradora de filter_products: entrega cada produto assim que
+    ele passa no filtro, então quem só quer a primeira página pode parar
+    cedo. A varredura guarda só a pilha da DFS (O(altura)).
+    """
+
+    candidates = _index_candidates(indexes, category, max_price, min_rating, min_price)
+    return _filter_iter(root, candidates, category, max_price, min_rating, min_price)
+
+
+def _filter_iter(root, candidates, category, max_price, min_rating, min_price):
+
+    # com índice, só os candidatos são testados; a ordem segue a do índice
+    if candidates is not None:
+        for product in candidates:
+            if product_matches(product, category, max_price, min_rating, min_price):
+                yield product
+        return
+
+    # sem índice aplicável: usar DFS para filtrar produtos na árvore
 
     if root is None:
-        return []
-    
-    results =[]
+        return
+
     stack = [root]
 
     while stack:
@@ -14,26 +91,225 @@ def filter_products(root, category = None, max_price = None, min_rating = None):
         product = current.data #acessando dados do produto
 
         # lógica de filtro
-        match = True
-
-        # verifica se o user definiu uma categoria para filtrar
-        if category and product.get("category") != category:
-            match = False
-        
-        # verifica preco maximo
-        if max_price and product.get("price") > max_price:
-            match = False
-        
-        # verifica nota minima
-        if min_rating and product.get("rating") < min_rating:
-            match = False
-        
-        if match:
-            results.append(product)
+        if product_matches(product, category, max_price, min_rating, min_price):
+            yield product
 
         if current.right:
             stack.append(current.right)
         if current.left:
             stack.append(current.left)
-    
+
+
+def filter_products(root, category = None, max_price = None, min_rating = None, indexes = None, min_price = None, limit = None, workers = None):
+
+    # workers: divide a varredura entre processos (mesmo resultado, mesma
+    # ordem); só vale para varredura completa de árvore grande, sem índice
+    # aplicável nem limit (que para cedo), e onde há fork
+    candidates = _index_candidates(indexes, category, max_price, min_rating, min_price)
+
+    if (
+        workers and workers > 1 and limit is None and root is not None
+        and candidates is None
+        and "fork" in multiprocessing.get_all_start_methods()
+        and _has_at_least(root, PARALLEL_MIN_NODES)
+    ):
+        tasks = _split_tasks(root, workers * PARALLEL_TASKS_PER_WORKER)
+        if tasks is not None:
+            return _parallel_filter(root, workers, tasks, category, max_price, min_rating, min_price)
+
+    # limit: para a busca assim que encontrar essa quantidade de produtos
+    return list(islice(
+        _filter_iter(root, candidates, category, max_price, min_rating, min_price),
+        limit,
+    ))
+
+
+def _has_at_least(root, n):
+    # conta nós até n (para cedo), sem depender de altura/tamanho nos nós
+    stack = [root]
+    seen = 0
+    while stack:
+        node = stack.pop()
+        seen += 1
+        if seen >= n:
+            return True
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    return False
+
+
+def _split_tasks(root, parts):
+    """
+    Divide a árvore em ~parts subárvores, abrindo sempre a mais alta (ou,
+    em nós sem altura, a mais rasa). Devolve a lista em pré-ordem de
+    ("node", nó, caminho) para os nós do topo, testados no processo
+    principal, e ("subtree", nó, caminho) para as subárvores; o caminho
+    ("L"/"R" desde a raiz) localiza a subárvore no worker.
+
+    Devolve None quando a árvore não se divide em parts subárvores dentro
+    de SPLIT_MAX_EXPANSIONS_PER_PART * parts aberturas (ex.: BST
+    degenerada, em que cada abertura só revela um filho).
+    """
+    def priority(node, depth):
+        height = getattr(node, "height", None)
+        return -height if height is not None else depth
+
+    tie = count()
+    frontier = [(priority(root, 0), next(tie), root, 0)]
+    expanded = set()   # id() dos nós abertos
+    leaves = 0
+    budget = SPLIT_MAX_EXPANSIONS_PER_PART * parts
+
+    while frontier and len(frontier) + leaves < parts:
+        if not budget:
+            return None
+
+        _, _, node, depth = heapq.heappop(frontier)
+        if node.left is None and node.right is None:
+            leaves += 1
+            continue  # folha: fica como está
+
+        budget -= 1
+        expanded.add(id(node))
+        for child in (node.left, node.right):
+            if child is not None:
+                heapq.heappush(frontier, (priority(child, depth + 1), next(tie), child, depth + 1))
+
+    if len(frontier) + leaves < parts:
+        return None
+
+    # pré-ordem sobre o topo aberto: mesma ordem da DFS serial; os caminhos
+    # têm no máximo `budget` passos
+    tasks = []
+    stack = [(root, "")]
+    while stack:
+        node, path = stack.pop()
+        if id(node) not in expanded:
+            tasks.append(("subtree", node, path))
+            continue
+
+        tasks.append(("node", node, path))
+        if node.right is not None:
+            stack.append((node.right, path + "R"))
+        if node.left is not None:
+            stack.append((node.left, path + "L"))
+
+    return tasks
+
+
+# raiz herdada pelos workers no fork (sem serializar a árvore)
+_parallel_root = None
+
+
+def _init_parallel_worker(root):
+    global _parallel_root
+    _parallel_root = root
+
+
+def _filter_subtree_keys(path, category, max_price, min_rating, min_price):
+    # roda no worker: DFS pré-ordem na subárvore, devolve só as chaves
+    node = _parallel_root
+    for step in path:
+        node = node.left if step == "L" else node.right
+
+    keys = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if product_matches(current.data, category, max_price, min_rating, min_price):
+            keys.append(current.key)
+        if current.right:
+            stack.append(current.right)
+        if current.left:
+            stack.append(current.left)
+    return keys
+
+
+def _parallel_filter(root, workers, tasks, category, max_price, min_rating, min_price):
+    context = multiprocessing.get_context("fork")
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context,
+        initializer=_init_parallel_worker, initargs=(root,),
+    ) as pool:
+        futures = [
+            pool.submit(_filter_subtree_keys, path, category, max_price, min_rating, min_price)
+            if kind == "subtree" else None
+            for kind, _, path in tasks
+        ]
+
+        # junta na ordem das tarefas: nós do topo testados aqui, chaves das
+        # subárvores convertidas de volta nos mesmos objetos de produto
+        results = []
+        for (kind, node, _), future in zip(tasks, futures):
+            if future is None:
+                if product_matches(node.data, category, max_price, min_rating, min_price):
+                    results.append(node.data)
+            else:
+                results.extend(found.data for found in search_many(node, future.result()))
+
     return results
+
+
+def top_k_products(tree, k, order_by = "price", category = None, max_price = None, min_rating = None, min_price = None):
+    """
+    Os k produtos mais baratos (order_by="price") ou melhor avaliados
+    (order_by="rating") entre os que passam nos filtros; empates pela
+    chave. Nunca materializa a lista completa de resultados:
+
+    - com PriceIndex/RatingIndex em tree.indexes, percorre o índice já na
+      ordem pedida e para no k-ésimo resultado (O(log n + visitados))
+    - senão, heap limitado a k sobre o balde da categoria (CategoryIndex)
+      ou sobre a árvore inteira: O(n log k)
+    """
+    if order_by not in ("price", "rating"):
+        raise ValueError(f"order_by inválido: {order_by!r}")
+    if k <= 0:
+        return []
+
+    cheapest = order_by == "price"
+    indexes = getattr(tree, "indexes", ())
+
+    category_index = next((i for i in indexes if isinstance(i, CategoryIndex)), None)
+    order_class = PriceIndex if cheapest else RatingIndex
+    order_index = next((i for i in indexes if isinstance(i, order_class)), None)
+
+    # categoria rara: percorrer o índice ordenado visitaria ~k * n / c
+    # produtos até achar k; se isso passa de c, o balde com heap é melhor
+    if order_index is not None and category and category_index is not None:
+        in_category = category_index.count(category)
+        if in_category == 0:
+            return []
+        if k * len(category_index) > in_category * in_category:
+            order_index = None
+
+    if order_index is not None:
+        if cheapest:
+            pairs = order_index.iter_items(min_price or None, max_price or None)
+        else:
+            pairs = order_index.iter_items(lo=min_rating or None, reverse=True)
+
+        matches = (
+            product for _, product in pairs
+            if product_matches(product, category, max_price, min_rating, min_price)
+        )
+        return list(islice(matches, k))
+
+    if category and category_index is not None:
+        pairs = category_index.items(category)
+    else:
+        pairs = tree.items()
+
+    matches = (
+        (key, product) for key, product in pairs
+        if product_matches(product, category, max_price, min_rating, min_price)
+    )
+
+    if cheapest:
+        best = heapq.nsmallest(k, matches, key=lambda item: (item[1]["price"], item[0]))
+    else:
+        best = heapq.nlargest(k, matches, key=lambda item: (item[1]["rating"], item[0]))
+
+    return [product for _, product in best]
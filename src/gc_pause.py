@@ -0,0 +1,19 @@
+import gc
+from contextlib import contextmanager
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pausa o coletor cíclico durante o bloco (e o religa só se estava
+    ligado). Para trechos que só criam ou religam objetos em massa, como
+    montar árvores e (de)serializar snapshots: sem a pausa, o coletor
+    varre tudo de novo a cada poucos milhares de alocações.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_was_enabled:
+            gc.enable()
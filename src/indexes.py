@@ -0,0 +1,222 @@
+from src.avl_tree import AVLTree
+
+
+_MISSING = object()
+
+
+class CategoryIndex:
+    """
+    Índice secundário categoria -> produtos.
+
+    Fica sincronizado com a árvore via tree.attach_index(index): a árvore
+    chama add/remove a cada insert/delete. Em filter_products, uma consulta
+    com categoria passa a tocar só os produtos daquela categoria.
+    """
+
+    def __init__(self):
+        self.buckets = {}     # categoria -> {chave: produto}
+        self.categories = {}  # chave -> categoria em que o produto está
+
+    def add(self, key, data):
+        category = data.get("category")
+        old = self.categories.get(key, _MISSING)
+        if old is not _MISSING and old != category:
+            self._drop(key, old)
+
+        bucket = self.buckets.get(category)
+        if bucket is None:
+            bucket = self.buckets[category] = {}
+        bucket[key] = data
+        self.categories[key] = category
+
+    def remove(self, key, data):
+        # pelo balde em que o produto foi guardado: o dict pode ter mudado
+        # de categoria no lugar
+        category = self.categories.pop(key, _MISSING)
+        if category is not _MISSING:
+            self._drop(key, category)
+
+    def _drop(self, key, category):
+        bucket = self.buckets.get(category)
+        if bucket is None:
+            return
+
+        bucket.pop(key, None)
+        if not bucket:
+            del self.buckets[category]
+
+    def get(self, category):
+        bucket = self.buckets.get(category)
+        return list(bucket.values()) if bucket else []
+
+    def items(self, category):
+        """
+        Pares (chave, produto) da categoria, sem cópia.
+        """
+        bucket = self.buckets.get(category)
+        return bucket.items() if bucket else ()
+
+    def count(self, category):
+        bucket = self.buckets.get(category)
+        return len(bucket) if bucket else 0
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def estimate(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Quantos candidatos lookup entregaria (O(1)), ou None se o índice
+        não ajuda nesta consulta (sem filtro de categoria).
+        """
+        if not category:
+            return None
+        return self.count(category)
+
+    def lookup(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Candidatos para filter_products (sem cópia), ou None se o índice
+        não ajuda nesta consulta.
+        """
+        if not category:
+            return None
+        bucket = self.buckets.get(category)
+        return bucket.values() if bucket else ()
+
+
+class SortedIndex:
+    """
+    Base dos índices ordenados por um campo numérico do produto: uma
+    AVLTree com chave (valor, id), reaproveitando as rotações da árvore
+    principal. Faixas saem em O(log n + k), já ordenadas pelo campo.
+    Produtos sem o campo (None) não entram; valor que não se compara com
+    os demais (ex.: texto entre números) faz add levantar TypeError sem
+    alterar o índice.
+    """
+
+    field = None
+
+    def __init__(self):
+        # track_size: contagem de faixa em O(log n) para estimate
+        self.tree = AVLTree(track_size=True)
+
+        # id -> valor com que o produto foi indexado: o dict pode ter sido
+        # alterado no lugar antes de um novo insert, então remover relendo
+        # o campo acharia a entrada errada
+        self.values = {}
+
+    def add(self, key, data):
+        value = data.get(self.field)
+        old = self.values.get(key, _MISSING)
+
+        # produto sem o campo fica fora do índice (não passaria num filtro
+        # por esse campo de qualquer forma)
+        if value is None:
+            if old is not _MISSING:
+                self.remove(key, data)
+            return
+
+        # entra a entrada nova antes de sair a antiga: se o valor não se
+        # compara com os outros, insert falha e nada muda
+        self.tree.insert((value, key), data)
+        if old is not _MISSING and old != value:
+            self.tree.delete((old, key))
+        self.values[key] = value
+
+    def remove(self, key, data):
+        value = self.values.pop(key, _MISSING)
+        if value is not _MISSING:
+            self.tree.delete((value, key))
+
+    @staticmethod
+    def _bounds(lo, hi):
+        # limites de valor -> limites de chave (valor, id), inclusivos
+        return None if lo is None else (lo,), None if hi is None else (hi, float("inf"))
+
+    def iter_items(self, lo=None, hi=None, reverse=False):
+        """
+        Gera pares (id, produto) com lo <= valor <= hi em ordem do campo
+        (empates por id), sem materializar a faixa.
+        """
+        lo, hi = self._bounds(lo, hi)
+
+        for (_, key), product in self.tree.items(lo, hi, reverse):
+            yield key, product
+
+    def count(self, lo=None, hi=None):
+        """
+        Quantidade de produtos com lo <= valor <= hi, em O(log n).
+        """
+        return self.tree.count_range(*self._bounds(lo, hi))
+
+
+class PriceIndex(SortedIndex):
+    """
+    Índice secundário ordenado por preço, do mais barato para o mais caro.
+    """
+
+    field = "price"
+
+    def iter_range(self, min_price=None, max_price=None, reverse=False):
+        """
+        Gera os produtos com min_price <= preço <= max_price em ordem de
+        preço (limites opcionais), sem materializar a faixa.
+        """
+        for _, product in self.iter_items(min_price, max_price, reverse):
+            yield product
+
+    def range(self, min_price=None, max_price=None):
+        """
+        Produtos com min_price <= preço <= max_price (limites opcionais).
+        """
+        return list(self.iter_range(min_price, max_price))
+
+    def at_most(self, max_price):
+        return self.range(max_price=max_price)
+
+    def estimate(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Quantos candidatos lookup entregaria (O(log n)), ou None se a
+        consulta não tem filtro de preço.
+        """
+        if not max_price and not min_price:
+            return None
+        return self.count(min_price or None, max_price or None)
+
+    def lookup(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Candidatos para filter_products (gerados sob demanda), ou None se
+        a consulta não tem filtro de preço.
+        """
+        if not max_price and not min_price:
+            return None
+        return self.iter_range(min_price or None, max_price or None)
+
+
+class RatingIndex(SortedIndex):
+    """
+    Índice secundário ordenado por avaliação; usado por top_k_products
+    para "melhor avaliados" e por filtros de nota mínima.
+    """
+
+    field = "rating"
+
+    def at_least(self, min_rating):
+        return [product for _, product in self.iter_items(lo=min_rating)]
+
+    def estimate(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Quantos candidatos lookup entregaria (O(log n)), ou None se a
+        consulta não tem filtro de nota mínima.
+        """
+        if not min_rating:
+            return None
+        return self.count(lo=min_rating)
+
+    def lookup(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Candidatos para filter_products (gerados sob demanda), ou None se
+        a consulta não tem filtro de nota mínima.
+        """
+        if not min_rating:
+            return None
+        return (product for _, product in self.iter_items(lo=min_rating))
@@ -0,0 +1,53 @@
+def inorder(root, lo=None, hi=None, reverse=False):
+    """
+    Gera pares (chave, dados) em ordem de chave, sob demanda.
+
+    - lo / hi: limites inclusivos opcionais; subárvores fora da faixa
+      nem são visitadas, então uma faixa custa O(log n + k)
+    - reverse: do maior para o menor
+    - memória O(altura): a pilha só guarda o caminho atual
+
+    Serve para qualquer árvore com nós key/data/left/right (BST e AVL).
+    Não altere a árvore enquanto consome o gerador.
+    """
+    stack = []
+    node = root
+
+    if not reverse:
+        while stack or node is not None:
+            # desce pela esquerda, pulando nós abaixo de lo
+            while node is not None:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+
+            if not stack:
+                return
+
+            node = stack.pop()
+            if hi is not None and node.key > hi:
+                return
+
+            yield node.key, node.data
+            node = node.right
+    else:
+        while stack or node is not None:
+            # espelho: desce pela direita, pulando nós acima de hi
+            while node is not None:
+                if hi is not None and node.key > hi:
+                    node = node.left
+                else:
+                    stack.append(node)
+                    node = node.right
+
+            if not stack:
+                return
+
+            node = stack.pop()
+            if lo is not None and node.key < lo:
+                return
+
+            yield node.key, node.data
+            node = node.left
@@ -0,0 +1,75 @@
+class OperationStats:
+    """
+    Contadores de trabalho interno de uma árvore (modo instrumentado).
+
+    - nodes_visited: nós percorridos nas descidas (inclui a busca do
+      sucessor na remoção)
+    - comparisons: comparações de chave (uma de três vias por nó da descida)
+    - rotations_ll / _rr / _lr / _rl: rebalanceamentos AVL por caso (LL e
+      RR são rotações simples, LR e RL duplas)
+    - successor_searches: remoções de nó com dois filhos
+    - height_updates: recálculos de altura (subida do caminho + rotações)
+    - bulk_rebuilds: religações completas de insert_many/delete_many
+
+    Os contadores só são tocados quando a árvore está instrumentada; com
+    a instrumentação desligada cada operação paga um teste de None.
+    """
+
+    FIELDS = (
+        "inserts", "searches", "deletes",
+        "nodes_visited", "comparisons",
+        "rotations_ll", "rotations_rr", "rotations_lr", "rotations_rl",
+        "successor_searches", "height_updates", "bulk_rebuilds",
+    )
+
+    __slots__ = FIELDS
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def snapshot(self):
+        """
+        Cópia dos contadores (dict), com totais de rotações.
+        """
+        stats = {field: getattr(self, field) for field in self.FIELDS}
+        stats["single_rotations"] = self.rotations_ll + self.rotations_rr
+        stats["double_rotations"] = self.rotations_lr + self.rotations_rl
+        stats["rotations"] = stats["single_rotations"] + stats["double_rotations"]
+        return stats
+
+    def descend(self, root, key):
+        """
+        Descida da raiz até a chave contando nós e comparações; devolve
+        (pai, nó), com nó None se a chave não está na árvore. É a própria
+        descida da operação instrumentada, não uma segunda passada.
+        """
+        parent = None
+        node = root
+        while node is not None:
+            self.nodes_visited += 1
+            self.comparisons += 1
+            if key < node.key:
+                parent, node = node, node.left
+            elif key > node.key:
+                parent, node = node, node.right
+            else:
+                break
+        return parent, node
+
+    def record_descent(self, root, key):
+        # busca instrumentada: devolve o nó encontrado (ou None)
+        return self.descend(root, key)[1]
+
+    def count_descent(self, nodes):
+        # descida feita pela própria árvore (que já guarda o caminho)
+        self.nodes_visited += nodes
+        self.comparisons += nodes
+
+    def record_successor(self, nodes):
+        # busca do sucessor na remoção de nó com dois filhos
+        self.successor_searches += 1
+        self.nodes_visited += nodes
@@ -0,0 +1,334 @@
+# Histogramas de latência por operação, com exportação em JSON e no
+# formato texto do Prometheus.
+#
+# O histograma é do tipo HDR: baldes fixos em escala log-linear (cada
+# potência de 2 dividida em SUB_BUCKETS / 2 faixas iguais), então gravar
+# custa O(1) e a memória não depende de quantas medições entram. O erro
+# relativo de um percentil é de no máximo 2 / SUB_BUCKETS (~1,6%).
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.bfs import bfs
+from src.dfs import dfs
+from src.filters import filter_products
+
+
+SUB_BITS = 7
+SUB_BUCKETS = 1 << SUB_BITS          # baldes exatos de 0 a 127ns
+HALF_BUCKETS = SUB_BUCKETS // 2      # faixas por potência de 2 acima disso
+
+QUANTILES = (0.5, 0.95, 0.99, 0.999)
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências (em segundos, guardadas em nanossegundos) até
+    `highest` segundos; valores acima vão para o último balde e são
+    contados em `overflows`.
+    """
+
+    def __init__(self, highest=60.0):
+        self.highest_ns = int(highest * 1e9)
+        self.counts = [0] * (self._index(self.highest_ns) + 1)
+
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.overflows = 0
+
+    @staticmethod
+    def _index(ns):
+        if ns < SUB_BUCKETS:
+            return ns
+        shift = ns.bit_length() - SUB_BITS
+        return SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + (ns >> shift) - HALF_BUCKETS
+
+    @staticmethod
+    def _upper_bound(index):
+        # maior valor (ns) que cai no balde `index`
+        if index < SUB_BUCKETS:
+            return index
+        shift, offset = divmod(index - SUB_BUCKETS, HALF_BUCKETS)
+        shift += 1
+        return ((offset + HALF_BUCKETS + 1) << shift) - 1
+
+    def record(self, seconds):
+        ns = int(seconds * 1e9)
+        if ns < 0:
+            ns = 0
+        if ns > self.highest_ns:
+            self.overflows += 1
+            index = len(self.counts) - 1
+        else:
+            index = self._index(ns)
+
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, q):
+        """
+        Latência (segundos) abaixo da qual ficam `q` das medições (0 < q <= 1).
+        """
+        if not self.count:
+            return 0.0
+
+        target = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(self._upper_bound(index), self.max_ns) / 1e9
+
+        return self.max_ns / 1e9
+
+    def merge(self, other):
+        for index, bucket in enumerate(other.counts[:len(self.counts)]):
+            self.counts[index] += bucket
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.overflows += other.overflows
+        self.max_ns = max(self.max_ns, other.max_ns)
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.overflows = 0
+
+    def snapshot(self):
+        stats = {
+            "count": self.count,
+            "sum": self.total_ns / 1e9,
+            "min": (self.min_ns or 0) / 1e9,
+            "max": self.max_ns / 1e9,
+            "mean": self.total_ns / self.count / 1e9 if self.count else 0.0,
+            "overflows": self.overflows,
+        }
+        for q in QUANTILES:
+            stats[f"p{q * 100:g}"] = self.percentile(q)
+        return stats
+
+
+class _Operation:
+    # estado de uma operação: contagem regressiva da amostragem, chamadas e
+    # o histograma das chamadas medidas. Para não pagar um incremento por
+    # chamada, `calls` avança um ciclo inteiro de amostragem de uma vez
+    # (na chamada medida); total_calls desconta o que falta do ciclo.
+
+    __slots__ = ("calls", "countdown", "histogram")
+
+    def __init__(self, histogram):
+        self.calls = 0
+        self.countdown = 1  # a primeira chamada sempre é medida
+        self.histogram = histogram
+
+    def total_calls(self):
+        return self.calls - self.countdown + 1
+
+
+class Metrics:
+    """
+    Histogramas de latência por tipo de operação.
+
+    Amostragem por contador: só 1 a cada `sample_every` chamadas de cada
+    operação chama time.perf_counter (as outras só decrementam um
+    contador). Percentis valem para a amostra; `calls` conta todas.
+    Não é thread-safe: use uma instância por thread e junte com merge.
+    """
+
+    def __init__(self, sample_every=1, highest=60.0):
+        if sample_every < 1:
+            raise ValueError("sample_every precisa ser pelo menos 1")
+
+        self.sample_every = sample_every
+        self.highest = highest
+        self.operations = {}
+
+    def _operation(self, name):
+        operation = self.operations.get(name)
+        if operation is None:
+            operation = self.operations[name] = _Operation(LatencyHistogram(self.highest))
+        return operation
+
+    def wrap(self, name, function):
+        """
+        Devolve function embrulhada: cada chamada conta em `name` e, quando
+        a amostragem manda, tem a latência medida. As chamadas não
+        amostradas só pagam um decremento e um teste.
+        """
+        operation = self._operation(name)
+        record = operation.histogram.record
+        perf_counter = time.perf_counter
+        sample_every = self.sample_every
+
+        def metered(*args, **kwargs):
+            operation.countdown -= 1
+            if operation.countdown:
+                return function(*args, **kwargs)
+
+            operation.countdown = sample_every
+            operation.calls += sample_every
+            start = perf_counter()
+            result = function(*args, **kwargs)
+            record(perf_counter() - start)
+            return result
+
+        return metered
+
+    def call(self, name, function, *args, **kwargs):
+        """
+        Executa function(*args, **kwargs) como uma chamada de `name`.
+        """
+        return self.wrap(name, function)(*args, **kwargs)
+
+    def record(self, name, seconds):
+        """
+        Grava uma latência medida por fora (sempre entra, sem amostragem).
+        """
+        operation = self._operation(name)
+        operation.calls += 1
+        operation.histogram.record(seconds)
+
+    def histogram(self, name):
+        return self._operation(name).histogram
+
+    def merge(self, other):
+        for name, theirs in other.operations.items():
+            mine = self._operation(name)
+            mine.calls += theirs.total_calls()
+            mine.histogram.merge(theirs.histogram)
+
+    def reset(self):
+        for operation in self.operations.values():
+            operation.calls = 0
+            operation.countdown = 1
+            operation.histogram.reset()
+
+
+    def to_dict(self):
+        return {
+            name: {"calls": operation.total_calls(), **operation.histogram.snapshot()}
+            for name, operation in sorted(self.operations.items())
+        }
+
+    def to_json(self):
+        return json.dumps({"sample_every": self.sample_every, "operations": self.to_dict()}, indent=2)
+
+    def to_prometheus(self, prefix="product_search"):
+        """
+        Texto no formato de exposição do Prometheus: um summary de latência
+        (quantis amostrados, _sum e _count) e um counter de chamadas.
+        """
+        latency = f"{prefix}_operation_seconds"
+        calls = f"{prefix}_operations_total"
+
+        lines = [
+            f"# HELP {latency} Latência por operação (amostra de 1 a cada {self.sample_every}).",
+            f"# TYPE {latency} summary",
+        ]
+        for name, operation in sorted(self.operations.items()):
+            histogram = operation.histogram
+            for q in QUANTILES:
+                lines.append(f'{latency}{{operation="{name}",quantile="{q:g}"}} {histogram.percentile(q):.9g}')
+            lines.append(f'{latency}_sum{{operation="{name}"}} {histogram.total_ns / 1e9:.9g}')
+            lines.append(f'{latency}_count{{operation="{name}"}} {histogram.count}')
+
+        lines += [f"# HELP {calls} Chamadas por operação.", f"# TYPE {calls} counter"]
+        for name, operation in sorted(self.operations.items()):
+            lines.append(f'{calls}{{operation="{name}"}} {operation.total_calls()}')
+
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path):
+        _write_atomic(path, self.to_json())
+
+    def write_prometheus(self, path, prefix="product_search"):
+        """
+        Grava o texto do Prometheus com troca atômica do arquivo (pode ser
+        lido a qualquer momento, ex.: pelo textfile collector do
+        node_exporter).
+        """
+        _write_atomic(path, self.to_prometheus(prefix))
+
+    def serve_prometheus(self, host="127.0.0.1", port=0, prefix="product_search"):
+        """
+        Expõe /metrics por HTTP numa thread em segundo plano; devolve o
+        servidor (server.server_address tem a porta; server.shutdown() para).
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus(prefix).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class MeteredTree:
+    """
+    Registra a latência de insert/search/delete e de filter_products,
+    bfs e dfs sobre a árvore (BST ou AVL) em `metrics`. O resto da API é
+    repassado para a árvore.
+    """
+
+    def __init__(self, tree, metrics=None, sample_every=1):
+        self.tree = tree
+        self.metrics = metrics if metrics is not None else Metrics(sample_every)
+
+        # versões embrulhadas guardadas na instância: uma chamada a
+        # search passa por um único quadro extra
+        self.insert = self.metrics.wrap("insert", tree.insert)
+        self.search = self.metrics.wrap("search", tree.search)
+        self.delete = self.metrics.wrap("delete", tree.delete)
+        self._filter = self.metrics.wrap("filter_products", filter_products)
+        self._bfs = self.metrics.wrap("bfs", bfs)
+        self._dfs = self.metrics.wrap("dfs", dfs)
+
+    def __getattr__(self, name):
+        return getattr(self.tree, name)
+
+    def filter_products(self, category=None, max_price=None, min_rating=None, min_price=None, limit=None):
+        return self._filter(
+            self.tree.root, category, max_price, min_rating,
+            indexes=self.tree.indexes, min_price=min_price, limit=limit,
+        )
+
+    def bfs(self, limit=None):
+        return self._bfs(self.tree.root, limit)
+
+    def dfs(self, limit=None):
+        return self._dfs(self.tree.root, limit)
@@ -0,0 +1,225 @@
+import threading
+
+from src.inorder import inorder
+from src.search import search_many
+
+
+class PersistentNode:
+    """
+    Nó imutável depois de publicado: mudanças criam nós novos.
+    """
+
+    __slots__ = ("key", "data", "left", "right", "height")
+
+    def __init__(self, key, data, left=None, right=None):
+        self.key = key
+        self.data = data
+        self.left = left
+        self.right = right
+
+        left_height = left.height if left else 0
+        right_height = right.height if right else 0
+        self.height = 1 + max(left_height, right_height)
+
+    def get_balance(self):
+
+        left_height = self.left.height if self.left else 0
+        right_height = self.right.height if self.right else 0
+        return right_height - left_height
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _balance(key, data, left, right):
+    # monta o nó (key, data, left, right) já rebalanceado; as rotações
+    # criam nós novos em vez de religar os existentes
+    left_height = _height(left)
+    right_height = _height(right)
+
+    # Direita pesada
+    if right_height - left_height > 1:
+        # Caso Right-Left: subárvore direita pende para a esquerda
+        if _height(right.left) > _height(right.right):
+            pivot = right.left
+            return PersistentNode(
+                pivot.key, pivot.data,
+                PersistentNode(key, data, left, pivot.left),
+                PersistentNode(right.key, right.data, pivot.right, right.right),
+            )
+        # Caso Right-Right
+        return PersistentNode(
+            right.key, right.data, PersistentNode(key, data, left, right.left), right.right
+        )
+
+    # Esquerda pesada
+    if left_height - right_height > 1:
+        # Caso Left-Right: subárvore esquerda pende para a direita
+        if _height(left.right) > _height(left.left):
+            pivot = left.right
+            return PersistentNode(
+                pivot.key, pivot.data,
+                PersistentNode(left.key, left.data, left.left, pivot.left),
+                PersistentNode(key, data, pivot.right, right),
+            )
+        # Caso Left-Left
+        return PersistentNode(
+            left.key, left.data, left.left, PersistentNode(key, data, left.right, right)
+        )
+
+    return PersistentNode(key, data, left, right)
+
+
+def _rebuild_path(path, subtree):
+    # copia o caminho (raiz -> pai) de baixo para cima pendurando a
+    # subárvore nova no lado por onde a descida passou
+    for node, went_left in reversed(path):
+        if went_left:
+            subtree = _balance(node.key, node.data, subtree, node.right)
+        else:
+            subtree = _balance(node.key, node.data, node.left, subtree)
+    return subtree
+
+
+class PersistentAVLTree:
+    """
+    AVL persistente (cópia de caminho) para leituras concorrentes.
+
+    insert/delete nunca alteram nós publicados: copiam só os O(log n) nós
+    do caminho, montam uma raiz nova e a publicam com uma única atribuição.
+    Um leitor que pegou a raiz (search, items, snapshot) percorre uma
+    versão fixa da árvore sem trava, enquanto escritores seguem em frente;
+    os nós fora do caminho são compartilhados entre as versões.
+
+    Escritores são serializados por uma trava interna.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.count = 0
+        self.version = 0
+        self._write_lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def snapshot(self):
+        """
+        Cópia O(1) da versão atual: alterações em qualquer uma das duas
+        não aparecem na outra.
+        """
+        with self._write_lock:
+            copy = PersistentAVLTree()
+            copy.root = self.root
+            copy.count = self.count
+            copy.version = self.version
+        return copy
+
+
+    def insert(self, key, data):
+
+        with self._write_lock:
+            root = self.root
+
+            path = []
+            node = root
+            while node is not None:
+                if key < node.key:
+                    path.append((node, True))
+                    node = node.left
+                elif key > node.key:
+                    path.append((node, False))
+                    node = node.right
+                else:
+                    break
+
+            if node is None:
+                subtree = PersistentNode(key, data)
+                self.count += 1
+            else:
+                # Chave duplicada - nó novo com os dados atualizados
+                subtree = PersistentNode(key, data, node.left, node.right)
+
+            self.root = _rebuild_path(path, subtree)
+            self.version += 1
+
+
+    def search(self, key):
+
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node
+
+        return None
+
+    def search_many(self, keys):
+        """
+        Busca um lote de chaves, todas na mesma versão da árvore.
+        """
+        return search_many(self.root, keys)
+
+
+    def delete(self, key):
+
+        with self._write_lock:
+            path = []
+            node = self.root
+            while node is not None and node.key != key:
+                if key < node.key:
+                    path.append((node, True))
+                    node = node.left
+                else:
+                    path.append((node, False))
+                    node = node.right
+
+            if node is None:
+                return  # chave não existe
+
+            if node.left is not None and node.right is not None:
+                # Dois filhos: o sucessor (menor da direita) ocupa o lugar
+                # do nó, num nó novo; a subárvore direita perde o sucessor
+                right_path = []
+                successor = node.right
+                while successor.left is not None:
+                    right_path.append((successor, True))
+                    successor = successor.left
+
+                new_right = _rebuild_path(right_path, successor.right)
+                subtree = _balance(successor.key, successor.data, node.left, new_right)
+            else:
+                subtree = node.left if node.left is not None else node.right
+
+            self.root = _rebuild_path(path, subtree)
+            self.count -= 1
+            self.version += 1
+
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Gerador de pares (chave, dados) em ordem sobre a versão atual;
+        escritas feitas durante a iteração não aparecem nela.
+        """
+        return inorder(self.root, lo, hi, reverse)
+
+    def get_height(self):
+
+        return self.root.height if self.root else 0
+
+    def is_balanced(self):
+
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if abs(node.get_balance()) > 1:
+                return False
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return True
@@ -0,0 +1,62 @@
+from bisect import bisect_left
+
+
+# faixas com até tantas chaves pendentes seguem com descidas comuns a partir
+# do nó atual: dividir com bisect não compensa no fundo da árvore
+SPLIT_CUTOFF = 16
+
+
+def search_many(root, keys):
+    """
+    Busca várias chaves numa única descida compartilhada.
+
+    As chaves (sem repetição) são ordenadas uma vez; cada nó visitado
+    divide a faixa de chaves pendentes entre a subárvore esquerda e a
+    direita, então o topo da árvore, comum a quase todos os caminhos, é
+    percorrido uma vez só, e as descidas restantes saem em ordem de chave
+    (vizinhas na memória).
+
+    Devolve uma lista com o nó (ou None) de cada chave, na ordem recebida.
+    Serve para qualquer árvore com nós key/left/right (BST e AVL).
+    """
+    keys = keys if isinstance(keys, list) else list(keys)
+    if root is None or not keys:
+        return [None] * len(keys)
+
+    probes = sorted(set(keys)) if len(keys) > SPLIT_CUTOFF else keys
+    found = {}
+
+    # pilha de (nó, início, fim): probes[início:fim] ficam nesta subárvore
+    stack = [(root, 0, len(probes))]
+
+    while stack:
+        start, lo, hi = stack.pop()
+
+        if hi - lo <= SPLIT_CUTOFF:
+            for i in range(lo, hi):
+                key = probes[i]
+                node = start
+                while node is not None:
+                    if key < node.key:
+                        node = node.left
+                    elif key > node.key:
+                        node = node.right
+                    else:
+                        found[key] = node
+                        break
+            continue
+
+        key = start.key
+        mid = bisect_left(probes, key, lo, hi)
+        right_lo = mid
+        if mid < hi and probes[mid] == key:
+            found[key] = start
+            right_lo = mid + 1
+
+        if right_lo < hi and start.right is not None:
+            stack.append((start.right, right_lo, hi))
+        if lo < mid and start.left is not None:
+            stack.append((start.left, lo, mid))
+
+    get = found.get
+    return [get(key) for key in keys]
@@ -0,0 +1,247 @@
+# Servidor asyncio de consultas sobre uma AVLTree, protocolo JSON lines.
+#
+# Cada linha recebida é um pedido e cada linha enviada, uma resposta:
+#
+#     {"id": 7, "op": "search", "key": 42}
+#     {"id": 7, "ok": true, "result": {...produto...}}
+#
+# Operações: search (key), search_many (keys), filter (category, max_price,
+# min_rating, min_price, limit), range (lo, hi, limit, reverse), insert
+# (key, data), delete (key), stats. Um cliente pode mandar vários pedidos
+# sem esperar as respostas; elas voltam com o mesmo "id", na ordem em que
+# ficam prontas.
+
+import asyncio
+import json
+import sys
+from itertools import islice
+
+from src.avl_tree import AVLTree
+from src.filters import filter_products
+
+
+class ProductServer:
+    """
+    Serve uma AVLTree por TCP ou socket Unix.
+
+    - buscas pontuais que chegam dentro de `batch_window` segundos viram
+      uma única passada tree.search_many (até `max_batch` chaves);
+      batch_window=None desliga o agrupamento
+    - insert/delete entram numa fila consumida por uma única tarefa
+      escritora, então são aplicados um de cada vez, na ordem de chegada
+    - filtros e faixas rodam direto: como tudo roda no mesmo laço de
+      eventos, nenhuma leitura vê uma escrita pela metade
+    """
+
+    def __init__(self, tree=None, batch_window=0.0005, max_batch=1024):
+        self.tree = tree if tree is not None else AVLTree()
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+
+        self.pending = []           # buscas esperando o próximo lote: (chave, future)
+        self.batch_ready = None     # evento: chegou a primeira busca do lote
+        self.writes = None          # fila de (op, chave, dados, future)
+        self.server = None
+        self.tasks = []
+
+        self.requests = 0
+        self.batches = 0
+        self.batched_keys = 0
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Abre o servidor (socket Unix se `path` for dado) e as tarefas
+        internas. Devolve o endereço em que está ouvindo.
+        """
+        self.batch_ready = asyncio.Event()
+        self.writes = asyncio.Queue()
+        self.tasks = [asyncio.create_task(self._writer())]
+        if self.batch_window is not None:
+            self.tasks.append(asyncio.create_task(self._batcher()))
+
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port)
+
+        return self.server.sockets[0].getsockname()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+    async def _handle(self, reader, writer):
+        # uma tarefa por pedido: pedidos da mesma conexão entram juntos no lote
+        in_flight = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.create_task(self._respond(line, writer))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _respond(self, line, writer):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            response = {"id": request_id, "ok": True, "result": await self._dispatch(request)}
+        except Exception as exc:
+            response = {"id": request_id, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    async def _dispatch(self, request):
+        self.requests += 1
+        op = request["op"]
+
+        if op == "search":
+            return await self.search(request["key"])
+
+        if op == "search_many":
+            return [node.data if node else None for node in self.tree.search_many(request["keys"])]
+
+        if op == "filter":
+            return filter_products(
+                self.tree.root, request.get("category"), request.get("max_price"),
+                request.get("min_rating"), indexes=self.tree.indexes,
+                min_price=request.get("min_price"), limit=request.get("limit"),
+            )
+
+        if op == "range":
+            pairs = self.tree.items(request.get("lo"), request.get("hi"), request.get("reverse", False))
+            return [[key, data] for key, data in islice(pairs, request.get("limit"))]
+
+        if op in ("insert", "delete"):
+            future = asyncio.get_running_loop().create_future()
+            await self.writes.put((op, request["key"], request.get("data"), future))
+            return await future
+
+        if op == "stats":
+            return self.stats()
+
+        raise ValueError(f"operação desconhecida: {op!r}")
+
+
+    async def search(self, key):
+        if self.batch_window is None:
+            node = self.tree.search(key)
+            return node.data if node else None
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((key, future))
+        self.batch_ready.set()
+        return await future
+
+    async def _batcher(self):
+        while True:
+            await self.batch_ready.wait()
+            if self.batch_window:
+                await asyncio.sleep(self.batch_window)
+            else:
+                await asyncio.sleep(0)  # deixa os pedidos já lidos entrarem
+
+            batch = self.pending[:self.max_batch]
+            del self.pending[:self.max_batch]
+            if not self.pending:
+                self.batch_ready.clear()
+
+            try:
+                nodes = self.tree.search_many([key for key, _ in batch])
+            except Exception:
+                # chave que não se compara com as outras (ex.: "abc" ou None
+                # numa árvore de inteiros): refaz o lote busca a busca, para
+                # que só o pedido com a chave ruim receba o erro
+                self._search_each(batch)
+            else:
+                for (_, future), node in zip(batch, nodes):
+                    if not future.done():
+                        future.set_result(node.data if node else None)
+
+            self.batches += 1
+            self.batched_keys += len(batch)
+
+    def _search_each(self, batch):
+        for key, future in batch:
+            if future.done():
+                continue
+            try:
+                node = self.tree.search(key)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(node.data if node else None)
+
+    async def _writer(self):
+        while True:
+            op, key, data, future = await self.writes.get()
+            try:
+                if op == "insert":
+                    result = {"inserted": self.tree.insert(key, data)}
+                else:
+                    result = {"deleted": self.tree.delete(key)}
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "batched_keys": self.batched_keys,
+            "avg_batch": self.batched_keys / self.batches if self.batches else 0.0,
+        }
+
+
+async def serve(tree, host="127.0.0.1", port=0, path=None, batch_window=0.0005):
+    """
+    Sobe o servidor e atende até ser cancelado. Imprime o endereço numa
+    linha ("listening <host> <porta>") para quem o iniciou como processo.
+    """
+    async with ProductServer(tree, batch_window=batch_window) as server:
+        address = await server.start(host, port, path)
+        where = path if path is not None else f"{address[0]} {address[1]}"
+        print(f"listening {where}", flush=True)
+        await asyncio.Event().wait()
+
+
+def main():
+    # python -m src.server [produtos] [porta] [janela_em_ms | off]
+    from src.dataset import generate_products
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    window = sys.argv[3] if len(sys.argv) > 3 else "0.5"
+    batch_window = None if window == "off" else float(window) / 1000
+
+    tree = AVLTree.from_iterable((p["id"], p) for p in generate_products(n))
+    try:
+        asyncio.run(serve(tree, port=port, batch_window=batch_window))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
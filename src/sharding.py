@@ -0,0 +1,268 @@
+import multiprocessing
+import os
+from bisect import bisect_right
+
+from src.avl_tree import AVLTree
+from src.filters import filter_products, filter_products_iter
+from src.node import Node
+
+
+# operações que o processo de cada shard sabe executar sobre a sua árvore
+
+def _shard_insert(tree, key, data):
+    return tree.insert(key, data)
+
+
+def _shard_delete(tree, key):
+    return tree.delete(key)
+
+
+def _shard_search_many(tree, keys):
+    return [(node.key, node.data) if node else None for node in tree.search_many(keys)]
+
+
+def _shard_filter(tree, category, max_price, min_rating, min_price, limit):
+    return filter_products(
+        tree.root, category, max_price, min_rating,
+        indexes=tree.indexes, min_price=min_price, limit=limit,
+    )
+
+
+def _shard_count_matching(tree, category, max_price, min_rating, min_price):
+    matches = filter_products_iter(
+        tree.root, category, max_price, min_rating, indexes=tree.indexes, min_price=min_price
+    )
+    return sum(1 for _ in matches)
+
+
+def _shard_items(tree, lo, hi):
+    return list(tree.items(lo, hi))
+
+
+def _shard_count(tree, lo, hi):
+    return tree.count_range(lo, hi)
+
+
+_SHARD_OPS = {
+    "insert": _shard_insert,
+    "delete": _shard_delete,
+    "insert_many": AVLTree.insert_many,
+    "delete_many": AVLTree.delete_many,
+    "search_many": _shard_search_many,
+    "filter": _shard_filter,
+    "count_matching": _shard_count_matching,
+    "items": _shard_items,
+    "count": _shard_count,
+}
+
+
+def _shard_main(conn):
+    # laço do processo de um shard: recebe (op, args), devolve (ok, resultado)
+    tree = AVLTree(track_size=True)
+
+    while True:
+        op, args = conn.recv()
+        if op == "close":
+            break
+
+        try:
+            if op == "load":
+                tree = AVLTree.from_iterable(args[0], track_size=True)
+                result = tree.count_range()
+            else:
+                result = _SHARD_OPS[op](tree, *args)
+        except Exception as exc:
+            conn.send((False, exc))
+        else:
+            conn.send((True, result))
+
+    conn.close()
+
+
+class ShardedProductStore:
+    """
+    Produtos particionados por faixa de ID entre N árvores AVL, cada uma
+    num processo próprio (um núcleo por shard).
+
+    `bounds` são as N - 1 chaves de corte em ordem: o shard i guarda as
+    chaves em [bounds[i - 1], bounds[i]). insert/search/delete vão só ao
+    shard dono da chave; filtros, contagens e items são espalhados para
+    todos os shards de uma vez e os resultados juntados em ordem de faixa.
+
+    Os dados voltam por pipe (pickle): consultas que devolvem poucos
+    produtos, ou só contagens, são as que ganham com os processos.
+    """
+
+    def __init__(self, bounds=(), context=None):
+        self.bounds = list(bounds)
+        if any(not a < b for a, b in zip(self.bounds, self.bounds[1:])):
+            raise ValueError("bounds precisa ser estritamente crescente")
+
+        ctx = multiprocessing.get_context(context)
+        self.connections = []
+        self.processes = []
+
+        for _ in range(len(self.bounds) + 1):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(target=_shard_main, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    @classmethod
+    def from_products(cls, items, shards=None, context=None):
+        """
+        Cria a store com `shards` processos (padrão: um por núcleo),
+        cortando as faixas pelos quantis das chaves para que cada shard
+        receba a mesma quantidade, e carrega cada shard em lote.
+        """
+        shards = shards or os.cpu_count() or 1
+        ordered = sorted(items, key=lambda item: item[0])
+
+        keys = [key for key, _ in ordered]
+        cuts = sorted({keys[len(keys) * i // shards] for i in range(1, shards)} if keys else ())
+        store = cls(cuts, context=context)
+
+        try:
+            store._scatter(
+                (i, "load", (part,)) for i, part in enumerate(store._partition(ordered))
+            )
+        except BaseException:
+            store.close()
+            raise
+
+        return store
+
+    def __len__(self):
+        return self.count()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _shard_for(self, key):
+        return bisect_right(self.bounds, key)
+
+    def _partition(self, pairs):
+        # divide pares (chave, ...) por shard, mantendo a ordem de chegada
+        parts = [[] for _ in self.connections]
+        for pair in pairs:
+            parts[self._shard_for(pair[0])].append(pair)
+        return parts
+
+    def _scatter(self, requests):
+        # envia todos os pedidos antes de esperar: os shards trabalham juntos
+        requests = list(requests)
+        for i, op, args in requests:
+            self.connections[i].send((op, args))
+
+        # lê todas as respostas antes de propagar um erro, senão as que
+        # ficassem no pipe seriam entregues ao próximo pedido
+        replies = [self.connections[i].recv() for i, _, _ in requests]
+        for ok, result in replies:
+            if not ok:
+                raise result
+        return [result for _, result in replies]
+
+    def _broadcast(self, op, *args):
+        return self._scatter((i, op, args) for i in range(len(self.connections)))
+
+    def _call(self, key, op, *args):
+        return self._scatter([(self._shard_for(key), op, args)])[0]
+
+
+    def insert(self, key, data):
+        return self._call(key, "insert", key, data)
+
+    def delete(self, key):
+        return self._call(key, "delete", key)
+
+    def search(self, key):
+        # o nó vive no outro processo: devolve um Node avulso com key/data
+        found = self._call(key, "search_many", [key])[0]
+        return Node(*found) if found else None
+
+    def insert_many(self, items):
+        """
+        Devolve (inseridos, atualizados), somados sobre os shards.
+        """
+        parts = self._partition(items)
+        results = self._scatter((i, "insert_many", (part,)) for i, part in enumerate(parts) if part)
+        return sum(r[0] for r in results), sum(r[1] for r in results)
+
+    def delete_many(self, keys):
+        parts = self._partition((key,) for key in keys)
+        return sum(self._scatter(
+            (i, "delete_many", ([key for key, in part],)) for i, part in enumerate(parts) if part
+        ))
+
+    def search_many(self, keys):
+        keys = keys if isinstance(keys, list) else list(keys)
+        parts = self._partition((key, position) for position, key in enumerate(keys))
+
+        requests = [(i, part) for i, part in enumerate(parts) if part]
+        results = [None] * len(keys)
+        answers = self._scatter((i, "search_many", ([key for key, _ in part],)) for i, part in requests)
+
+        for (_, part), found in zip(requests, answers):
+            for (_, position), pair in zip(part, found):
+                if pair:
+                    results[position] = Node(*pair)
+        return results
+
+
+    def filter_products(self, category=None, max_price=None, min_rating=None, min_price=None, limit=None):
+        """
+        Roda filter_products em todos os shards em paralelo. O resultado
+        vem shard a shard (faixas de ID crescentes); dentro de cada shard,
+        na ordem de filter_products. Com limit, cada shard para no limite
+        e a junção é cortada nele.
+        """
+        results = []
+        for found in self._broadcast("filter", category, max_price, min_rating, min_price, limit):
+            results.extend(found)
+        return results[:limit] if limit is not None else results
+
+    def count_matching(self, category=None, max_price=None, min_rating=None, min_price=None):
+        """
+        Quantidade de produtos que passam no filtro (só contagens trafegam).
+        """
+        return sum(self._broadcast("count_matching", category, max_price, min_rating, min_price))
+
+    def items(self, lo=None, hi=None):
+        """
+        Pares (chave, dados) em ordem de chave, com limites inclusivos
+        opcionais. Só os shards cuja faixa cruza [lo, hi] são consultados.
+        """
+        first = 0 if lo is None else self._shard_for(lo)
+        last = len(self.connections) - 1 if hi is None else self._shard_for(hi)
+
+        results = []
+        for found in self._scatter((i, "items", (lo, hi)) for i in range(first, last + 1)):
+            results.extend(found)
+        return results
+
+    def count(self, lo=None, hi=None):
+        """
+        Quantidade de chaves com lo <= chave <= hi (limites opcionais).
+        """
+        return sum(self._broadcast("count", lo, hi))
+
+    def close(self):
+        for conn, process in zip(self.connections, self.processes):
+            if process.is_alive():
+                try:
+                    conn.send(("close", ()))
+                except (BrokenPipeError, OSError):
+                    pass
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+
+        self.connections = []
+        self.processes = []
@@ -0,0 +1,192 @@
+# Snapshot binário do catálogo: chaves ordenadas + bloco colunar de produtos.
+#
+# Layout do arquivo (inteiros little-endian):
+#
+#     MAGIC (8 bytes) | n (u64) | bloco de chaves | bloco de dados
+#
+# Cada bloco começa com um byte de tipo e um tamanho u64. Chaves inteiras
+# vão como array('q'); produtos dict com os mesmos campos vão coluna a
+# coluna (int64, float64, texto com dicionário, texto cru ou pickle);
+# qualquer outra coisa cai no pickle.
+
+import pickle
+import struct
+from array import array
+from itertools import repeat
+from operator import itemgetter
+
+from src.gc_pause import gc_paused
+
+
+MAGIC = b"PSTSNAP1"
+
+KEYS_INT64 = 0
+KEYS_PICKLE = 1
+
+DATA_COLUMNS = 0
+DATA_PICKLE = 1
+
+COL_INT64 = b"q"
+COL_FLOAT64 = b"d"
+COL_CATEGORY = b"c"   # texto repetido: tabela + códigos uint32
+COL_TEXT = b"s"       # texto: utf-8 separado por "\0"
+COL_PICKLE = b"p"
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+def _write_block(f, kind, payload):
+    f.write(struct.pack("<BQ", kind, len(payload)))
+    f.write(payload)
+
+
+def _read_block(f):
+    kind, size = struct.unpack("<BQ", f.read(9))
+    return kind, f.read(size)
+
+
+def _encode_keys(keys):
+    if set(map(type, keys)) <= {int}:
+        try:
+            return KEYS_INT64, array("q", keys).tobytes()
+        except OverflowError:
+            pass  # inteiro fora de 64 bits
+    return KEYS_PICKLE, pickle.dumps(keys, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_keys(kind, payload):
+    if kind == KEYS_INT64:
+        keys = array("q")
+        keys.frombytes(payload)
+        return keys.tolist()
+    return pickle.loads(payload)
+
+
+def _encode_column(values):
+    kinds = set(map(type, values))
+
+    if kinds == {int}:
+        try:
+            return COL_INT64, array("q", values).tobytes()
+        except OverflowError:
+            pass  # inteiro fora de 64 bits
+
+    if kinds == {float}:
+        return COL_FLOAT64, array("d", values).tobytes()
+
+    if kinds == {str}:
+        # amostra barata antes de montar a tabela: nomes quase nunca repetem
+        sample = values[:1000]
+        table = list(dict.fromkeys(values)) if len(set(sample)) <= len(sample) // 2 else ()
+        if table and len(table) <= len(values) // 2:
+            codes = {text: i for i, text in enumerate(table)}
+            header = pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+            body = array("I", [codes[v] for v in values]).tobytes()
+            return COL_CATEGORY, struct.pack("<Q", len(header)) + header + body
+
+        joined = "\0".join(values)
+        if joined.count("\0") == len(values) - 1:
+            # um único decode + split na carga, em vez de um objeto por linha
+            return COL_TEXT, joined.encode("utf-8")
+
+    return COL_PICKLE, pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_column(kind, payload, n):
+    if kind == COL_INT64 or kind == COL_FLOAT64:
+        column = array(kind.decode())
+        column.frombytes(payload)
+        return column.tolist()
+
+    if kind == COL_CATEGORY:
+        (header_size,) = struct.unpack_from("<Q", payload)
+        table = pickle.loads(payload[8:8 + header_size])
+        codes = array("I")
+        codes.frombytes(payload[8 + header_size:])
+        return [table[c] for c in codes]
+
+    if kind == COL_TEXT:
+        return payload.decode("utf-8").split("\0")
+
+    return pickle.loads(payload)
+
+
+def _encode_data(values):
+    # colunar só quando todo produto é um dict com os mesmos campos
+    columns = None
+    if values and set(map(type, values)) == {dict}:
+        fields = tuple(values[0])
+        if set(map(len, values)) == {len(fields)}:
+            try:
+                columns = [list(map(itemgetter(field), values)) for field in fields]
+            except KeyError:
+                columns = None  # algum produto tem outros campos
+
+    if not columns:
+        return DATA_PICKLE, pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+    parts = []
+    for column in columns:
+        kind, payload = _encode_column(column)
+        parts.append(kind + struct.pack("<Q", len(payload)) + payload)
+
+    header = pickle.dumps(fields, protocol=pickle.HIGHEST_PROTOCOL)
+    return DATA_COLUMNS, struct.pack("<Q", len(header)) + header + b"".join(parts)
+
+
+def _decode_data(kind, payload, n):
+    if kind == DATA_PICKLE:
+        return pickle.loads(payload)
+
+    (header_size,) = struct.unpack_from("<Q", payload)
+    fields = pickle.loads(payload[8:8 + header_size])
+    pos = 8 + header_size
+
+    columns = []
+    for _ in fields:
+        column_kind = payload[pos:pos + 1]
+        (size,) = struct.unpack_from("<Q", payload, pos + 1)
+        pos += 9
+        columns.append(_decode_column(column_kind, payload[pos:pos + size], n))
+        pos += size
+
+    return list(map(dict, map(zip, repeat(fields), zip(*columns))))
+
+
+def save_snapshot(tree, path):
+    """
+    Grava as entradas da árvore (em ordem de chave, via tree.items()).
+    """
+    with gc_paused():
+        keys = []
+        values = []
+        for key, data in tree.items():
+            keys.append(key)
+            values.append(data)
+
+        key_block = _encode_keys(keys)
+        data_block = _encode_data(values)
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(keys)))
+        _write_block(f, *key_block)
+        _write_block(f, *data_block)
+
+
+def read_snapshot(path):
+    """
+    Lê um snapshot e devolve a lista de pares (chave, dados) ordenada.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} não é um snapshot de produtos")
+
+        (n,) = struct.unpack("<Q", f.read(8))
+        keys = _decode_keys(*_read_block(f))
+        kind, payload = _read_block(f)
+
+    with gc_paused():
+        values = _decode_data(kind, payload, n)
+        return list(zip(keys, values))
@@ -0,0 +1,198 @@
+import os
+import pickle
+import struct
+import zlib
+
+from src.avl_tree import AVLTree
+
+
+OP_INSERT = 1
+OP_DELETE = 2
+
+# cabeçalho de cada registro: tamanho do payload + crc32 do payload
+RECORD_HEADER = struct.Struct("<II")
+
+
+class WriteAheadLog:
+    """
+    Log append-only das mutações (insert/delete). Cada registro leva
+    tamanho e CRC, então um final truncado por queda é detectado e
+    descartado na leitura.
+
+    O fsync é feito em lote: a cada `sync_every` registros (ou em flush()).
+    O que ainda não passou por fsync pode se perder numa queda do sistema;
+    sync_every=1 dá durabilidade por operação.
+    """
+
+    def __init__(self, path, sync_every=64):
+        self.path = path
+        self.sync_every = sync_every
+        self.pending = 0   # registros ainda sem fsync
+        self.count = 0     # registros no arquivo (para a compactação)
+
+        # descarta um final corrompido antes de voltar a anexar
+        valid_size = 0
+        for _, _, _, end in self._scan(path):
+            valid_size = end
+            self.count += 1
+
+        self.file = open(path, "ab")
+        if self.file.tell() != valid_size:
+            self.file.truncate(valid_size)
+            self.file.seek(valid_size)
+
+    @staticmethod
+    def _scan(path):
+        # gera (op, chave, dados, offset final) de cada registro válido
+        if not os.path.exists(path):
+            return
+
+        with open(path, "rb") as f:
+            offset = 0
+            while True:
+                header = f.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    return
+
+                size, crc = RECORD_HEADER.unpack(header)
+                payload = f.read(size)
+                if len(payload) < size or zlib.crc32(payload) != crc:
+                    return  # registro incompleto: queda no meio da escrita
+
+                offset += RECORD_HEADER.size + size
+                op, key, data = pickle.loads(payload)
+                yield op, key, data, offset
+
+    @classmethod
+    def read_records(cls, path):
+        """
+        Registros válidos do log, em ordem: (op, chave, dados).
+        """
+        for op, key, data, _ in cls._scan(path):
+            yield op, key, data
+
+    def append(self, op, key, data=None):
+        payload = pickle.dumps((op, key, data), protocol=pickle.HIGHEST_PROTOCOL)
+        self.file.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+        self.file.write(payload)
+
+        self.count += 1
+        self.pending += 1
+        if self.pending >= self.sync_every:
+            self.flush()
+
+    def flush(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def truncate(self):
+        """
+        Esvazia o log (depois que um snapshot passou a cobrir tudo).
+        """
+        self.file.flush()
+        self.file.truncate(0)
+        self.file.seek(0)
+        os.fsync(self.file.fileno())
+        self.pending = 0
+        self.count = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def _fsync_directory(directory):
+    # torna durável a entrada do diretório (rename/criação de arquivo)
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class DurableStore:
+    """
+    AVLTree com persistência: snapshot (AVLTree.save) + write-ahead log.
+
+    Toda mutação vai primeiro para o log e depois para a árvore. Ao abrir,
+    carrega o último snapshot e reaplica o log por cima; como insert
+    sobrescreve e delete de chave ausente não faz nada, reaplicar é
+    idempotente. A cada `compact_every` registros um checkpoint grava um
+    snapshot novo e zera o log, mantendo o replay limitado.
+    """
+
+    SNAPSHOT_FILE = "catalog.snap"
+    WAL_FILE = "catalog.wal"
+
+    def __init__(self, directory, sync_every=64, compact_every=100_000, track_size=False):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.wal_path = os.path.join(directory, self.WAL_FILE)
+        self.compact_every = compact_every
+
+        # recuperação: snapshot + replay do log
+        if os.path.exists(self.snapshot_path):
+            self.tree = AVLTree.load(self.snapshot_path, track_size=track_size)
+        else:
+            self.tree = AVLTree(track_size=track_size)
+
+        self.replayed = 0
+        for op, key, data in WriteAheadLog.read_records(self.wal_path):
+            if op == OP_INSERT:
+                self.tree.insert(key, data)
+            else:
+                self.tree.delete(key)
+            self.replayed += 1
+
+        self.wal = WriteAheadLog(self.wal_path, sync_every=sync_every)
+
+    def insert(self, key, data):
+        self.wal.append(OP_INSERT, key, data)
+        self.tree.insert(key, data)
+        self._maybe_compact()
+
+    def delete(self, key):
+        self.wal.append(OP_DELETE, key)
+        self.tree.delete(key)
+        self._maybe_compact()
+
+    def search(self, key):
+        return self.tree.search(key)
+
+    def _maybe_compact(self):
+        if self.compact_every and self.wal.count >= self.compact_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """
+        Grava um snapshot novo (troca atômica do arquivo) e esvazia o log.
+        O rename passa por fsync do diretório antes do log ser zerado, então
+        um log vazio no disco implica o snapshot novo no disco; uma queda
+        entre os dois passos só faz o log ser reaplicado à toa.
+        """
+        self.wal.flush()
+
+        tmp_path = self.snapshot_path + ".tmp"
+        self.tree.save(tmp_path)
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        _fsync_directory(self.directory)
+
+        self.wal.truncate()
+
+    def flush(self):
+        self.wal.flush()
+
+    def close(self):
+        self.wal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -255,4 +255,256 @@ def test_complex_sequence():
     
     # Verificar que os outros nós ainda estão lá
     for key in [50, 25, 75, 5, 15, 27, 55, 65, 80]:
-        assert avl.search(key) is not None
\ No newline at end of file
+        assert avl.search(key) is not None
+
+def _check_heights(node):
+    if node is None:
+        return 0
+    left = _check_heights(node.left)
+    right = _check_heights(node.right)
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+def test_avl_large_ordered_insertion_is_iterative():
+    import sys
+
+    avl = AVLTree()
+    n = sys.getrecursionlimit() * 5
+    for i in range(n):
+        avl.insert(i, i)
+
+    assert avl.is_balanced()
+    assert avl.get_height() <= 1.45 * n.bit_length()
+    assert avl.search(n - 1).data == n - 1
+
+
+def test_avl_random_churn_matches_dict():
+    import random
+
+    rng = random.Random(7)
+    avl = AVLTree()
+    reference = {}
+
+    for step in range(3000):
+        key = rng.randint(0, 300)
+        if rng.random() < 0.6:
+            avl.insert(key, step)
+            reference[key] = step
+        else:
+            avl.delete(key)
+            reference.pop(key, None)
+
+    _check_heights(avl.root)
+    assert avl.is_balanced()
+    for key in range(301):
+        node = avl.search(key)
+        assert (node.data if node else None) == reference.get(key)
+
+
+def test_avl_delete_missing_key():
+
+    avl = AVLTree()
+    avl.insert(10, "A")
+    avl.delete(99)
+
+    assert avl.search(10).data == "A"
+    assert avl.get_height() == 1
+
+
+def test_from_sorted_builds_balanced_tree():
+
+    items = [(i, f"Data{i}") for i in range(1000)]
+    avl = AVLTree.from_sorted(items)
+
+    _check_heights(avl.root)
+    assert avl.is_balanced()
+    assert avl.get_height() == (1000).bit_length()
+    assert avl.search(0).data == "Data0"
+    assert avl.search(999).data == "Data999"
+
+    # continua funcionando como uma AVL comum
+    avl.insert(1000, "Data1000")
+    avl.delete(500)
+    assert avl.is_balanced()
+    assert avl.search(500) is None
+
+
+def test_from_sorted_rejects_unsorted_keys():
+
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([(2, "B"), (1, "A")])
+
+
+def test_from_iterable_sorts_and_keeps_last_duplicate():
+
+    products = [
+        {"id": 30, "name": "C"},
+        {"id": 10, "name": "A"},
+        {"id": 20, "name": "B"},
+        {"id": 10, "name": "A2"},
+    ]
+    avl = AVLTree.from_iterable((p["id"], p) for p in products)
+
+    assert avl.is_balanced()
+    assert avl.root.key == 20
+    assert avl.search(10).data["name"] == "A2"
+
+
+def test_from_iterable_empty():
+
+    avl = AVLTree.from_iterable([])
+
+    assert avl.root is None
+    assert avl.get_height() == 0
+
+
+def _check_sizes(node):
+    if node is None:
+        return 0
+    size = 1 + _check_sizes(node.left) + _check_sizes(node.right)
+    assert node.size == size
+    return size
+
+
+def test_order_statistics_under_churn():
+    import bisect
+    import random
+
+    rng = random.Random(21)
+    avl = AVLTree(track_size=True)
+    reference = set()
+
+    for step in range(4000):
+        key = rng.randint(0, 500)
+        if rng.random() < 0.6:
+            avl.insert(key, step)
+            reference.add(key)
+        else:
+            avl.delete(key)
+            reference.discard(key)
+
+        if step % 200 == 0:
+            _check_sizes(avl.root)
+
+    _check_sizes(avl.root)
+    ordered = sorted(reference)
+
+    for key in range(-5, 510, 7):
+        assert avl.rank(key) == bisect.bisect_left(ordered, key)
+    for i in range(len(ordered)):
+        assert avl.select(i).key == ordered[i]
+    assert avl.select(len(ordered)) is None
+    assert avl.select(-1) is None
+
+    for _ in range(100):
+        lo, hi = sorted(rng.sample(range(-10, 520), 2))
+        expected = bisect.bisect_right(ordered, hi) - bisect.bisect_left(ordered, lo)
+        assert avl.count_range(lo, hi) == expected
+    assert avl.count_range() == len(ordered)
+    assert avl.count_range(300, 200) == 0
+
+
+def test_order_statistics_after_bulk_load_and_paging():
+    from itertools import islice
+
+    avl = AVLTree.from_sorted([(i * 10, i) for i in range(100)], track_size=True)
+    _check_sizes(avl.root)
+
+    # página 3 (10 itens por página) do catálogo ordenado
+    first = avl.select(30)
+    page = [key for key, _ in islice(avl.items(lo=first.key), 10)]
+
+    assert page == list(range(300, 400, 10))
+    assert avl.rank(305) == 31
+    assert avl.count_range(95, 205) == 11
+
+
+def test_order_statistics_require_track_size():
+
+    avl = AVLTree()
+    avl.insert(1, "A")
+
+    with pytest.raises(ValueError):
+        avl.rank(1)
+    with pytest.raises(ValueError):
+        avl.select(0)
+    with pytest.raises(ValueError):
+        avl.count_range(0, 5)
+
+
+@pytest.mark.parametrize("factor", [0, 10**9])  # laço de insert / reconstrução
+def test_insert_many_matches_looped_inserts(factor):
+    import random
+
+    from src.indexes import CategoryIndex
+
+    rng = random.Random(5)
+    avl = AVLTree.from_sorted([(k, {"category": "A"}) for k in range(0, 400, 2)], track_size=True)
+    avl.INSERT_REBUILD_FACTOR = factor
+    categories = avl.attach_index(CategoryIndex())
+    reference = dict(avl.items())
+
+    batch = [(rng.randint(-50, 450), {"category": rng.choice("AB")}) for _ in range(300)]
+    inserted, updated = avl.insert_many(batch)
+
+    new_keys = {key for key, _ in batch} - set(reference)
+    reference.update(batch)
+
+    assert inserted == len(new_keys)
+    assert updated == len({key for key, _ in batch}) - len(new_keys)
+    assert list(avl.items()) == sorted(reference.items())
+    assert avl.is_balanced()
+    _check_heights(avl.root)
+    _check_sizes(avl.root)
+    assert categories.count("B") == sum(1 for p in reference.values() if p["category"] == "B")
+
+
+@pytest.mark.parametrize("factor", [0, 10**9])  # laço de delete / reconstrução
+def test_delete_many_matches_looped_deletes(factor):
+    from src.indexes import CategoryIndex
+
+    avl = AVLTree(track_size=True)
+    avl.DELETE_REBUILD_FACTOR = factor
+    for key in range(200):
+        avl.insert(key, {"category": "A" if key % 2 else "B"})
+    categories = avl.attach_index(CategoryIndex())
+
+    removed = avl.delete_many([k for k in range(0, 260, 3)] + [3, 6])
+
+    remaining = [k for k in range(200) if k % 3]
+    assert removed == len(range(0, 200, 3))
+    assert [key for key, _ in avl.items()] == remaining
+    assert avl.is_balanced()
+    _check_heights(avl.root)
+    _check_sizes(avl.root)
+    assert len(categories) == len(remaining)
+    assert avl.select(10).key == remaining[10]
+
+
+def test_batch_mutations_on_empty_tree():
+
+    avl = AVLTree()
+
+    assert avl.delete_many([1, 2]) == 0
+    assert avl.insert_many([]) == (0, 0)
+    assert avl.insert_many([(3, "C"), (1, "A"), (3, "D")]) == (2, 0)
+    assert list(avl.items()) == [(1, "A"), (3, "D")]
+    assert avl.delete_many([1, 3]) == 2
+    assert avl.root is None
+
+
+def test_version_changes_only_on_mutation():
+
+    avl = AVLTree()
+    avl.insert(1, "A")
+    avl.insert(1, "B")   # atualização também muda o conteúdo
+    v = avl.version
+    assert v == 2
+
+    avl.delete(99)
+    assert avl.search(1) and avl.version == v
+
+    avl.insert_many([(2, "C")])
+    avl.delete_many([1, 2])
+    assert avl.version > v
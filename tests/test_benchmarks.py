@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+import benchmarks.runner
+from benchmarks import ENGINES, compare_to_baseline, register_engine, run_suite
+from benchmarks.__main__ import main
+from benchmarks.datasets import DISTRIBUTIONS, make_keys, make_probes
+from src.avl_tree import AVLTree
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_datasets_are_seeded_and_unique(distribution):
+    keys = make_keys(distribution, 500, seed=3)
+
+    assert keys == make_keys(distribution, 500, seed=3)
+    assert len(set(keys)) == 500
+    assert make_probes(distribution, keys, 50, seed=3) == make_probes(distribution, keys, 50, seed=3)
+    assert set(make_probes(distribution, keys, 50)) <= set(keys)
+
+    if distribution == "ascending":
+        assert keys == sorted(keys)
+    if distribution == "descending":
+        assert keys == sorted(keys, reverse=True)
+
+
+def test_suite_covers_engines_and_skips_degenerate_cases(monkeypatch):
+    monkeypatch.setattr(benchmarks.runner, "DEGENERATE_LIMIT", 100)
+
+    report = run_suite([200], ["random", "ascending"], ["bst", "avl", "bplus"],
+                       repeats=2, warmup=0, probes=50)
+
+    combos = {(r["engine"], r["distribution"]) for r in report["results"]}
+    assert ("bst", "ascending") not in combos
+    assert report["skipped"] == [{"engine": "bst", "distribution": "ascending", "size": 200,
+                                  "reason": "árvore degenerada (O(n²))"}]
+
+    operations = {(r["engine"], r["operation"]) for r in report["results"]}
+    assert ("avl", "dfs") in operations
+    assert ("bplus", "dfs") not in operations     # sem nós binários
+    assert ("bplus", "filter") in operations
+    assert all(len(r["runs"]) == 2 and r["min"] <= r["median"] for r in report["results"])
+    json.dumps(report)
+
+
+def test_compare_to_baseline_flags_slower_medians():
+    baseline = {"results": [
+        {"engine": "avl", "distribution": "random", "size": 10, "operation": "search", "median": 1.0},
+        {"engine": "avl", "distribution": "random", "size": 10, "operation": "insert", "median": 1.0},
+    ]}
+    report = {"results": [
+        {"engine": "avl", "distribution": "random", "size": 10, "operation": "search", "median": 1.5},
+        {"engine": "avl", "distribution": "random", "size": 10, "operation": "insert", "median": 1.1},
+        {"engine": "avl", "distribution": "zipf", "size": 10, "operation": "search", "median": 9.0},
+    ]}
+
+    regressions = compare_to_baseline(report, baseline, threshold=0.2)
+
+    assert [r["operation"] for r in regressions] == ["search"]
+    assert regressions[0]["change"] == pytest.approx(0.5)
+
+
+def test_registered_engine_and_cli_baseline(tmp_path, monkeypatch):
+    monkeypatch.setitem(ENGINES, "avl_sized", None)
+    register_engine("avl_sized", lambda: AVLTree(track_size=True))
+
+    output = tmp_path / "results.json"
+    args = ["--sizes", "100", "--distributions", "zipf", "--engines", "avl_sized",
+            "--operations", "search,inorder", "--repeats", "1", "--warmup", "0"]
+
+    assert main(args + ["--output", str(output)]) == 0
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert {r["operation"] for r in report["results"]} == {"search", "inorder"}
+
+    # referência impossível de bater: a CLI sinaliza regressão
+    for result in report["results"]:
+        result["median"] = 1e-12
+    output.write_text(json.dumps(report), encoding="utf-8")
+    assert main(args + ["--baseline", str(output)]) == 1
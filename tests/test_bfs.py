@@ -24,3 +24,22 @@ def test_bfs_traversal():
 def test_bfs_empty_tree():
     result = bfs(None)
     assert result == []
+
+
+def test_bfs_limit():
+    bst = build_sample_tree()
+
+    assert bfs(bst.root, limit=3) == [10, 5, 15]
+    assert bfs(bst.root, limit=0) == []
+    assert bfs(bst.root, limit=99) == [10, 5, 15, 3, 7]
+
+
+def test_bfs_iter_is_lazy():
+    from src.bfs import bfs_iter
+
+    bst = build_sample_tree()
+    visits = bfs_iter(bst.root)
+
+    assert next(visits) == 10
+    assert next(visits) == 5
+    assert list(visits) == [15, 3, 7]
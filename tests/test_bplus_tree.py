@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from src.bplus_tree import BPlusTree
+
+
+def test_bplus_insert_search_and_update():
+    tree = BPlusTree(order=4)
+    for key in [10, 5, 15, 3, 7, 12, 20, 1]:
+        tree.insert(key, f"Data{key}")
+
+    assert tree.search(7).data == "Data7"
+    assert tree.search(99) is None
+
+    tree.insert(7, "Atualizado")
+    assert tree.search(7).data == "Atualizado"
+    assert len(tree) == 8
+
+
+def test_bplus_grows_in_height_and_stays_balanced():
+    tree = BPlusTree(order=4)
+    for key in range(1000):
+        tree.insert(key, key)
+
+    assert tree.is_balanced()
+    assert 4 <= tree.get_height() <= 10
+    assert [k for k, _ in tree.items()] == list(range(1000))
+
+
+@pytest.mark.parametrize("order", [3, 4, 5, 16])
+def test_bplus_random_churn_matches_dict(order):
+    rng = random.Random(order)
+    tree = BPlusTree(order=order)
+    reference = {}
+
+    for step in range(3000):
+        key = rng.randint(0, 400)
+        if rng.random() < 0.55:
+            tree.insert(key, step)
+            reference[key] = step
+        else:
+            tree.delete(key)
+            reference.pop(key, None)
+
+    assert tree.is_balanced()
+    assert len(tree) == len(reference)
+    assert list(tree.items()) == sorted(reference.items())
+    for key in range(401):
+        node = tree.search(key)
+        assert (node.data if node else None) == reference.get(key)
+
+
+def test_bplus_range_scan_follows_leaf_links():
+    tree = BPlusTree(order=3)
+    for key in range(0, 200, 2):
+        tree.insert(key, key)
+
+    assert [k for k, _ in tree.items(11, 21)] == [12, 14, 16, 18, 20]
+    assert [k for k, _ in tree.items(11, 21, reverse=True)] == [20, 18, 16, 14, 12]
+    assert [k for k, _ in tree.items(lo=195)] == [196, 198]
+    assert [k for k, _ in tree.items(hi=3, reverse=True)] == [2, 0]
+    assert list(tree.items(500, 600)) == []
+
+
+def test_bplus_delete_everything():
+    tree = BPlusTree(order=5)
+    keys = list(range(300))
+    random.Random(2).shuffle(keys)
+    for key in keys:
+        tree.insert(key, key)
+    for key in keys:
+        tree.delete(key)
+
+    assert len(tree) == 0
+    assert tree.get_height() == 0
+    assert tree.search(1) is None
+    assert list(tree.items()) == []
+
+
+def test_bplus_invalid_order():
+    with pytest.raises(ValueError):
+        BPlusTree(order=2)
@@ -53,3 +53,53 @@ def test_delete_node():
     bst.delete(10)
     assert bst.search(10) is None
     assert bst.root.key == 5
+
+
+def test_ordered_insertion_beyond_recursion_limit():
+    import sys
+
+    # inserção ordenada degenera em lista; versões iterativas não estouram a pilha
+    n = sys.getrecursionlimit() * 3
+    bst = BinarySearchTree()
+    for i in range(n):
+        bst.insert(i, i)
+
+    assert bst.search(n - 1).data == n - 1
+    bst.delete(0)
+    bst.delete(n - 1)
+    assert bst.search(0) is None
+    assert bst.search(n - 1) is None
+    assert bst.root.key == 1
+
+
+def test_duplicate_key_keeps_original():
+    bst = BinarySearchTree()
+    bst.insert(10, "A")
+    bst.insert(10, "B")
+
+    assert bst.search(10).data == "A"
+
+
+def test_delete_node_with_two_children():
+    bst = BinarySearchTree()
+    for key in [50, 30, 70, 20, 40, 60, 80, 35]:
+        bst.insert(key, key)
+
+    bst.delete(30)
+
+    assert bst.search(30) is None
+    assert bst.root.left.key == 35
+    for key in [50, 70, 20, 40, 60, 80, 35]:
+        assert bst.search(key).data == key
+
+
+def test_bst_version_changes_only_on_mutation():
+
+    bst = BinarySearchTree()
+    bst.insert(1, "A")
+    bst.insert(1, "B")   # duplicata é ignorada na BST
+    bst.delete(99)
+    assert bst.version == 1
+
+    bst.delete(1)
+    assert bst.version == 2
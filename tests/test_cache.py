@@ -0,0 +1,182 @@
+import random
+
+import pytest
+
+from src.avl_tree import AVLTree
+from src.bst import BinarySearchTree
+from src.cache import CachedTree, FilterCache, LRUCache
+from src.filters import filter_products
+from src.indexes import CategoryIndex
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(capacity=2)
+    cache.put(1, "A")
+    cache.put(2, "B")
+
+    assert cache.get(1) == "A"  # 1 passa a ser o mais recente
+    cache.put(3, "C")
+
+    assert 2 not in cache
+    assert cache.get(2) is None
+    assert cache.get(3) == "C"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+    assert stats["size"] == 2
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_lru_rejects_non_positive_capacity():
+
+    with pytest.raises(ValueError):
+        LRUCache(capacity=0)
+
+
+@pytest.mark.parametrize("tree_class", [BinarySearchTree, AVLTree])
+def test_cached_search_hits_and_invalidates_on_write(tree_class):
+    tree = CachedTree(tree_class(), capacity=8)
+    tree.insert(10, "A")
+
+    assert tree.search(10).data == "A"
+    assert tree.search(10).data == "A"
+    assert tree.search(99) is None   # ausência também vai para o cache
+    assert tree.stats()["hits"] == 1
+
+    tree.insert(99, "Z")
+    assert tree.search(99).data == "Z"
+
+    tree.delete(10)
+    assert tree.search(10) is None
+    assert list(tree.items()) == [(99, "Z")]   # resto da API repassado à árvore
+
+
+@pytest.mark.parametrize("tree_class", [BinarySearchTree, AVLTree])
+def test_delete_with_two_children_invalidates_successor(tree_class):
+    tree = CachedTree(tree_class())
+    for key in (50, 30, 70, 60, 80):
+        tree.insert(key, f"Data{key}")
+
+    assert tree.search(60).data == "Data60"
+
+    # 50 tem dois filhos: o key/data de 60 (sucessor) vai para o nó de 50
+    # e o nó antigo de 60 sai da árvore; o cache não pode devolvê-lo
+    tree.delete(50)
+
+    assert tree.search(60) is tree.tree.search(60)
+    tree.delete(60)
+    assert tree.search(60) is None
+
+
+def test_cached_tree_matches_plain_tree_under_churn():
+    rng = random.Random(11)
+    plain = AVLTree()
+    cached = CachedTree(AVLTree(), capacity=16)
+
+    for step in range(3000):
+        key = rng.randint(0, 60)
+        action = rng.random()
+        if action < 0.3:
+            plain.insert(key, step)
+            cached.insert(key, step)
+        elif action < 0.5:
+            plain.delete(key)
+            cached.delete(key)
+        else:
+            expected = plain.search(key)
+            found = cached.search(key)
+            assert (found.key, found.data) == (expected.key, expected.data) if expected else found is None
+
+    stats = cached.stats()
+    assert stats["hits"] > 0 and stats["evictions"] > 0
+
+
+def test_cached_batch_operations():
+    tree = CachedTree(AVLTree())
+    tree.insert_many((key, key) for key in range(20))
+
+    assert [node.data for node in tree.search_many([3, 3, 5])] == [3, 3, 5]
+    assert tree.search_many([3, 40])[1] is None
+    assert tree.stats()["hits"] == 1
+
+    assert tree.insert_many([(3, "novo")]) == (0, 1)
+    assert tree.search(3).data == "novo"
+
+    assert tree.delete_many([3, 5]) == 2
+    assert tree.search_many([3, 5, 6])[:2] == [None, None]
+
+
+def test_cached_delete_many_on_bst_keeps_unrelated_entries():
+    tree = CachedTree(BinarySearchTree())
+    for key in (50, 30, 70, 60, 80, 20):
+        tree.insert(key, f"Data{key}")
+
+    tree.search(20)
+    tree.search(60)
+    assert tree.delete_many([50, 80, 99]) == 2
+
+    assert 20 in tree.cache
+    assert tree.search(60) is tree.tree.search(60)
+    assert tree.search(50) is None and tree.search(80) is None
+
+
+def build_catalog(tree_class=AVLTree):
+    tree = tree_class()
+    for key in range(1, 61):
+        tree.insert(key, {"id": key, "category": ("Casa", "Livros", "Roupas")[key % 3],
+                          "price": float(key * 5), "rating": 3.0 + (key % 5) / 2})
+    return tree
+
+
+@pytest.mark.parametrize("tree_class", [BinarySearchTree, AVLTree])
+def test_filter_cache_serves_until_tree_changes(tree_class):
+    tree = build_catalog(tree_class)
+    cache = FilterCache(tree)
+
+    first = cache.filter(category="Livros", max_price=150)
+    assert first == filter_products(tree.root, category="Livros", max_price=150)
+
+    # 0 e None são "sem filtro": mesma entrada do cache
+    again = cache.filter(category="Livros", max_price=150, min_rating=0)
+    assert again == first and again is not first
+    assert cache.stats()["hits"] == 1
+
+    tree.insert(1000, {"id": 1000, "category": "Livros", "price": 1.0, "rating": 5.0})
+    updated = cache.filter(category="Livros", max_price=150)
+
+    assert len(updated) == len(first) + 1
+    stats = cache.stats()
+    assert (stats["misses"], stats["invalidations"]) == (2, 1)
+
+    tree.delete(1000)
+    assert cache.filter(category="Livros", max_price=150) == first
+
+
+def test_filter_cache_uses_tree_indexes_and_limit():
+    tree = build_catalog()
+    tree.attach_index(CategoryIndex())
+    cache = FilterCache(tree)
+
+    assert cache.filter(category="Casa", limit=3) == filter_products(
+        tree.root, category="Casa", indexes=tree.indexes, limit=3
+    )
+    assert len(cache.filter(category="Casa")) == 20
+    assert len(cache) == 2
+
+
+def test_filter_cache_memory_bounds():
+    tree = build_catalog()
+    cache = FilterCache(tree, max_entries=2, max_items=30)
+
+    cache.filter(category="Casa")      # 20 produtos
+    cache.filter(max_price=25)         # 5 produtos
+    cache.filter(max_price=50)         # 10: passa de 30 itens, sai "Casa"
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.items == 15
+
+    cache.filter(max_price=75)         # 15: passa de 2 entradas
+    assert len(cache) == 2 and cache.items == 25
+
+    cache.filter()                     # 60 > max_items: não entra
+    assert len(cache) == 2 and cache.items == 25
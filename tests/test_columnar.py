@@ -0,0 +1,53 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.avl_tree import AVLTree
+from src.columnar import ColumnarProducts, filter_products_columnar
+from src.dataset import generate_products
+from src.filters import filter_products
+
+
+def build_tree(n=500):
+    avl = AVLTree()
+    for product in generate_products(n):
+        avl.insert(product["id"], product)
+    return avl
+
+
+def test_columnar_filter_matches_dfs_filter():
+    avl = build_tree()
+    store = ColumnarProducts.from_tree(avl.root)
+
+    for kwargs in [
+        {},
+        {"category": "Eletrônicos"},
+        {"category": "Livros", "max_price": 500.0, "min_rating": 4.0},
+        {"max_price": 100.0},
+        {"min_price": 1000.0, "max_price": 1500.0},
+        {"category": "Inexistente"},
+    ]:
+        assert filter_products_columnar(store, **kwargs) == filter_products(avl.root, **kwargs)
+
+
+def test_columnar_columns():
+    products = [
+        {"id": 1, "category": "Livros", "price": 10.0, "rating": 4.0, "stock": 3},
+        {"id": 2, "category": "Casa", "price": 20.0, "rating": 3.5, "stock": 0},
+        {"id": 3, "category": "Livros", "price": 30.0, "rating": 5.0, "stock": 7},
+    ]
+    store = ColumnarProducts.from_products(products)
+
+    assert len(store) == 3
+    assert store.ids.tolist() == [1, 2, 3]
+    assert store.category.tolist() == [0, 1, 0]
+    assert store.categories == ["Livros", "Casa"]
+    assert store.stock.tolist() == [3, 0, 7]
+    assert store.filter_ids(category="Livros", min_rating=4.5).tolist() == [3]
+
+
+def test_columnar_empty_tree():
+    store = ColumnarProducts.from_tree(None)
+
+    assert len(store) == 0
+    assert store.filter(category="Livros") == []
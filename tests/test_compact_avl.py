@@ -0,0 +1,89 @@
+import random
+
+from src.avl_tree import AVLTree
+from src.compact_avl import CompactAVLTree
+
+
+def test_compact_insert_and_search():
+    tree = CompactAVLTree()
+
+    tree.insert(10, "A")
+    tree.insert(5, "B")
+    tree.insert(15, "C")
+
+    assert tree.search(10).data == "A"
+    assert tree.search(5).key == 5
+    assert tree.search(99) is None
+    assert len(tree) == 3
+
+
+def test_compact_rotations_keep_balance():
+    tree = CompactAVLTree()
+    for i in range(1, 1000):
+        tree.insert(i, i)
+
+    assert tree.is_balanced()
+    assert tree.get_height() <= 1.45 * (1000).bit_length()
+
+
+def test_compact_same_shape_as_avl_tree():
+    rng = random.Random(11)
+    keys = rng.sample(range(5000), 800)
+
+    compact = CompactAVLTree()
+    avl = AVLTree()
+    for key in keys:
+        compact.insert(key, key)
+        avl.insert(key, key)
+    for key in keys[:300]:
+        compact.delete(key)
+        avl.delete(key)
+
+    assert compact.get_height() == avl.get_height()
+    assert compact.keys[compact.root] == avl.root.key
+
+
+def test_compact_random_churn_matches_dict():
+    rng = random.Random(5)
+    tree = CompactAVLTree()
+    reference = {}
+
+    for step in range(4000):
+        key = rng.randint(0, 400)
+        if rng.random() < 0.55:
+            tree.insert(key, step)
+            reference[key] = step
+        else:
+            tree.delete(key)
+            reference.pop(key, None)
+
+    assert tree.is_balanced()
+    assert len(tree) == len(reference)
+    for key in range(401):
+        node = tree.search(key)
+        assert (node.data if node else None) == reference.get(key)
+
+
+def test_compact_reuses_freed_slots():
+    tree = CompactAVLTree()
+    for i in range(100):
+        tree.insert(i, i)
+    slots = len(tree.keys)
+
+    for i in range(50):
+        tree.delete(i)
+    for i in range(100, 150):
+        tree.insert(i, i)
+
+    assert len(tree.keys) == slots
+    assert tree.free == []
+
+
+def test_compact_empty_tree():
+    tree = CompactAVLTree()
+
+    assert tree.get_height() == 0
+    assert tree.search(1) is None
+    assert tree.is_balanced()
+    tree.delete(1)
+    assert len(tree) == 0
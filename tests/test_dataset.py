@@ -0,0 +1,106 @@
+import pytest
+
+from src.dataset import (
+    CATEGORIES,
+    generate_products,
+    generate_products_fast,
+    iter_columns,
+    iter_products,
+)
+
+
+FIELDS = ["id", "name", "category", "price", "stock", "rating"]
+
+
+def check_products(products, n):
+    ids = [p["id"] for p in products]
+    assert len(products) == n
+    assert len(set(ids)) == n
+    assert all(1 <= product_id <= 10 * n for product_id in ids)
+
+    for product in products:
+        assert list(product) == FIELDS
+        assert product["category"] in CATEGORIES
+        assert 5 <= product["price"] <= 3000
+        assert 0 <= product["stock"] <= 500
+        assert 1.0 <= product["rating"] <= 5.0
+
+
+def test_generate_products_unique_ids_in_range():
+    check_products(generate_products(2000), 2000)
+    assert generate_products(0) == []
+
+
+def test_generate_products_seed_repeats_dataset():
+    assert generate_products(300, seed=7) == generate_products(300, seed=7)
+    assert generate_products(300, seed=7) != generate_products(300, seed=8)
+
+
+def test_fast_generator_matches_classic_format():
+    pytest.importorskip("numpy")
+    products = generate_products_fast(5000, seed=1, chunk_size=1200)
+
+    check_products(products, 5000)
+    assert products == generate_products_fast(5000, seed=1, chunk_size=1200)
+    assert products != generate_products_fast(5000, seed=2, chunk_size=1200)
+
+
+def test_streaming_chunks_equal_full_dataset():
+    pytest.importorskip("numpy")
+    chunks = list(iter_products(2500, chunk_size=1000, seed=3))
+
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    assert [p for chunk in chunks for p in chunk] == generate_products_fast(2500, seed=3, chunk_size=1000)
+
+
+@pytest.mark.parametrize("ids", ["sequential", "clustered"])
+def test_id_distributions(ids):
+    np = pytest.importorskip("numpy")
+    product_ids = np.concatenate([
+        chunk["id"] for chunk in iter_columns(5000, chunk_size=700, seed=0, ids=ids, cluster_size=100)
+    ])
+
+    assert len(np.unique(product_ids)) == 5000
+    if ids == "sequential":
+        assert product_ids.tolist() == list(range(1, 5001))
+    else:
+        # blocos de 100 IDs consecutivos
+        runs = product_ids.reshape(50, 100)
+        assert (np.diff(runs, axis=1) == 1).all()
+        assert product_ids.max() <= 50_000
+
+
+def test_unknown_id_distribution():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        next(iter_columns(10, ids="sorted"))
+
+
+def test_zipf_categories_and_lognormal_prices():
+    np = pytest.importorskip("numpy")
+    columns = next(iter_columns(200_000, seed=5, category_skew=1.5, price_median=80.0, price_sigma=0.5))
+
+    shares = np.bincount(columns["category"], minlength=len(CATEGORIES)) / 200_000
+    assert (np.diff(shares) < 0).all()
+    assert shares[0] > 0.5
+    assert np.median(columns["price"]) == pytest.approx(80.0, rel=0.02)
+
+
+def test_columnar_output_filters_like_dicts():
+    pytest.importorskip("numpy")
+    from src.columnar import ColumnarProducts, filter_products_columnar
+
+    store = generate_products_fast(3000, seed=9, columnar=True, chunk_size=1000)
+    products = generate_products_fast(3000, seed=9, chunk_size=1000)
+    reference = ColumnarProducts.from_products(products)
+
+    assert len(store) == 3000
+    assert store.ids.tolist() == [p["id"] for p in products]
+    assert list(store.products) == products
+    assert store.products[-1] == products[-1]
+
+    for kwargs in [{}, {"category": "Casa", "max_price": 200.0}, {"min_rating": 4.5, "min_price": 100.0}]:
+        assert filter_products_columnar(store, **kwargs) == filter_products_columnar(reference, **kwargs)
+
+    chunks = list(iter_products(3000, chunk_size=1000, seed=9, columnar=True))
+    assert [chunk.ids.tolist() for chunk in chunks] == [store.ids[i:i + 1000].tolist() for i in (0, 1000, 2000)]
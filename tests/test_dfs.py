@@ -43,3 +43,20 @@ def test_dfs_visits_all_nodes():
     # Garante que todos os nós foram visitados
     assert len(result) == 5
     assert set(result) == {10, 5, 3, 7, 15}
+
+
+def test_dfs_limit():
+    bst = build_sample_tree()
+
+    assert dfs(bst.root, limit=2) == [10, 5]
+    assert dfs(None, limit=2) == []
+
+
+def test_dfs_iter_matches_dfs():
+    from src.dfs import dfs_iter
+
+    bst = BinarySearchTree()
+    for key in range(3000):  # árvore degenerada: sem recursão, pilha pequena
+        bst.insert(key, key)
+
+    assert list(dfs_iter(bst.root)) == dfs(bst.root)
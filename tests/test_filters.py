@@ -19,4 +19,181 @@ def test_filter_by_price_and_rating():
     # Livros abaixo de 100 com rating min 4
     result = filter_products(bst.root, category="Livros", max_price=100, min_rating=4.0)
     assert len(result) == 1
-    assert result[0]["price"] == 50
\ No newline at end of file
+    assert result[0]["price"] == 50
+
+def build_catalog():
+    bst = BinarySearchTree()
+    for key in [50, 20, 80, 10, 30, 70, 90]:
+        bst.insert(key, {"id": key, "category": "Casa" if key % 20 else "Livros",
+                         "price": float(key), "rating": 4.0})
+    return bst
+
+
+def test_filter_limit_returns_first_matches_in_dfs_order():
+    bst = build_catalog()
+
+    everything = filter_products(bst.root, category="Casa")
+    first_two = filter_products(bst.root, category="Casa", limit=2)
+
+    assert first_two == everything[:2]
+    assert filter_products(bst.root, limit=0) == []
+
+
+def test_filter_iter_stops_early():
+    from src.filters import filter_products_iter
+
+    bst = build_catalog()
+    seen = []
+    for product in filter_products_iter(bst.root, max_price=60.0):
+        seen.append(product["id"])
+        if len(seen) == 2:
+            break
+
+    assert seen == [50, 20]
+
+
+def test_filter_by_min_price():
+    bst = build_catalog()
+
+    result = filter_products(bst.root, min_price=70.0, max_price=85.0)
+    assert sorted(p["id"] for p in result) == [70, 80]
+
+
+def build_random_catalog(indexes=()):
+    import random
+
+    from src.avl_tree import AVLTree
+
+    rng = random.Random(9)
+    avl = AVLTree()
+    for index in indexes:
+        avl.attach_index(index)
+    for key in rng.sample(range(100000), 2000):
+        avl.insert(key, {
+            "id": key,
+            "category": rng.choice(["Eletrônicos", "Livros", "Casa", "Roupas"]),
+            "price": float(rng.randint(5, 300)),   # preços repetidos: testa empates
+            "rating": rng.randint(10, 50) / 10,
+        })
+    return avl
+
+
+def expected_top_k(avl, k, order_by, **filters):
+    matches = filter_products(avl.root, **filters)
+    if order_by == "price":
+        matches.sort(key=lambda p: (p["price"], p["id"]))
+    else:
+        matches.sort(key=lambda p: (p["rating"], p["id"]), reverse=True)
+    return matches[:k]
+
+
+def test_top_k_products_with_and_without_indexes():
+    from src.filters import top_k_products
+    from src.indexes import CategoryIndex, PriceIndex, RatingIndex
+
+    queries = [
+        (20, "price", {"category": "Eletrônicos", "min_rating": 4.0}),
+        (20, "rating", {"category": "Livros", "max_price": 100.0}),
+        (5, "price", {"min_price": 50.0, "max_price": 60.0}),
+        (10, "rating", {"min_rating": 4.5}),
+        (3000, "price", {}),
+        (10, "price", {"category": "Inexistente"}),
+    ]
+
+    for indexes in [(), (CategoryIndex(),), (PriceIndex(), RatingIndex()),
+                    (CategoryIndex(), PriceIndex(), RatingIndex())]:
+        avl = build_random_catalog(indexes)
+        for k, order_by, filters in queries:
+            result = top_k_products(avl, k, order_by=order_by, **filters)
+            assert result == expected_top_k(avl, k, order_by, **filters)
+
+
+def test_top_k_products_edge_cases():
+    import pytest
+
+    from src.filters import top_k_products
+
+    avl = build_random_catalog()
+
+    assert top_k_products(avl, 0) == []
+    with pytest.raises(ValueError):
+        top_k_products(avl, 5, order_by="stock")
+
+
+def test_split_tasks_cover_tree_in_preorder():
+    from src.filters import _split_tasks
+
+    avl = build_random_catalog()
+
+    tasks = _split_tasks(avl.root, 8)
+    subtrees = [node for kind, node, _ in tasks if kind == "subtree"]
+
+    order = []
+    for kind, node, _ in tasks:
+        if kind == "node":
+            order.append(node.key)
+        else:
+            order.extend(p["id"] for p in filter_products(node))
+
+    assert len(subtrees) >= 8
+    assert order == [p["id"] for p in filter_products(avl.root)]
+
+
+def test_split_tasks_gives_up_on_degenerate_tree(monkeypatch):
+    import src.filters
+    from src.filters import _split_tasks
+    from src.node import Node
+
+    # BST de IDs sequenciais: uma lista encadeada à direita
+    root = None
+    for key in reversed(range(100_000)):
+        node = Node(key, {"id": key, "category": "Casa", "price": float(key % 300), "rating": 4.0})
+        node.right = root
+        root = node
+
+    assert _split_tasks(root, 12) is None
+
+    # cai na varredura serial com o mesmo resultado
+    monkeypatch.setattr(src.filters, "PARALLEL_MIN_NODES", 100)
+    assert filter_products(root, workers=3, min_price=290) == filter_products(root, min_price=290)
+
+
+def test_parallel_filter_matches_serial(monkeypatch):
+    import random
+
+    import src.filters
+
+    monkeypatch.setattr(src.filters, "PARALLEL_MIN_NODES", 100)
+
+    avl = build_random_catalog()
+    bst = BinarySearchTree()
+    keys = list(range(3000))
+    random.Random(4).shuffle(keys)
+    for key in keys:
+        bst.insert(key, {"id": key, "category": "Casa", "price": float(key % 300), "rating": 4.0})
+
+    for tree in (avl, bst):
+        for filters in ({"category": "Livros", "max_price": 150}, {"min_price": 250}, {}):
+            serial = filter_products(tree.root, **filters)
+            parallel = filter_products(tree.root, workers=3, **filters)
+
+            assert parallel == serial
+            assert all(a is b for a, b in zip(parallel, serial))   # mesmos objetos
+
+    # limit para cedo: continua serial, mesma resposta
+    assert filter_products(avl.root, workers=3, limit=5) == filter_products(avl.root, limit=5)
+
+
+def test_filter_products_builds_index_candidates_once(monkeypatch):
+    import src.filters
+    from src.indexes import CategoryIndex
+
+    avl = build_random_catalog(indexes=(CategoryIndex(),))
+
+    calls = []
+    original = src.filters._index_candidates
+    monkeypatch.setattr(src.filters, "_index_candidates", lambda *args: calls.append(args) or original(*args))
+
+    found = filter_products(avl.root, category="Livros", indexes=avl.indexes, workers=3)
+    assert len(calls) == 1
+    assert sorted(p["id"] for p in found) == sorted(p["id"] for p in filter_products(avl.root, category="Livros"))
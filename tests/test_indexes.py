@@ -0,0 +1,259 @@
+from src.avl_tree import AVLTree
+from src.bst import BinarySearchTree
+from src.filters import filter_products
+from src.indexes import CategoryIndex, PriceIndex
+
+
+def build_products():
+    return [
+        {"id": 10, "category": "Livros", "price": 40.0, "rating": 4.5},
+        {"id": 5, "category": "Roupas", "price": 80.0, "rating": 3.0},
+        {"id": 15, "category": "Livros", "price": 120.0, "rating": 4.8},
+        {"id": 3, "category": "Casa", "price": 300.0, "rating": 4.1},
+        {"id": 7, "category": "Livros", "price": 25.0, "rating": 2.0},
+    ]
+
+
+def test_category_index_filled_on_attach():
+    avl = AVLTree()
+    for p in build_products():
+        avl.insert(p["id"], p)
+
+    index = avl.attach_index(CategoryIndex())
+
+    assert sorted(p["id"] for p in index.get("Livros")) == [7, 10, 15]
+    assert index.count("Casa") == 1
+    assert index.get("Esporte") == []
+
+
+def test_category_index_follows_insert_update_delete():
+    avl = AVLTree()
+    index = avl.attach_index(CategoryIndex())
+    for p in build_products():
+        avl.insert(p["id"], p)
+
+    # atualização muda a categoria do produto 7
+    avl.insert(7, {"id": 7, "category": "Casa", "price": 25.0, "rating": 2.0})
+    assert sorted(p["id"] for p in index.get("Livros")) == [10, 15]
+    assert sorted(p["id"] for p in index.get("Casa")) == [3, 7]
+
+    # remoção de nó com dois filhos (cópia do sucessor)
+    avl.delete(10)
+    avl.delete(5)
+    assert [p["id"] for p in index.get("Livros")] == [15]
+    assert index.get("Roupas") == []
+    assert "Roupas" not in index.buckets
+
+
+def test_category_index_on_bst():
+    bst = BinarySearchTree()
+    index = bst.attach_index(CategoryIndex())
+    for p in build_products():
+        bst.insert(p["id"], p)
+
+    # BST ignora chaves duplicadas, o índice também
+    bst.insert(3, {"id": 3, "category": "Livros", "price": 1.0, "rating": 5.0})
+    assert index.count("Livros") == 3
+
+    bst.delete(15)
+    assert sorted(p["id"] for p in index.get("Livros")) == [7, 10]
+
+
+def test_filter_products_with_index_matches_scan():
+    avl = AVLTree()
+    avl.attach_index(CategoryIndex())
+    for p in build_products():
+        avl.insert(p["id"], p)
+
+    for kwargs in [
+        {"category": "Livros"},
+        {"category": "Livros", "max_price": 100, "min_rating": 4.0},
+        {"category": "Esporte"},
+        {"max_price": 100},
+    ]:
+        scan = filter_products(avl.root, **kwargs)
+        indexed = filter_products(avl.root, indexes=avl.indexes, **kwargs)
+        assert sorted(p["id"] for p in indexed) == sorted(p["id"] for p in scan)
+
+
+def test_price_index_range_queries():
+    avl = AVLTree()
+    index = avl.attach_index(PriceIndex())
+    for p in build_products():
+        avl.insert(p["id"], p)
+
+    assert [p["id"] for p in index.at_most(80.0)] == [7, 10, 5]
+    assert [p["id"] for p in index.range(40.0, 120.0)] == [10, 5, 15]
+    assert [p["id"] for p in index.range(min_price=121.0)] == [3]
+    assert index.range(1000.0, 2000.0) == []
+    assert index.tree.is_balanced()
+
+
+def test_price_index_follows_insert_update_delete():
+    avl = AVLTree()
+    index = avl.attach_index(PriceIndex())
+    for p in build_products():
+        avl.insert(p["id"], p)
+
+    # produto 3 fica barato, produto 10 sai do catálogo
+    avl.insert(3, {"id": 3, "category": "Casa", "price": 10.0, "rating": 4.1})
+    avl.delete(10)
+
+    assert [p["id"] for p in index.at_most(80.0)] == [3, 7, 5]
+    assert len(index.range()) == 4
+
+
+def test_price_index_same_price_different_products():
+    index = PriceIndex()
+    index.add(1, {"price": 50.0})
+    index.add(2, {"price": 50.0})
+    index.remove(1, {"price": 50.0})
+
+    assert index.range(50.0, 50.0) == [{"price": 50.0}]
+
+
+def test_filter_products_with_price_index_matches_scan():
+    import random
+
+    rng = random.Random(3)
+    avl = AVLTree()
+    avl.attach_index(PriceIndex())
+    avl.attach_index(CategoryIndex())
+    for key in rng.sample(range(10000), 500):
+        avl.insert(key, {
+            "id": key,
+            "category": rng.choice(["Livros", "Casa", "Roupas"]),
+            "price": round(rng.uniform(5, 500), 2),
+            "rating": round(rng.uniform(1, 5), 1),
+        })
+
+    for kwargs in [
+        {"max_price": 100},
+        {"min_price": 50, "max_price": 60},
+        {"category": "Casa", "max_price": 400, "min_rating": 3.5},
+        {"min_price": 450},
+    ]:
+        scan = filter_products(avl.root, **kwargs)
+        indexed = filter_products(avl.root, indexes=avl.indexes, **kwargs)
+        assert sorted(p["id"] for p in indexed) == sorted(p["id"] for p in scan)
+
+
+def test_filter_uses_index_with_smallest_estimate():
+    from src.filters import _index_candidates
+    from src.indexes import RatingIndex
+
+    avl = AVLTree()
+    for p in build_products():
+        avl.insert(p["id"], p)
+    category = avl.attach_index(CategoryIndex())
+    prices = avl.attach_index(PriceIndex())
+    ratings = avl.attach_index(RatingIndex())
+
+    assert category.estimate(category="Livros") == 3
+    assert prices.estimate(min_price=30.0, max_price=300.0) == 4
+    assert ratings.estimate(min_rating=4.5) == 2
+    assert category.estimate(max_price=100) is None
+
+    # só o índice escolhido é percorrido, sob demanda
+    candidates = _index_candidates(avl.indexes, "Livros", 300.0, 4.5, None)
+    assert not isinstance(candidates, list)
+    assert sorted(p["id"] for p in candidates) == [10, 15]
+
+    for filters in (
+        {"category": "Livros", "max_price": 300.0, "min_rating": 1.5},
+        {"max_price": 50.0},
+        {"min_rating": 4.0, "min_price": 100.0},
+    ):
+        scan = filter_products(avl.root, **filters)
+        indexed = filter_products(avl.root, indexes=avl.indexes, **filters)
+        assert sorted(p["id"] for p in indexed) == sorted(p["id"] for p in scan)
+
+    assert len(filter_products(avl.root, indexes=avl.indexes, max_price=500.0, limit=2)) == 2
+
+
+def test_price_index_handles_product_changed_in_place():
+    for tree in (AVLTree(), BinarySearchTree()):
+        prices = tree.attach_index(PriceIndex())
+        p = {"id": 1, "price": 10.0, "category": "A"}
+        tree.insert(1, p)
+        tree.insert(2, {"id": 2, "price": 20.0, "category": "A"})
+
+        # preço alterado no próprio dict e o produto inserido de novo
+        p["price"] = 500.0
+        tree.insert(1, p)
+
+        if isinstance(tree, AVLTree):   # a BST mantém o produto original
+            assert prices.count() == 2
+            assert [q["id"] for q in prices.range(max_price=50.0)] == [2]
+            assert [q["id"] for q in prices.range(min_price=400.0)] == [1]
+
+        tree.delete(1)
+        assert prices.count() == 1
+        assert [q["id"] for q in prices.range()] == [2]
+        assert filter_products(tree.root, max_price=1000.0, indexes=tree.indexes) == [tree.search(2).data]
+
+
+def test_category_index_handles_product_changed_in_place():
+    avl = AVLTree()
+    index = avl.attach_index(CategoryIndex())
+    p = {"id": 1, "price": 10.0, "category": "A"}
+    avl.insert(1, p)
+
+    p["category"] = "B"
+    avl.insert(1, p)
+    assert index.count("A") == 0
+    assert [q["id"] for q in index.get("B")] == [1]
+
+    avl.delete(1)
+    assert index.buckets == {}
+    assert filter_products(avl.root, category="B", indexes=avl.indexes) == []
+
+
+def test_index_failure_leaves_tree_and_indexes_unchanged():
+    import pytest
+
+    for tree in (AVLTree(), BinarySearchTree()):
+        category = tree.attach_index(CategoryIndex())
+        prices = tree.attach_index(PriceIndex())
+        for key in range(1, 8):
+            tree.insert(key, {"id": key, "category": "A", "price": float(key)})
+        version = tree.version
+        before = list(tree.items())
+
+        # preço em texto não se compara com os outros: PriceIndex recusa
+        with pytest.raises(TypeError):
+            tree.insert(10, {"id": 10, "category": "B", "price": "caro"})
+
+        assert tree.search(10) is None
+        assert list(tree.items()) == before
+        assert tree.version == version
+        assert category.count("B") == 0
+        assert prices.count() == 7
+        if isinstance(tree, AVLTree):
+            assert tree.is_balanced()
+
+        # sem preço: entra na árvore, fica fora do PriceIndex
+        tree.insert(11, {"id": 11, "category": "B"})
+        assert tree.search(11) is not None
+        assert prices.count() == 7 and category.count("B") == 1
+
+
+def test_insert_many_index_failure_leaves_tree_unchanged():
+    import pytest
+
+    avl = AVLTree()
+    prices = avl.attach_index(PriceIndex())
+    category = avl.attach_index(CategoryIndex())
+    avl.insert_many((key, {"id": key, "category": "A", "price": float(key)}) for key in range(10))
+    version = avl.version
+    before = [(k, dict(v)) for k, v in avl.items()]
+
+    batch = [(key, {"id": key, "category": "B", "price": float(key) + 0.5}) for key in range(5, 40)]
+    batch.append((20, {"id": 20, "category": "B", "price": "caro"}))
+    with pytest.raises(TypeError):
+        avl.insert_many(batch)
+
+    assert [(k, dict(v)) for k, v in avl.items()] == before
+    assert avl.version == version
+    assert prices.count() == 10 and category.count("B") == 0
+    assert [p["price"] for p in prices.range()] == [float(key) for key in range(10)]
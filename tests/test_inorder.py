@@ -0,0 +1,56 @@
+import itertools
+import random
+
+import pytest
+
+from src.avl_tree import AVLTree
+from src.bst import BinarySearchTree
+from src.compact_avl import CompactAVLTree
+from src.inorder import inorder
+
+
+def build(tree_class, keys):
+    tree = tree_class()
+    for key in keys:
+        tree.insert(key, f"Data{key}")
+    return tree
+
+
+@pytest.mark.parametrize("tree_class", [BinarySearchTree, AVLTree, CompactAVLTree])
+def test_items_sorted_and_ranges(tree_class):
+    rng = random.Random(1)
+    keys = rng.sample(range(1000), 200)
+    tree = build(tree_class, keys)
+    ordered = sorted(keys)
+
+    assert [k for k, _ in tree.items()] == ordered
+    assert [k for k, _ in tree.items(reverse=True)] == ordered[::-1]
+
+    for _ in range(50):
+        lo, hi = sorted(rng.sample(range(-10, 1010), 2))
+        expected = [k for k in ordered if lo <= k <= hi]
+        assert [k for k, _ in tree.items(lo, hi)] == expected
+        assert [k for k, _ in tree.items(lo, hi, reverse=True)] == expected[::-1]
+        assert [k for k, _ in tree.items(lo=lo)] == [k for k in ordered if k >= lo]
+        assert [k for k, _ in tree.items(hi=hi)] == [k for k in ordered if k <= hi]
+
+
+def test_items_returns_data():
+    tree = build(AVLTree, [2, 1, 3])
+
+    assert list(tree.items()) == [(1, "Data1"), (2, "Data2"), (3, "Data3")]
+
+
+def test_items_stops_early_without_visiting_everything():
+    # BST degenerada à direita: ler os 3 primeiros não percorre as 5000 chaves
+    tree = build(BinarySearchTree, range(5000))
+
+    first = list(itertools.islice(tree.items(lo=10), 3))
+
+    assert [k for k, _ in first] == [10, 11, 12]
+
+
+def test_inorder_empty():
+    assert list(inorder(None)) == []
+    assert list(AVLTree().items(1, 5)) == []
+    assert list(CompactAVLTree().items(reverse=True)) == []
@@ -0,0 +1,158 @@
+import random
+
+import pytest
+
+from src.avl_tree import AVLTree
+from src.bst import BinarySearchTree
+
+
+@pytest.mark.parametrize("keys, case", [
+    ([30, 20, 10], "rotations_ll"),
+    ([10, 20, 30], "rotations_rr"),
+    ([30, 10, 20], "rotations_lr"),
+    ([10, 30, 20], "rotations_rl"),
+])
+def test_rotations_are_counted_by_case(keys, case):
+    avl = AVLTree(instrument=True)
+    for key in keys:
+        avl.insert(key, key)
+
+    stats = avl.stats()
+    assert stats[case] == 1
+    assert stats["rotations"] == 1
+    assert stats["double_rotations"] == (1 if case in ("rotations_lr", "rotations_rl") else 0)
+    assert stats["inserts"] == 3
+
+
+def test_descent_and_successor_counters():
+    avl = AVLTree(instrument=True)
+    for key in [50, 30, 70, 60, 80]:
+        avl.insert(key, key)
+    avl.reset_stats()
+
+    avl.search(60)        # 50 -> 70 -> 60
+    avl.search(65)        # 50 -> 70 -> 60 -> (vazio)
+    assert avl.stats()["nodes_visited"] == 6
+    assert avl.stats()["comparisons"] == 6
+    assert avl.stats()["searches"] == 2
+
+    avl.reset_stats()
+    avl.delete(50)        # dois filhos: sucessor 60, à esquerda de 70
+    stats = avl.stats()
+    assert stats["deletes"] == 1
+    assert stats["successor_searches"] == 1
+    assert stats["nodes_visited"] == 1 + 2
+    assert stats["height_updates"] >= 1
+
+
+def test_bulk_rebuild_is_counted():
+    avl = AVLTree(instrument=True)
+    avl.insert_many((key, key) for key in range(100))
+
+    assert avl.stats()["bulk_rebuilds"] == 1
+
+
+def test_instrumented_tree_behaves_like_plain_tree():
+    rng = random.Random(2)
+    plain, counted = AVLTree(), AVLTree(instrument=True)
+
+    for step in range(2000):
+        key = rng.randint(0, 200)
+        if rng.random() < 0.6:
+            assert plain.insert(key, step) == counted.insert(key, step)
+        else:
+            assert plain.delete(key) == counted.delete(key)
+
+    assert list(plain.items()) == list(counted.items())
+    for key in range(201):
+        expected = plain.search(key)
+        found = counted.search(key)
+        assert (found.key if found else None) == (expected.key if expected else None)
+
+    stats = counted.stats()
+    assert stats["rotations"] > 0 and stats["successor_searches"] > 0
+    assert stats["nodes_visited"] >= stats["comparisons"]
+
+
+def test_stats_toggle_and_bst():
+    bst = BinarySearchTree()
+    with pytest.raises(ValueError):
+        bst.stats()
+
+    bst.enable_stats()
+    for key in [50, 30, 70, 60, 80]:
+        bst.insert(key, key)
+    bst.delete(50)
+
+    stats = bst.stats()
+    assert (stats["inserts"], stats["deletes"], stats["successor_searches"]) == (5, 1, 1)
+    assert stats["rotations"] == 0
+
+    bst.disable_stats()
+    with pytest.raises(ValueError):
+        bst.reset_stats()
+
+
+class CountingKey:
+    # chave que conta quantas comparações a árvore faz de verdade
+    calls = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def _compare(self, other, op):
+        CountingKey.calls += 1
+        return op(self.value, other.value)
+
+    def __lt__(self, other):
+        return self._compare(other, lambda a, b: a < b)
+
+    def __gt__(self, other):
+        return self._compare(other, lambda a, b: a > b)
+
+    def __eq__(self, other):
+        return self._compare(other, lambda a, b: a == b)
+
+    def __ne__(self, other):
+        return self._compare(other, lambda a, b: a != b)
+
+    __hash__ = object.__hash__
+
+
+@pytest.mark.parametrize("tree_cls", [AVLTree, BinarySearchTree])
+def test_instrumentation_does_not_walk_the_tree_twice(tree_cls):
+    rng = random.Random(5)
+    values = rng.sample(range(10_000), 500)
+    removed = rng.sample(values, 200)
+
+    def comparisons(instrument):
+        tree = tree_cls(instrument=instrument)
+        CountingKey.calls = 0
+        for value in values:
+            tree.insert(CountingKey(value), value)
+        for value in removed:
+            tree.delete(CountingKey(value))
+        return CountingKey.calls
+
+    # o contador de comparações faz o mesmo trabalho que a árvore sem contagem
+    assert comparisons(True) <= comparisons(False) * 1.05
+
+
+def test_insert_descent_is_counted():
+    avl = AVLTree(instrument=True)
+    for key in [50, 30, 70, 60, 80]:
+        avl.insert(key, key)
+    avl.reset_stats()
+
+    avl.insert(65, 65)    # 50 -> 70 -> 60, depois rebalanceia
+    assert avl.stats()["nodes_visited"] == 3
+    assert avl.stats()["comparisons"] == 3
+
+    # atualização: mesma descida de uma busca pela chave
+    for key in [30, 65, 80]:
+        avl.reset_stats()
+        avl.search(key)
+        searched = avl.stats()["nodes_visited"]
+        avl.reset_stats()
+        avl.insert(key, key)
+        assert avl.stats()["nodes_visited"] == searched
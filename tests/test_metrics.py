@@ -0,0 +1,167 @@
+import json
+import random
+import urllib.request
+
+import pytest
+
+from src.avl_tree import AVLTree
+from src.bplus_tree import BPlusTree
+from src.bst import BinarySearchTree
+from src.compact_avl import CompactAVLTree
+from src.filters import filter_products
+from src.metrics import LatencyHistogram, MeteredTree, Metrics
+
+
+def _exact_percentile(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, int(q * len(ordered) + 0.5)) - 1]
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(-11, 1.5) for _ in range(20_000)]
+
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = _exact_percentile(values, q)
+        assert abs(histogram.percentile(q) - exact) <= exact * 0.02 + 1e-9
+
+
+def test_histogram_buckets_are_contiguous():
+    # cada valor cai num balde cujo limite superior o cobre
+    for ns in list(range(0, 1000)) + [2 ** k + d for k in range(10, 36) for d in (-1, 0, 1)]:
+        index = LatencyHistogram._index(ns)
+        assert ns <= LatencyHistogram._upper_bound(index)
+        if index:
+            assert ns > LatencyHistogram._upper_bound(index - 1)
+
+
+def test_histogram_overflow_and_empty():
+    histogram = LatencyHistogram(highest=1.0)
+    assert histogram.percentile(0.99) == 0.0
+
+    histogram.record(5.0)
+    histogram.record(0.5)
+    assert histogram.overflows == 1
+    assert histogram.snapshot()["max"] == 5.0
+
+
+def test_histogram_merge():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for i in range(100):
+        a.record(i * 1e-6)
+        b.record((i + 100) * 1e-6)
+
+    a.merge(b)
+    assert a.count == 200
+    assert a.snapshot()["min"] == 0.0
+    assert a.percentile(1.0) == pytest.approx(199e-6, rel=0.02)
+
+
+def test_sampling_counts_every_call_but_times_one_in_n():
+    metrics = Metrics(sample_every=10)
+    for i in range(95):
+        assert metrics.call("search", abs, -i) == i
+
+    snapshot = metrics.to_dict()["search"]
+    assert snapshot["calls"] == 95
+    assert snapshot["count"] == 10  # chamadas 1, 11, ..., 91
+
+
+def test_sample_every_must_be_positive():
+    with pytest.raises(ValueError):
+        Metrics(sample_every=0)
+
+
+@pytest.mark.parametrize("tree_cls", [AVLTree, BinarySearchTree])
+def test_metered_tree_records_each_operation(tree_cls):
+    tree = MeteredTree(tree_cls())
+    keys = list(range(200))
+    random.Random(1).shuffle(keys)
+
+    for key in keys:
+        tree.insert(key, {"id": key, "category": "A", "price": key, "rating": 5})
+    assert tree.search(42).data["id"] == 42
+    assert tree.search(999) is None
+    assert tree.delete(42) is True
+    assert tree.search(42) is None
+
+    found = tree.filter_products(category="A", max_price=10)
+    assert found == filter_products(tree.root, "A", 10)
+    assert len(tree.bfs()) == len(tree.dfs()) == 199
+    assert len(tree.bfs(limit=5)) == 5
+
+    calls = {name: stats["calls"] for name, stats in tree.metrics.to_dict().items()}
+    assert calls == {"insert": 200, "search": 3, "delete": 1, "filter_products": 1, "bfs": 2, "dfs": 1}
+    assert isinstance(tree.tree, tree_cls)
+
+
+@pytest.mark.parametrize("tree_cls", [AVLTree, BinarySearchTree, CompactAVLTree, BPlusTree])
+@pytest.mark.parametrize("stats", [False, True])
+def test_every_engine_returns_the_same_bool(tree_cls, stats):
+    tree = tree_cls()
+    if stats and hasattr(tree, "enable_stats"):
+        tree.enable_stats()
+
+    assert tree.insert(5, "a") is True
+    assert tree.insert(3, "b") is True
+    assert tree.insert(5, "c") is False
+    assert tree.delete(3) is True
+    assert tree.delete(3) is False
+    assert tree.delete(99) is False
+
+    metered = MeteredTree(tree_cls())
+    assert metered.insert(1, "x") is True
+    assert metered.delete(1) is True
+    assert metered.delete(1) is False
+
+
+def test_json_export(tmp_path):
+    metrics = Metrics(sample_every=2)
+    metrics.record("insert", 0.001)
+
+    path = tmp_path / "metrics.json"
+    metrics.write_json(path)
+    data = json.loads(path.read_text())
+
+    assert data["sample_every"] == 2
+    assert data["operations"]["insert"]["count"] == 1
+    assert data["operations"]["insert"]["p99"] == pytest.approx(0.001, rel=0.02)
+
+
+def test_prometheus_export(tmp_path):
+    metrics = Metrics()
+    for i in range(1, 101):
+        metrics.record("search", i * 1e-6)
+
+    text = metrics.to_prometheus()
+    assert "# TYPE product_search_operation_seconds summary" in text
+    assert 'product_search_operation_seconds_count{operation="search"} 100' in text
+    assert 'product_search_operations_total{operation="search"} 100' in text
+
+    p50 = next(line for line in text.splitlines() if 'quantile="0.5"' in line)
+    assert float(p50.split()[-1]) == pytest.approx(50e-6, rel=0.02)
+
+    path = tmp_path / "search.prom"
+    metrics.write_prometheus(path, prefix="loja")
+    assert path.read_text().startswith("# HELP loja_operation_seconds")
+    assert not (tmp_path / "search.prom.tmp").exists()
+
+
+def test_prometheus_http_endpoint():
+    metrics = Metrics()
+    metrics.record("bfs", 0.002)
+
+    server = metrics.serve_prometheus()
+    try:
+        host, port = server.server_address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+        assert 'product_search_operation_seconds_count{operation="bfs"} 1' in body
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,118 @@
+import random
+import threading
+
+from src.persistent_avl import PersistentAVLTree
+
+
+def _check_heights(node):
+    if node is None:
+        return 0
+    left = _check_heights(node.left)
+    right = _check_heights(node.right)
+    assert node.height == 1 + max(left, right)
+    assert abs(right - left) <= 1
+    return node.height
+
+
+def test_persistent_churn_matches_dict():
+    rng = random.Random(17)
+    tree = PersistentAVLTree()
+    reference = {}
+
+    for step in range(4000):
+        key = rng.randint(0, 400)
+        if rng.random() < 0.6:
+            tree.insert(key, step)
+            reference[key] = step
+        else:
+            tree.delete(key)
+            reference.pop(key, None)
+
+    _check_heights(tree.root)
+    assert tree.is_balanced()
+    assert len(tree) == len(reference)
+    assert list(tree.items()) == sorted(reference.items())
+    assert [n.data if n else None for n in tree.search_many(range(401))] == [
+        reference.get(key) for key in range(401)
+    ]
+
+
+def test_ordered_insertion_stays_logarithmic():
+    tree = PersistentAVLTree()
+    for key in range(2000):
+        tree.insert(key, key)
+
+    assert tree.get_height() <= 1.45 * (2000).bit_length()
+    _check_heights(tree.root)
+
+
+def test_old_versions_are_never_modified():
+    tree = PersistentAVLTree()
+    for key in range(100):
+        tree.insert(key, f"v1-{key}")
+
+    old_root = tree.root
+    frozen = tree.snapshot()
+    iterator = tree.items()
+
+    for key in range(0, 100, 2):
+        tree.delete(key)
+    tree.insert(1, "v2-1")
+    tree.insert(500, "v2-500")
+
+    # a versão anterior continua inteira, inclusive para o iterador aberto
+    assert [k for k, _ in iterator] == list(range(100))
+    assert [k for k, _ in frozen.items()] == list(range(100))
+    assert frozen.search(1).data == "v1-1" and frozen.search(500) is None
+    assert tree.root is not old_root and tree.search(1).data == "v2-1"
+
+    # e a cópia também pode evoluir sem afetar o original
+    frozen.delete(1)
+    assert tree.search(1) is not None and len(frozen) == 99
+
+
+def test_delete_missing_and_empty():
+    tree = PersistentAVLTree()
+    tree.delete(1)
+
+    assert tree.root is None and tree.get_height() == 0 and tree.version == 0
+
+    tree.insert(1, "A")
+    tree.delete(1)
+    assert tree.root is None and len(tree) == 0 and tree.version == 2
+
+
+def test_concurrent_readers_see_consistent_versions():
+    tree = PersistentAVLTree()
+    for key in range(0, 2000, 2):
+        tree.insert(key, key)
+
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        while not done.is_set():
+            snapshot = tree.snapshot()
+            keys = [k for k, _ in snapshot.items()]
+            if keys != sorted(set(keys)) or len(keys) != len(snapshot):
+                errors.append(len(keys))
+
+    def writer(offset):
+        for key in range(offset, 2000, 4):
+            tree.insert(key, key)
+            tree.delete(key - 1)
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    writers = [threading.Thread(target=writer, args=(offset,)) for offset in (1, 3)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert tree.is_balanced()
+    # cada escritor trocou as chaves pares pelas ímpares seguintes
+    assert [k for k, _ in tree.items()] == list(range(1, 2000, 2))
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from src.avl_tree import AVLTree
+from src.bst import BinarySearchTree
+from src.search import search_many
+
+
+def build(tree_class, keys):
+    tree = tree_class()
+    for key in keys:
+        tree.insert(key, f"Data{key}")
+    return tree
+
+
+@pytest.mark.parametrize("tree_class", [BinarySearchTree, AVLTree])
+def test_search_many_matches_search(tree_class):
+    rng = random.Random(3)
+    tree = build(tree_class, rng.sample(range(5000), 1000))
+
+    # inclui chaves ausentes e repetidas, fora de ordem
+    probes = [rng.randint(-100, 5100) for _ in range(700)] + [42, 42, 42]
+
+    assert tree.search_many(probes) == [tree.search(key) for key in probes]
+
+
+@pytest.mark.parametrize("count", [0, 1, 5, 40])
+def test_search_many_keeps_caller_order(count):
+    tree = build(AVLTree, range(100))
+    probes = list(range(count))[::-1]
+
+    nodes = tree.search_many(probes)
+
+    assert [node.key for node in nodes] == probes
+
+
+def test_search_many_on_degenerate_bst():
+    import sys
+
+    n = sys.getrecursionlimit() * 3
+    tree = build(BinarySearchTree, range(n))  # vira uma lista encadeada
+
+    nodes = tree.search_many([n - 1, 0, n, n // 2])
+
+    assert [node.key if node else None for node in nodes] == [n - 1, 0, None, n // 2]
+
+
+def test_search_many_empty_tree_and_generator_input():
+
+    assert search_many(None, [1, 2]) == [None, None]
+    assert AVLTree().search_many(iter([3])) == [None]
+    assert build(AVLTree, [1, 2]).search_many(k for k in (2, 1))[0].key == 2
@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+from src.avl_tree import AVLTree
+from src.server import ProductServer
+
+
+def build_tree():
+    return AVLTree.from_iterable(
+        (key, {"id": key, "category": "Livros" if key % 2 else "Casa",
+               "price": float(key), "rating": 4.0})
+        for key in range(1, 101)
+    )
+
+
+async def call_many(address, requests):
+    # manda todos os pedidos de uma vez e devolve as respostas por id
+    reader, writer = await asyncio.open_connection(*address[:2])
+    for i, request in enumerate(requests):
+        writer.write(json.dumps({"id": i, **request}).encode() + b"\n")
+    await writer.drain()
+
+    responses = {}
+    while len(responses) < len(requests):
+        response = json.loads(await reader.readline())
+        responses[response["id"]] = response
+
+    writer.close()
+    await writer.wait_closed()
+    return [responses[i] for i in range(len(requests))]
+
+
+def run_with_server(scenario, **options):
+    async def main():
+        async with ProductServer(build_tree(), **options) as server:
+            address = await server.start()
+            return await scenario(server, address)
+
+    return asyncio.run(main())
+
+
+def test_concurrent_searches_are_batched():
+
+    async def scenario(server, address):
+        return await call_many(address, [{"op": "search", "key": key} for key in range(95, 105)]), server.stats()
+
+    responses, stats = run_with_server(scenario, batch_window=0.005)
+
+    assert [r["result"]["id"] if r["result"] else None for r in responses] == \
+        [95, 96, 97, 98, 99, 100, None, None, None, None]
+    assert stats["batched_keys"] == 10
+    assert stats["batches"] < 10
+
+
+def test_queries_and_serialized_writes():
+
+    async def scenario(server, address):
+        first = await call_many(address, [
+            {"op": "filter", "category": "Livros", "max_price": 10},
+            {"op": "range", "lo": 10, "hi": 50, "limit": 3},
+            {"op": "range", "reverse": True, "limit": 2},
+            {"op": "search_many", "keys": [3, 500]},
+            {"op": "insert", "key": 500, "data": {"id": 500}},
+            {"op": "insert", "key": 3, "data": {"id": 3, "price": 1.0}},
+            {"op": "delete", "key": 4},
+            {"op": "delete", "key": 4},
+        ])
+        second = await call_many(address, [
+            {"op": "search", "key": 500},
+            {"op": "search", "key": 4},
+            {"op": "search", "key": 3},
+        ])
+        return first, second
+
+    (filtered, scan, reverse_scan, many, *writes), after = run_with_server(scenario, batch_window=None)
+
+    assert sorted(p["id"] for p in filtered["result"]) == [1, 3, 5, 7, 9]
+    assert [key for key, _ in scan["result"]] == [10, 11, 12]
+    assert [key for key, _ in reverse_scan["result"]] == [100, 99]
+    assert many["result"][0]["id"] == 3 and many["result"][1] is None
+    assert [w["result"] for w in writes] == [
+        {"inserted": True}, {"inserted": False}, {"deleted": True}, {"deleted": False},
+    ]
+    assert after[0]["result"] == {"id": 500}
+    assert after[1]["result"] is None
+    assert after[2]["result"]["price"] == 1.0
+
+
+def test_bad_requests_get_error_responses():
+
+    async def scenario(server, address):
+        reader, writer = await asyncio.open_connection(*address[:2])
+        writer.write(b"not json\n")
+        writer.write(json.dumps({"id": 1, "op": "drop_table"}).encode() + b"\n")
+        writer.write(json.dumps({"id": 2, "op": "search"}).encode() + b"\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+        return responses
+
+    responses = run_with_server(scenario)
+
+    assert all(not r["ok"] for r in responses)
+    assert {r["id"] for r in responses} == {None, 1, 2}
+
+
+def test_bad_search_key_does_not_stall_the_batcher():
+
+    async def scenario(server, address):
+        # chaves ruins no mesmo lote que chaves válidas, e depois um lote só válido
+        mixed = await asyncio.wait_for(call_many(address, [
+            {"op": "search", "key": "abc"},
+            {"op": "search", "key": 5},
+            {"op": "search", "key": None},
+            {"op": "search", "key": 500},
+        ]), timeout=5)
+        later = await asyncio.wait_for(call_many(address, [{"op": "search", "key": 7}]), timeout=5)
+        return mixed, later
+
+    mixed, later = run_with_server(scenario, batch_window=0.005)
+
+    assert [r["ok"] for r in mixed] == [False, True, False, True]
+    assert "TypeError" in mixed[0]["error"]
+    assert mixed[1]["result"]["id"] == 5
+    assert mixed[3]["result"] is None
+    assert later[0]["ok"] and later[0]["result"]["id"] == 7
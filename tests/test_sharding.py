@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from src.avl_tree import AVLTree
+from src.filters import filter_products
+from src.sharding import ShardedProductStore
+
+
+def build_products(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        (key, {"id": key, "category": rng.choice(["Casa", "Livros", "Roupas"]),
+               "price": float(rng.randint(5, 500)), "rating": rng.randint(10, 50) / 10})
+        for key in rng.sample(range(10 * n), n)
+    ]
+
+
+@pytest.fixture
+def store():
+    with ShardedProductStore.from_products(build_products(600), shards=3) as store:
+        yield store
+
+
+def test_from_products_splits_ranges_evenly(store):
+    assert len(store.bounds) == 2
+    assert len(store) == 600
+    sizes = [store.count(lo, hi) for lo, hi in zip([None] + store.bounds, store.bounds + [None])]
+    assert all(190 <= size <= 210 for size in sizes)
+
+
+def test_routing_matches_single_tree(store):
+    reference = AVLTree.from_iterable(build_products(600))
+    keys = [key for key, _ in reference.items()]
+
+    assert store.search(keys[0]).data == reference.search(keys[0]).data
+    assert store.search(-1) is None
+
+    assert store.insert(-5, {"id": -5, "category": "Casa", "price": 1.0, "rating": 5.0}) is True
+    assert store.delete(keys[300]) is True
+    assert store.delete(keys[300]) is False
+    assert store.search(-5).key == -5 and store.search(keys[300]) is None
+
+    probes = [keys[10], -5, keys[599], 10**9, keys[10]]
+    found = store.search_many(probes)
+    assert [node.key if node else None for node in found] == [keys[10], -5, keys[599], None, keys[10]]
+
+
+def test_scatter_gather_queries(store):
+    reference = AVLTree.from_iterable(build_products(600))
+    everything = list(reference.items())
+
+    assert store.items() == everything
+    assert store.items(lo=1000, hi=4000) == list(reference.items(1000, 4000))
+    assert store.count(1000, 4000) == len(list(reference.items(1000, 4000)))
+
+    expected = filter_products(reference.root, category="Livros", max_price=200)
+    found = store.filter_products(category="Livros", max_price=200)
+    assert sorted(p["id"] for p in found) == sorted(p["id"] for p in expected)
+    assert store.count_matching(category="Livros", max_price=200) == len(expected)
+
+    # resultado vem em faixas crescentes de ID, e limit corta a junção
+    assert store.filter_products(category="Livros", max_price=200, limit=5) == found[:5]
+
+
+def test_batch_mutations_are_routed(store):
+    new = [(key, {"id": key, "category": "Casa", "price": 10.0, "rating": 4.0}) for key in (-3, -2, 60_000)]
+    existing = store.items()[:2]
+
+    assert store.insert_many(new + existing) == (3, 2)
+    assert store.delete_many([-3, -2, 10**9]) == 2
+    assert len(store) == 601
+
+
+def test_shard_errors_are_raised_in_caller(store):
+
+    with pytest.raises(TypeError):
+        store.filter_products(max_price="caro")   # falha dentro dos shards
+    assert len(store) == 600                      # e eles continuam atendendo
+
+
+def test_bounds_must_increase():
+
+    with pytest.raises(ValueError):
+        ShardedProductStore([5, 5])
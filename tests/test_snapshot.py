@@ -0,0 +1,66 @@
+import pytest
+
+from src.avl_tree import AVLTree
+from src.dataset import generate_products
+from src.snapshot import read_snapshot
+
+
+def test_snapshot_roundtrip_products(tmp_path):
+    products = generate_products(500)
+    avl = AVLTree.from_iterable((p["id"], p) for p in products)
+
+    path = tmp_path / "catalog.snap"
+    avl.save(path)
+    loaded = AVLTree.load(path)
+
+    assert list(loaded.items()) == list(avl.items())
+    assert loaded.is_balanced()
+    assert loaded.get_height() == (500).bit_length()
+
+
+def test_snapshot_load_with_track_size(tmp_path):
+    avl = AVLTree()
+    for key in range(100):
+        avl.insert(key, {"id": key, "name": f"Produto {key}", "price": key * 1.5})
+
+    path = tmp_path / "catalog.snap"
+    avl.save(path)
+    loaded = AVLTree.load(path, track_size=True)
+
+    assert loaded.rank(50) == 50
+    assert loaded.search(42).data == {"id": 42, "name": "Produto 42", "price": 63.0}
+
+
+@pytest.mark.parametrize("entries", [
+    [(1, "A"), (2, "B"), (3, "C")],                                  # dados não-dict
+    [(1, {"price": 10}), (2, {"price": 2.5})],                        # coluna int/float misturada
+    [(1, {"a": 1}), (2, {"b": 2})],                                   # campos diferentes
+    [("abc", {"x": 1}), ("abd", {"x": 2})],                          # chaves texto
+    [(2 ** 70, {"x": 1}), (2 ** 71, {"x": 2 ** 65})],                # inteiros grandes
+    [(1, {"name": "Tênis\0X"}), (2, {"name": "Relógio"})],          # texto com separador
+    [(i, {"category": "Eletrônicos" if i % 2 else "Casa"}) for i in range(10)],
+])
+def test_snapshot_roundtrip_edge_cases(tmp_path, entries):
+    avl = AVLTree.from_sorted(entries)
+
+    path = tmp_path / "catalog.snap"
+    avl.save(path)
+
+    assert read_snapshot(path) == entries
+    assert list(AVLTree.load(path).items()) == entries
+
+
+def test_snapshot_empty_tree(tmp_path):
+    path = tmp_path / "empty.snap"
+    AVLTree().save(path)
+
+    loaded = AVLTree.load(path)
+    assert loaded.root is None
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a snapshot at all")
+
+    with pytest.raises(ValueError):
+        AVLTree.load(path)
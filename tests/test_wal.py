@@ -0,0 +1,120 @@
+import os
+
+from src.wal import OP_DELETE, OP_INSERT, DurableStore, WriteAheadLog
+
+
+def product(key, price=10.0):
+    return {"id": key, "name": f"Produto {key}", "price": price}
+
+
+def test_store_recovers_after_reopen(tmp_path):
+    with DurableStore(tmp_path) as store:
+        for key in range(20):
+            store.insert(key, product(key))
+        store.delete(5)
+        store.insert(7, product(7, price=99.0))
+
+    reopened = DurableStore(tmp_path)
+
+    assert reopened.replayed == 22
+    assert reopened.search(5) is None
+    assert reopened.search(7).data["price"] == 99.0
+    assert reopened.tree.is_balanced()
+    reopened.close()
+
+
+def test_store_recovers_without_close(tmp_path):
+    # "queda": o processo some sem close(); com sync_every=1 nada se perde
+    store = DurableStore(tmp_path, sync_every=1)
+    for key in range(10):
+        store.insert(key, product(key))
+    store.delete(3)
+
+    recovered = DurableStore(tmp_path)
+
+    assert [k for k, _ in recovered.tree.items()] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    recovered.close()
+    store.wal.file.close()
+
+
+def test_torn_tail_is_discarded(tmp_path):
+    path = tmp_path / "catalog.wal"
+    wal = WriteAheadLog(str(path), sync_every=1)
+    wal.append(OP_INSERT, 1, product(1))
+    wal.append(OP_DELETE, 1)
+    wal.close()
+
+    # registro cortado no meio da escrita
+    with open(path, "ab") as f:
+        f.write(b"\x40\x00\x00\x00\x12\x34")
+
+    records = list(WriteAheadLog.read_records(str(path)))
+    assert [op for op, _, _ in records] == [OP_INSERT, OP_DELETE]
+
+    # reabrir o log corta o lixo e continua anexando normalmente
+    wal = WriteAheadLog(str(path))
+    assert wal.count == 2
+    wal.append(OP_INSERT, 2, product(2))
+    wal.close()
+    assert [key for _, key, _ in WriteAheadLog.read_records(str(path))] == [1, 1, 2]
+
+
+def test_compaction_keeps_log_bounded(tmp_path):
+    with DurableStore(tmp_path, compact_every=10) as store:
+        for key in range(25):
+            store.insert(key, product(key))
+
+        assert store.wal.count == 5
+        assert os.path.exists(store.snapshot_path)
+
+    reopened = DurableStore(tmp_path)
+
+    assert reopened.replayed == 5
+    assert [k for k, _ in reopened.tree.items()] == list(range(25))
+    reopened.close()
+
+
+def test_replay_over_newer_snapshot_is_idempotent(tmp_path):
+    # queda entre gravar o snapshot e zerar o log: o log é reaplicado à toa
+    store = DurableStore(tmp_path, compact_every=0)
+    for key in range(10):
+        store.insert(key, product(key))
+    store.delete(4)
+    store.flush()
+    store.tree.save(store.snapshot_path)
+    store.close()
+
+    reopened = DurableStore(tmp_path)
+
+    assert reopened.replayed == 11
+    assert [k for k, _ in reopened.tree.items()] == [0, 1, 2, 3, 5, 6, 7, 8, 9]
+    reopened.close()
+
+
+def test_checkpoint_syncs_directory_before_truncating_log(tmp_path, monkeypatch):
+    import src.wal
+
+    events = []
+    real_replace, real_fsync_directory = os.replace, src.wal._fsync_directory
+    real_truncate = WriteAheadLog.truncate
+
+    def replace(src_path, dst_path):
+        events.append("replace")
+        real_replace(src_path, dst_path)
+
+    def fsync_directory(directory):
+        events.append(("fsync_dir", os.fspath(directory)))
+        real_fsync_directory(directory)
+
+    def truncate(wal):
+        events.append("truncate")
+        real_truncate(wal)
+
+    with DurableStore(tmp_path) as store:
+        store.insert(1, product(1))
+        monkeypatch.setattr(src.wal.os, "replace", replace)
+        monkeypatch.setattr(src.wal, "_fsync_directory", fsync_directory)
+        monkeypatch.setattr(WriteAheadLog, "truncate", truncate)
+        store.checkpoint()
+
+    assert events == ["replace", ("fsync_dir", os.fspath(tmp_path)), "truncate"]